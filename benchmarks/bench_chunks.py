@@ -0,0 +1,22 @@
+import pathlib
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse import CSaveFileChunk, SFSaveDeserializer, SFSaveSerializer, open_save_file
+from sat_sav_parse.const import MAX_CHUNK_SIZE
+
+
+@pytest.fixture(scope="module")
+def body_chunk(generated_save: pathlib.Path) -> bytes:
+    with open_save_file(generated_save) as (_, des):
+        return bytes(des.content[:MAX_CHUNK_SIZE])
+
+
+def test_chunk_deflate(bench: Benchmark, body_chunk: bytes):
+    assert bench(lambda: SFSaveSerializer.get(CSaveFileChunk(body_chunk)))
+
+
+def test_chunk_inflate(bench: Benchmark, body_chunk: bytes):
+    record = SFSaveSerializer.get(CSaveFileChunk(body_chunk))
+    assert bench(lambda: SFSaveDeserializer(record).get(CSaveFileChunk)) == body_chunk
@@ -0,0 +1,17 @@
+import pathlib
+import subprocess
+import sys
+
+from benchmarks.conftest import Benchmark
+
+
+def _run(*args: str) -> None:
+    subprocess.run([sys.executable, *args], check=True, capture_output=True)  # noqa: S603
+
+
+def test_import_package(bench: Benchmark):
+    bench(lambda: _run("-c", "import sat_sav_parse"), rounds=3)
+
+
+def test_info_startup(bench: Benchmark, generated_save: pathlib.Path):
+    bench(lambda: _run("-m", "sat_sav_parse", "--disable-logging", "info", str(generated_save), "-j", "-p"), rounds=3)
@@ -0,0 +1,69 @@
+import struct
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse.models.properties import MapProperty
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+
+ELEMENTS = 5_000
+
+
+def build_map_property(key_type: str, value_type: str, elements: list[tuple[bytes, bytes]]) -> bytes:
+    payload = SFSaveSerializer().add_u32(0).add_u32(len(elements)).content
+    payload += b"".join(key + value for key, value in elements)
+    return (
+        SFSaveSerializer()
+        .add_string("mBench")
+        .add_string("MapProperty")
+        .add_u32(len(payload))
+        .add_u32(0)
+        .add_string(key_type)
+        .add_string(value_type)
+        .add_u8(0)
+        .add_raw(payload)
+        .content
+    )
+
+
+def object_key(idx: int) -> bytes:
+    return (
+        SFSaveSerializer()
+        .add_string("Persistent_Level")
+        .add_string(f"Persistent_Level:PersistentLevel.BP_PlayerState_C_{idx}")
+        .content
+    )
+
+
+CASES = {
+    "int->int": lambda n: build_map_property(
+        "IntProperty",
+        "IntProperty",
+        [(struct.pack("<i", i), struct.pack("<i", i * 3)) for i in range(n)],
+    ),
+    "int->float": lambda n: build_map_property(
+        "IntProperty",
+        "FloatProperty",
+        [(struct.pack("<i", i), struct.pack("<f", i / 7)) for i in range(n)],
+    ),
+    "object->int": lambda n: build_map_property(
+        "ObjectProperty",
+        "IntProperty",
+        [(object_key(i), struct.pack("<i", i)) for i in range(n)],
+    ),
+    "str->str": lambda n: build_map_property(
+        "StrProperty",
+        "StrProperty",
+        [
+            (SFSaveSerializer().add_string(f"key{i}").content, SFSaveSerializer().add_string(f"v{i}").content)
+            for i in range(n)
+        ],
+    ),
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_map_property(bench: Benchmark, case: str):
+    content = CASES[case](ELEMENTS)
+    prop = bench(lambda: SFSaveDeserializer(content).get(MapProperty))
+    assert len(prop.payload) == ELEMENTS
@@ -0,0 +1,53 @@
+import pytest
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse import (
+    ActorHeader,
+    ComponentHeader,
+    ObjectHeaderType,
+    Quaternion,
+    SFSaveDeserializer,
+    SFSaveSerializer,
+    Vector3,
+)
+from sat_sav_parse.models import deserialize_object_header, serialize_object_header
+
+COUNT = 2_000
+
+HEADERS = [
+    pytest.param(
+        ActorHeader(
+            type_path="/Game/FactoryGame/Buildable/Factory/ConstructorMk1/Build_ConstructorMk1.Build_ConstructorMk1_C",
+            root_object="Persistent_Level",
+            instance_name="Persistent_Level:PersistentLevel.Build_ConstructorMk1_C_2147483647",
+            unknown=0,
+            need_transform=True,
+            rotation=Quaternion(x=0, y=0, z=0.5, w=0.5),
+            position=Vector3(x=-123456.5, y=234567.25, z=1200),
+            scale=Vector3(x=1, y=1, z=1),
+            was_placed_in_level=False,
+        ),
+        id="actor",
+    ),
+    pytest.param(
+        ComponentHeader(
+            type_path="/Script/FactoryGame.FGFactoryConnectionComponent",
+            root_object="Persistent_Level",
+            instance_name="Persistent_Level:PersistentLevel.Build_ConstructorMk1_C_2147483647.Input0",
+            unknown=0,
+            parent_actor_name="Persistent_Level:PersistentLevel.Build_ConstructorMk1_C_2147483647",
+        ),
+        id="component",
+    ),
+]
+
+
+@pytest.mark.parametrize("header", HEADERS)
+def test_deserialize_object_header(bench: Benchmark, header: ObjectHeaderType):
+    content = SFSaveSerializer.get_fn(serialize_object_header, header) * COUNT
+
+    def _read() -> list[ObjectHeaderType]:
+        des = SFSaveDeserializer(content)
+        return [des.get_fn(deserialize_object_header) for _ in range(COUNT)]
+
+    assert bench(_read)[-1] == header
@@ -0,0 +1,9 @@
+import pathlib
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse import parse_save_file
+
+
+def test_parse_save_file(bench: Benchmark, generated_save: pathlib.Path):
+    _, body = bench(lambda: parse_save_file(generated_save), rounds=3)
+    assert len(body.persistent_level.objects) == 800
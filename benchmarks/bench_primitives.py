@@ -0,0 +1,36 @@
+import pytest
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse import SFSaveDeserializer, SFSaveSerializer
+
+COUNT = 10_000
+
+
+def test_get_u32(bench: Benchmark):
+    content = b"".join(i.to_bytes(4, "little") for i in range(COUNT))
+
+    def _read() -> int:
+        des = SFSaveDeserializer(content)
+        return sum(des.get_u32() for _ in range(COUNT))
+
+    assert bench(_read) == sum(range(COUNT))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param("Persistent_Level:PersistentLevel.Build_ConveyorBeltMk1_C_2147483647", id="utf8"),
+        pytest.param("Persistent_Level:PersistentLevel.Прокачанный_конвейер_2147483647", id="utf16"),
+    ],
+)
+def test_get_string(bench: Benchmark, value: str):
+    ser = SFSaveSerializer()
+    for _ in range(COUNT):
+        ser.add_string(value)
+    content = ser.content
+
+    def _read() -> list[str]:
+        des = SFSaveDeserializer(content)
+        return [des.get_string() for _ in range(COUNT)]
+
+    assert bench(_read)[-1] == value
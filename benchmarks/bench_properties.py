@@ -0,0 +1,39 @@
+import pytest
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse import GeneratedPropertyKind, SaveGeneratorConfig, generate_properties
+from sat_sav_parse.models import deserialize_properties, serialize_properties
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+
+PROPERTY_COUNT = 2_000
+
+MIXES = {
+    "default": None,
+    "scalars": {
+        GeneratedPropertyKind.INT: 4,
+        GeneratedPropertyKind.FLOAT: 4,
+        GeneratedPropertyKind.BOOL: 2,
+        GeneratedPropertyKind.INT64: 1,
+        GeneratedPropertyKind.DOUBLE: 1,
+    },
+    "strings": {
+        GeneratedPropertyKind.STR: 1,
+        GeneratedPropertyKind.NAME: 1,
+        GeneratedPropertyKind.ENUM: 1,
+        GeneratedPropertyKind.TEXT: 1,
+    },
+    "references": {GeneratedPropertyKind.OBJECT: 2, GeneratedPropertyKind.OBJECT_ARRAY: 1},
+    "containers": {GeneratedPropertyKind.ARRAY: 1, GeneratedPropertyKind.MAP: 1, GeneratedPropertyKind.SET: 1},
+    "structs": {GeneratedPropertyKind.STRUCT: 1},
+}
+
+
+@pytest.mark.parametrize("mix", MIXES)
+def test_deserialize_properties(bench: Benchmark, mix: str):
+    config = SaveGeneratorConfig(properties_per_object=PROPERTY_COUNT)
+    if MIXES[mix] is not None:
+        config = config.model_copy(update={"property_mix": MIXES[mix]})
+    properties = generate_properties(config)
+    content = SFSaveSerializer.get_fn(serialize_properties, properties)
+
+    assert len(bench(lambda: SFSaveDeserializer(content).get_fn(deserialize_properties))) == PROPERTY_COUNT
@@ -0,0 +1,33 @@
+import pytest
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse.models import ComponentHeader, ComponentObject, HeaderType
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+
+TRAILING_SIZE = 4 * 1024 * 1024
+
+HEADER = ComponentHeader(
+    type=HeaderType.COMPONENT,
+    type_path="/Script/FactoryGame.FGInventoryComponent",
+    root_object="Persistent_Level",
+    instance_name="Persistent_Level:PersistentLevel.Char_Player_C_0.inventory",
+    unknown=0,
+    parent_actor_name="Persistent_Level:PersistentLevel.Char_Player_C_0",
+)
+
+
+@pytest.fixture(scope="module")
+def component_object() -> bytes:
+    trailing = bytes(range(256)) * (TRAILING_SIZE // 256)
+    body = SFSaveSerializer().add_string("None").add_u32(0).add_raw(trailing).content
+    return SFSaveSerializer().add_u32(52).add_u32(0).add_u32(len(body)).add_raw(body).content
+
+
+def test_raw_bytes_decode(bench: Benchmark, component_object: bytes):
+    obj = bench(lambda: ComponentObject.deserialize_with_header(SFSaveDeserializer(component_object), HEADER))
+    assert len(obj.trailing) == TRAILING_SIZE
+
+
+def test_raw_bytes_dump(bench: Benchmark, component_object: bytes):
+    obj = ComponentObject.deserialize_with_header(SFSaveDeserializer(component_object), HEADER)
+    assert bench(obj.model_dump_json)
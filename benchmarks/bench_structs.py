@@ -0,0 +1,74 @@
+import pytest
+
+from benchmarks.conftest import Benchmark
+from sat_sav_parse import (
+    Box,
+    ClientIdentityInfo,
+    ClientIdentityInfoIdentity,
+    ClientIdentityInfoIdentityVariant,
+    DateTime,
+    FluidBox,
+    IntProperty,
+    InventoryItem,
+    LinearColor,
+    ObjectReference,
+    Quat,
+    RailroadTrackPosition,
+    SFSaveDeserializer,
+    SFSaveSerializer,
+    SpawnData,
+    StructProperty,
+    StructTypeName,
+    Vector,
+)
+from sat_sav_parse.models.properties.typed_data import serialize_struct_value
+
+COUNT = 1_000
+
+REFERENCE = ObjectReference(level_name="Persistent_Level", path_name="Persistent_Level:PersistentLevel.Track_0")
+ITEM_PROPERTIES = [IntProperty(name="mAmount", payload_size=4, index=0, payload=100)]
+
+STRUCTS = {
+    StructTypeName.LINEAR_COLOR: LinearColor(r=0.5, g=0.25, b=0.125, a=1),
+    StructTypeName.VECTOR: Vector(x=1.5, y=-2.5, z=3.5),
+    StructTypeName.SPAWN_DATA: SpawnData(
+        name="mSpawnData",
+        type="ObjectProperty",
+        size=len(SFSaveSerializer.get(REFERENCE)),
+        level_path=REFERENCE,
+        properties=ITEM_PROPERTIES,
+    ),
+    StructTypeName.QUAT: Quat(x=0, y=0, z=0.7071, w=0.7071),
+    StructTypeName.BOX: Box(min_x=-1, min_y=-1, min_z=-1, max_x=1, max_y=1, max_z=1, is_valid=True),
+    StructTypeName.INVENTORY_ITEM: InventoryItem(
+        name="/Game/FactoryGame/Resource/Parts/IronPlate/Desc_IronPlate.Desc_IronPlate_C",
+        has_properties=True,
+        type="/Script/FactoryGame.FGInventoryItemState",
+        properties_size=None,
+        properties=ITEM_PROPERTIES,
+    ),
+    StructTypeName.FLUID_BOX: FluidBox(value=0.5),
+    StructTypeName.RAILROAD_TRACK_POSITION: RailroadTrackPosition(object_reference=REFERENCE, offset=12.5, forward=1),
+    StructTypeName.DATE_TIME: DateTime(value=638000000000000000),
+    StructTypeName.CLIENT_IDENTITY_INFO: ClientIdentityInfo(
+        uuid="0123456789abcdef0123456789abcdef",
+        identities=[ClientIdentityInfoIdentity(variant=ClientIdentityInfoIdentityVariant.STEAM, payload=bytes(8))],
+    ),
+    StructTypeName.GUID: bytes(range(16)),
+    # any struct type without its own model is decoded as a property list
+    StructTypeName.INVENTORY_STACK: ITEM_PROPERTIES,
+}
+
+
+@pytest.mark.parametrize("struct_type", STRUCTS)
+def test_deserialize_struct(bench: Benchmark, struct_type: StructTypeName):
+    value = STRUCTS[struct_type]
+    payload_size = len(SFSaveSerializer.get_fn(serialize_struct_value, value))
+    prop = StructProperty(name="mValue", payload_size=payload_size, index=0, type=struct_type, payload=value)
+    content = SFSaveSerializer.get(prop) * COUNT
+
+    def _read() -> list[StructProperty]:
+        des = SFSaveDeserializer(content)
+        return [des.get(StructProperty) for _ in range(COUNT)]
+
+    assert bench(_read)[-1].type == struct_type
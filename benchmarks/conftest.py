@@ -0,0 +1,126 @@
+import collections.abc
+import gc
+import json
+import os
+import pathlib
+import struct
+import time
+import typing
+import zlib
+
+import pytest
+
+from sat_sav_parse import SaveGeneratorConfig, generate_save
+
+BASELINES_PATH = pathlib.Path(__file__).with_name("baselines.json")
+# each timed round repeats the benchmarked call until it takes at least this long
+MIN_ROUND_TIME = 0.05
+CALIBRATION_DATA = bytes(range(256)) * 256
+
+results_key = pytest.StashKey[dict[str, float]]()
+baselines_key = pytest.StashKey[dict[str, float]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-save", action="store_true", help="Store the measured times as the new baselines")
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=float(os.getenv("SF_BENCH_THRESHOLD", "2.0")),
+        help="Fail a benchmark that is this many times slower than its baseline (env SF_BENCH_THRESHOLD)",
+    )
+    group.addoption("--bench-rounds", type=int, default=5, help="Timed rounds per benchmark; the best one counts")
+    group.addoption("--bench-baselines", type=pathlib.Path, default=BASELINES_PATH, help="Path to the baselines file")
+
+
+def _time_round(fn: collections.abc.Callable[[], typing.Any], number: int) -> float:
+    # garbage collection is paused while timing, as timeit does, so collections triggered by
+    # earlier benchmarks do not land in this one
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _best_time(fn: collections.abc.Callable[[], typing.Any], rounds: int) -> float:
+    number = 1
+    while (elapsed := _time_round(fn, number)) < MIN_ROUND_TIME:
+        number *= 2
+    return min([elapsed, *(_time_round(fn, number) for _ in range(rounds - 1))]) / number
+
+
+def _calibration_workload() -> int:
+    # Fixed work that does not touch the package, used to scale baselines to this machine. It mixes an
+    # interpreter loop with zlib and struct calls, as the benchmarks mix Python code with C paths.
+    total = sum(len(str(i)) for i in range(20_000))
+    total += len(zlib.compress(CALIBRATION_DATA))
+    total += sum(struct.unpack_from("<i", CALIBRATION_DATA, i)[0] for i in range(0, 16_384, 4))
+    return total
+
+
+class Benchmark:
+    def __init__(self, name: str, config: pytest.Config) -> None:
+        self.name = name
+        self.config = config
+
+    def __call__[T](self, fn: collections.abc.Callable[[], T], *, rounds: int | None = None) -> T:
+        result = fn()
+        rounds = rounds or self.config.getoption("bench_rounds")
+        # the calibration loop is timed right before each benchmark, so both see the same CPU clock
+        # and load, instead of once at the start of a session that can run for a minute
+        calibration = _best_time(_calibration_workload, rounds)
+        best = _best_time(fn, rounds)
+        relative = best / calibration
+        self.config.stash[results_key][self.name] = relative
+
+        baseline = self.config.stash[baselines_key].get(self.name)
+        threshold = self.config.getoption("bench_threshold")
+        if baseline is not None and not self.config.getoption("bench_save") and relative > baseline * threshold:
+            pytest.fail(f"{self.name} is {relative / baseline:.2f}x slower than its baseline (threshold {threshold}x)")
+        return result
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    path: pathlib.Path = config.getoption("bench_baselines")
+    config.stash[baselines_key] = json.loads(path.read_text()) if path.exists() else {}
+    config.stash[results_key] = {}
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Benchmark:
+    return Benchmark(request.node.name, request.config)
+
+
+@pytest.fixture(scope="session")
+def generated_save(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    path = tmp_path_factory.mktemp("saves") / "generated.sav"
+    generate_save(path, SaveGeneratorConfig(seed=1, actors=2_000, sublevels=4))
+    return path
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    results = config.stash[results_key]
+    if not config.getoption("bench_save") or not results:
+        return
+    path: pathlib.Path = config.getoption("bench_baselines")
+    baselines = {**config.stash[baselines_key], **results}
+    path.write_text(json.dumps(dict(sorted(baselines.items())), indent=2) + "\n")
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config) -> None:
+    results = config.stash[results_key]
+    if not results:
+        return
+    baselines = config.stash[baselines_key]
+    terminalreporter.section("benchmarks (time relative to the calibration loop)")
+    for name, relative in sorted(results.items()):
+        baseline = baselines.get(name)
+        change = f"{relative / baseline:6.2f}x baseline" if baseline else "no baseline"
+        terminalreporter.write_line(f"{name:<60} {relative:12.4f}  {change}")
@@ -1,5 +1,8 @@
+import functools
 import pathlib
+import typing
 
+from sat_sav_parse.lazy import lazy_exports
 from sat_sav_parse.logger import (
     ContextFilter,
     disable_logging_hell,
@@ -8,106 +11,159 @@ from sat_sav_parse.logger import (
     prepare_logging_hell,
 )
 
-from .exceptions import ParseError
-from .models import (
-    ActorHeader,
-    ActorObject,
-    ArrayElementByte,
-    ArrayElementEnum,
-    ArrayElementFloat,
-    ArrayElementInt,
-    ArrayElementInt64,
-    ArrayElementInterface,
-    ArrayElementObject,
-    ArrayElementSoftObject,
-    ArrayElementStr,
-    ArrayElementStruct,
-    ArrayElementStructValueType,
-    ArrayElementType,
-    ArrayElementTypeName,
-    ArrayProperty,
-    BaseArrayElement,
-    BaseProperty,
-    BoolProperty,
-    Box,
-    ByteProperty,
-    ClientIdentityInfo,
-    ClientIdentityInfoIdentity,
-    ClientIdentityInfoIdentityVariant,
-    ComponentHeader,
-    ComponentObject,
-    CSaveFileBody,
-    CSaveFileChunk,
-    DateTime,
-    DoubleProperty,
-    EnumProperty,
-    FloatProperty,
-    FluidBox,
-    GridName,
-    HeaderType,
-    Int8Property,
-    Int64Property,
-    IntProperty,
-    InventoryItem,
-    KeyTypeName,
-    Level,
-    LevelGroupingGrid,
-    LevelInfo,
-    LevelObjectType,
-    LinearColor,
-    MapKeyType,
-    MapKeyValue,
-    MapProperty,
-    NameProperty,
-    ObjectHeaderType,
-    ObjectProperty,
-    ObjectReference,
-    PropertyType,
-    PropertyTypeName,
-    Quat,
-    Quaternion,
-    RailroadTrackPosition,
-    SaveFileBody,
-    SaveFileHeader,
-    SessionVisibility,
-    SetProperty,
-    SetType,
-    SoftObjectProperty,
-    SpawnData,
-    StrProperty,
-    StructProperty,
-    StructTypeName,
-    TextArgument,
-    TextArgumentInt,
-    TextArgumentText,
-    TextArgumentType,
-    TextProperty,
-    TextPropertyHistoryType,
-    TextValue,
-    TextValueBase,
-    TextValueNone,
-    TextValueStringTableEntry,
-    TextValueTransform,
-    TextValueWithArguments,
-    UInt32Property,
-    ValueTypeName,
-    Vector,
-    Vector3,
-)
-from .structs import (
-    SFSaveDeserializable,
-    SFSaveDeserializeFn,
-    SFSaveDeserializer,
-    SFSaveSerializable,
-    SFSaveSerializeFn,
-    SFSaveSerializer,
-)
+if typing.TYPE_CHECKING:
+    from .archive import ArchiveChunk, ArchiveManifest, ChunkStore
+    from .batch import (
+        BATCH_OPERATIONS,
+        BatchFileResult,
+        BatchOperation,
+        BatchReport,
+        load_batch_manifest,
+        resolve_batch_paths,
+        run_batch,
+    )
+    from .bench import BENCH_PHASES, BenchPhase, BenchResult, run_bench
+    from .diff import ObjectChange, SaveDiff, diff_save_bodies, diff_saves
+    from .exceptions import ParseError
+    from .generator import (
+        DEFAULT_PROPERTY_MIX,
+        GeneratedPropertyKind,
+        SaveGeneratorConfig,
+        generate_properties,
+        generate_save,
+    )
+    from .grep import GrepHit, GrepMatch, grep_save, iter_body_matches, locate_matches
+    from .index import (
+        ObjectIndex,
+        ObjectKey,
+        ObjectLocation,
+        build_object_index,
+        iter_level_locations,
+        iter_level_objects,
+    )
+    from .models import (
+        ActorHeader,
+        ActorObject,
+        ArrayElementByte,
+        ArrayElementEnum,
+        ArrayElementFloat,
+        ArrayElementInt,
+        ArrayElementInt64,
+        ArrayElementInterface,
+        ArrayElementObject,
+        ArrayElementSoftObject,
+        ArrayElementStr,
+        ArrayElementStruct,
+        ArrayElementStructValueType,
+        ArrayElementType,
+        ArrayElementTypeName,
+        ArrayProperty,
+        BaseArrayElement,
+        BaseProperty,
+        BoolProperty,
+        Box,
+        ByteProperty,
+        ClientIdentityInfo,
+        ClientIdentityInfoIdentity,
+        ClientIdentityInfoIdentityVariant,
+        ComponentHeader,
+        ComponentObject,
+        CSaveFileBody,
+        CSaveFileChunk,
+        CSaveFileChunkInfo,
+        CSaveFileChunkRecord,
+        DateTime,
+        DoubleProperty,
+        EnumProperty,
+        FloatProperty,
+        FluidBox,
+        GridName,
+        HeaderType,
+        Int8Property,
+        Int64Property,
+        IntProperty,
+        InventoryItem,
+        KeyTypeName,
+        Level,
+        LevelGroupingGrid,
+        LevelInfo,
+        LevelObjectType,
+        LinearColor,
+        MapKeyType,
+        MapKeyValue,
+        MapProperty,
+        NameProperty,
+        ObjectCache,
+        ObjectHeaderType,
+        ObjectProperty,
+        ObjectReference,
+        PropertyTag,
+        PropertyType,
+        PropertyTypeName,
+        Quat,
+        Quaternion,
+        RailroadTrackPosition,
+        SaveFileBody,
+        SaveFileHeader,
+        SessionVisibility,
+        SetProperty,
+        SetType,
+        SoftObjectProperty,
+        SpawnData,
+        StreamedLevel,
+        StrProperty,
+        StructProperty,
+        StructTypeName,
+        TextArgument,
+        TextArgumentInt,
+        TextArgumentText,
+        TextArgumentType,
+        TextProperty,
+        TextPropertyHistoryType,
+        TextValue,
+        TextValueBase,
+        TextValueNone,
+        TextValueStringTableEntry,
+        TextValueTransform,
+        TextValueWithArguments,
+        UInt32Property,
+        ValueTypeName,
+        Vector,
+        Vector3,
+        chunk_digest,
+        iter_property_tags,
+        read_property_tag,
+        save_file_body_from_fields,
+        write_level,
+        write_save_file_body,
+    )
+    from .patch import BodyPatch, patch_save_body, position_patch, property_patch
+    from .profiler import Profiler, ProfileStat, get_active_profiler
+    from .query import SelectedObject, select, select_objects
+    from .reader import SaveHeaderScan, open_save_file, read_save_header, scan_save_headers
+    from .server import SaveCache, SaveServer, SaveServerClient, SaveServerError
+    from .snapshot import SaveSnapshot, SnapshotLevel, load_snapshot, snapshot_path, write_snapshot
+    from .stats import LevelStats, SaveStats, TypeStats, compute_save_stats, read_save_stats
+    from .structs import (
+        SFSaveDeserializable,
+        SFSaveDeserializeFn,
+        SFSaveDeserializer,
+        SFSaveSerializable,
+        SFSaveSerializeFn,
+        SFSaveSerializer,
+    )
+    from .writer import update_save_header, write_save_file
 
 __all__ = (
+    "BATCH_OPERATIONS",
+    "BENCH_PHASES",
+    "DEFAULT_PROPERTY_MIX",
     "ActorHeader",
     "ActorHeader",
     "ActorObject",
     "ActorObject",
+    "ArchiveChunk",
+    "ArchiveManifest",
     "ArrayElementByte",
     "ArrayElementEnum",
     "ArrayElementFloat",
@@ -124,6 +180,12 @@ __all__ = (
     "ArrayProperty",
     "BaseArrayElement",
     "BaseProperty",
+    "BatchFileResult",
+    "BatchOperation",
+    "BatchReport",
+    "BenchPhase",
+    "BenchResult",
+    "BodyPatch",
     "BoolProperty",
     "Box",
     "ByteProperty",
@@ -131,6 +193,9 @@ __all__ = (
     "CSaveFileBody",
     "CSaveFileChunk",
     "CSaveFileChunk",
+    "CSaveFileChunkInfo",
+    "CSaveFileChunkRecord",
+    "ChunkStore",
     "ClientIdentityInfo",
     "ClientIdentityInfoIdentity",
     "ClientIdentityInfoIdentityVariant",
@@ -144,6 +209,9 @@ __all__ = (
     "EnumProperty",
     "FloatProperty",
     "FluidBox",
+    "GeneratedPropertyKind",
+    "GrepHit",
+    "GrepMatch",
     "GridName",
     "GridName",
     "HeaderType",
@@ -160,16 +228,25 @@ __all__ = (
     "LevelInfo",
     "LevelObjectType",
     "LevelObjectType",
+    "LevelStats",
     "LinearColor",
     "MapKeyType",
     "MapKeyValue",
     "MapProperty",
     "NameProperty",
+    "ObjectCache",
+    "ObjectChange",
     "ObjectHeaderType",
     "ObjectHeaderType",
+    "ObjectIndex",
+    "ObjectKey",
+    "ObjectLocation",
     "ObjectProperty",
     "ObjectReference",
     "ParseError",
+    "ProfileStat",
+    "Profiler",
+    "PropertyTag",
     "PropertyType",
     "PropertyTypeName",
     "Quat",
@@ -182,17 +259,29 @@ __all__ = (
     "SFSaveSerializable",
     "SFSaveSerializeFn",
     "SFSaveSerializer",
+    "SaveCache",
+    "SaveDiff",
     "SaveFileBody",
     "SaveFileBody",
     "SaveFileHeader",
     "SaveFileHeader",
+    "SaveGeneratorConfig",
+    "SaveHeaderScan",
+    "SaveServer",
+    "SaveServerClient",
+    "SaveServerError",
+    "SaveSnapshot",
+    "SaveStats",
+    "SelectedObject",
     "SessionVisibility",
     "SessionVisibility",
     "SetProperty",
     "SetType",
+    "SnapshotLevel",
     "SoftObjectProperty",
     "SpawnData",
     "StrProperty",
+    "StreamedLevel",
     "StructProperty",
     "StructTypeName",
     "TextArgument",
@@ -207,25 +296,291 @@ __all__ = (
     "TextValueStringTableEntry",
     "TextValueTransform",
     "TextValueWithArguments",
+    "TypeStats",
     "UInt32Property",
     "ValueTypeName",
     "Vector",
     "Vector3",
     "Vector3",
+    "build_object_index",
+    "chunk_digest",
+    "compute_save_stats",
+    "diff_save_bodies",
+    "diff_saves",
     "disable_logging_hell",
     "enable_logging_hell",
+    "generate_properties",
+    "generate_save",
+    "get_active_profiler",
+    "grep_save",
+    "iter_body_matches",
+    "iter_level_locations",
+    "iter_level_objects",
+    "iter_property_tags",
+    "load_batch_manifest",
+    "load_snapshot",
+    "locate_matches",
     "logging_with_context",
+    "open_save_file",
     "parse_save_file",
+    "patch_save_body",
+    "position_patch",
     "prepare_logging_hell",
+    "property_patch",
+    "read_property_tag",
+    "read_save_header",
+    "read_save_stats",
+    "resolve_batch_paths",
+    "run_batch",
+    "run_bench",
+    "save_file_body_from_fields",
+    "scan_save_headers",
+    "select",
+    "select_objects",
+    "snapshot_path",
+    "update_save_header",
+    "write_level",
+    "write_save_file",
+    "write_save_file_body",
+    "write_snapshot",
 )
 
+# submodule -> names it provides, imported on first access; keep in sync with the imports above
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".archive": (
+        "ArchiveChunk",
+        "ArchiveManifest",
+        "ChunkStore",
+    ),
+    ".batch": (
+        "BATCH_OPERATIONS",
+        "BatchFileResult",
+        "BatchOperation",
+        "BatchReport",
+        "load_batch_manifest",
+        "resolve_batch_paths",
+        "run_batch",
+    ),
+    ".bench": (
+        "BENCH_PHASES",
+        "BenchPhase",
+        "BenchResult",
+        "run_bench",
+    ),
+    ".diff": (
+        "ObjectChange",
+        "SaveDiff",
+        "diff_save_bodies",
+        "diff_saves",
+    ),
+    ".exceptions": ("ParseError",),
+    ".generator": (
+        "DEFAULT_PROPERTY_MIX",
+        "GeneratedPropertyKind",
+        "SaveGeneratorConfig",
+        "generate_properties",
+        "generate_save",
+    ),
+    ".grep": (
+        "GrepHit",
+        "GrepMatch",
+        "grep_save",
+        "iter_body_matches",
+        "locate_matches",
+    ),
+    ".index": (
+        "ObjectIndex",
+        "ObjectKey",
+        "ObjectLocation",
+        "build_object_index",
+        "iter_level_locations",
+        "iter_level_objects",
+    ),
+    ".models": (
+        "ActorHeader",
+        "ActorObject",
+        "ArrayElementByte",
+        "ArrayElementEnum",
+        "ArrayElementFloat",
+        "ArrayElementInt",
+        "ArrayElementInt64",
+        "ArrayElementInterface",
+        "ArrayElementObject",
+        "ArrayElementSoftObject",
+        "ArrayElementStr",
+        "ArrayElementStruct",
+        "ArrayElementStructValueType",
+        "ArrayElementType",
+        "ArrayElementTypeName",
+        "ArrayProperty",
+        "BaseArrayElement",
+        "BaseProperty",
+        "BoolProperty",
+        "Box",
+        "ByteProperty",
+        "ClientIdentityInfo",
+        "ClientIdentityInfoIdentity",
+        "ClientIdentityInfoIdentityVariant",
+        "ComponentHeader",
+        "ComponentObject",
+        "CSaveFileBody",
+        "CSaveFileChunk",
+        "CSaveFileChunkInfo",
+        "CSaveFileChunkRecord",
+        "DateTime",
+        "DoubleProperty",
+        "EnumProperty",
+        "FloatProperty",
+        "FluidBox",
+        "GridName",
+        "HeaderType",
+        "Int8Property",
+        "Int64Property",
+        "IntProperty",
+        "InventoryItem",
+        "KeyTypeName",
+        "Level",
+        "LevelGroupingGrid",
+        "LevelInfo",
+        "LevelObjectType",
+        "LinearColor",
+        "MapKeyType",
+        "MapKeyValue",
+        "MapProperty",
+        "NameProperty",
+        "ObjectCache",
+        "ObjectHeaderType",
+        "ObjectProperty",
+        "ObjectReference",
+        "PropertyTag",
+        "PropertyType",
+        "PropertyTypeName",
+        "Quat",
+        "Quaternion",
+        "RailroadTrackPosition",
+        "SaveFileBody",
+        "SaveFileHeader",
+        "SessionVisibility",
+        "SetProperty",
+        "SetType",
+        "SoftObjectProperty",
+        "SpawnData",
+        "StrProperty",
+        "StreamedLevel",
+        "StructProperty",
+        "StructTypeName",
+        "TextArgument",
+        "TextArgumentInt",
+        "TextArgumentText",
+        "TextArgumentType",
+        "TextProperty",
+        "TextPropertyHistoryType",
+        "TextValue",
+        "TextValueBase",
+        "TextValueNone",
+        "TextValueStringTableEntry",
+        "TextValueTransform",
+        "TextValueWithArguments",
+        "UInt32Property",
+        "ValueTypeName",
+        "Vector",
+        "Vector3",
+        "chunk_digest",
+        "iter_property_tags",
+        "read_property_tag",
+        "save_file_body_from_fields",
+        "write_level",
+        "write_save_file_body",
+    ),
+    ".patch": (
+        "BodyPatch",
+        "patch_save_body",
+        "position_patch",
+        "property_patch",
+    ),
+    ".profiler": (
+        "Profiler",
+        "ProfileStat",
+        "get_active_profiler",
+    ),
+    ".query": (
+        "SelectedObject",
+        "select",
+        "select_objects",
+    ),
+    ".reader": (
+        "SaveHeaderScan",
+        "open_save_file",
+        "read_save_header",
+        "scan_save_headers",
+    ),
+    ".server": (
+        "SaveCache",
+        "SaveServer",
+        "SaveServerClient",
+        "SaveServerError",
+    ),
+    ".snapshot": (
+        "SaveSnapshot",
+        "SnapshotLevel",
+        "load_snapshot",
+        "snapshot_path",
+        "write_snapshot",
+    ),
+    ".stats": (
+        "LevelStats",
+        "SaveStats",
+        "TypeStats",
+        "compute_save_stats",
+        "read_save_stats",
+    ),
+    ".structs": (
+        "SFSaveDeserializable",
+        "SFSaveDeserializeFn",
+        "SFSaveDeserializer",
+        "SFSaveSerializable",
+        "SFSaveSerializeFn",
+        "SFSaveSerializer",
+    ),
+    ".writer": (
+        "update_save_header",
+        "write_save_file",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
 prepare_logging_hell()
 
 
-def parse_save_file(file_path: pathlib.Path) -> tuple[SaveFileHeader, SaveFileBody]:
+def parse_save_file(
+    file_path: pathlib.Path,
+    *,
+    snapshot: bool = False,
+    object_cache: "ObjectCache | None" = None,
+) -> "tuple[SaveFileHeader, SaveFileBody]":
+    from .models import CSaveFileBody, SaveFileBody, SaveFileHeader, save_file_body_from_fields  # noqa: PLC0415
+    from .models.level import iter_level  # noqa: PLC0415
+    from .models.save_file_body import iter_save_file_body  # noqa: PLC0415
+    from .reader import read_save_header  # noqa: PLC0415
+    from .snapshot import load_snapshot, snapshot_path, write_snapshot  # noqa: PLC0415
+    from .structs import SFSaveDeserializer  # noqa: PLC0415
+
+    if snapshot:
+        header = read_save_header(file_path)
+        cached = load_snapshot(snapshot_path(file_path))
+        if cached is not None and cached.matches(file_path.stat().st_size, header.checksum):
+            return header, cached.body
     with file_path.open("rb") as f:
         des = SFSaveDeserializer(f.read())
     header = des.get(SaveFileHeader)
     decompressed = des.get(CSaveFileBody)
     dec_des = SFSaveDeserializer(decompressed)
-    return header, dec_des.get(SaveFileBody)
+    if object_cache is not None:
+        level_iter = functools.partial(iter_level, object_fn=object_cache.deserialize)
+        body = save_file_body_from_fields(iter_save_file_body(dec_des, level_iter=level_iter))
+    else:
+        body = dec_des.get(SaveFileBody)
+    if snapshot:
+        write_snapshot(snapshot_path(file_path), len(des.content), header, body)
+    return header, body
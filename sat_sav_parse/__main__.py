@@ -1,24 +1,48 @@
 import argparse
+import functools
 import logging
 import pathlib
 import sys
-
-from rich.logging import RichHandler
-from rich_argparse import RichHelpFormatter
+import typing
 
 from sat_sav_parse import ContextFilter
-from sat_sav_parse.cli.info import info_command
-from sat_sav_parse.cli.to_json import to_json_command
+
+if typing.TYPE_CHECKING:
+    from rich.logging import RichHandler
 
 RICH_FORMAT = "%(name)s%(context)s - %(message)s"
 
-parser = argparse.ArgumentParser(description="Save file CLI", formatter_class=RichHelpFormatter)
+
+def rich_help_formatter(prog: str, **kwargs: typing.Any) -> argparse.HelpFormatter:
+    # rich_argparse is only imported when help or a usage error is printed
+    from rich_argparse import RichHelpFormatter  # noqa: PLC0415
+
+    return RichHelpFormatter(prog, **kwargs)
+
+
+class DeferredRichHandler(logging.Handler):
+    # Builds the RichHandler on the first record, so commands that log nothing never import rich.
+    @functools.cached_property
+    def handler(self) -> "RichHandler":
+        from rich.logging import RichHandler  # noqa: PLC0415
+
+        handler = RichHandler(rich_tracebacks=True, tracebacks_show_locals=True, keywords=["TRACE_BIN"])
+        handler.addFilter(ContextFilter())
+        handler.setFormatter(logging.Formatter(RICH_FORMAT, datefmt="[%X]"))
+        return handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handler.handle(record)
+
+
+parser = argparse.ArgumentParser(description="Save file CLI", formatter_class=rich_help_formatter)
 parser.add_argument("--log-level", type=str, default="INFO", help="Set log level")
 parser.add_argument("--disable-logging", action="store_true", help="Disable logging")
-subparsers = parser.add_subparsers(dest="command", required=True)
+# an explicit prog keeps add_subparsers from formatting (and importing rich for) the usage line
+subparsers = parser.add_subparsers(dest="command", required=True, prog=parser.prog)
 
 parser_info = subparsers.add_parser("info", help="Show save info")
-parser_info.add_argument("filename", type=pathlib.Path, help="Path to the save file")
+parser_info.add_argument("filename", type=pathlib.Path, help="Path to the save file or a directory of saves")
 parser_info.add_argument("--json", "-j", action="store_true", help="Show as JSON")
 parser_info.add_argument("--plain", "-p", action="store_true", help="Disable indent and colors for JSON output")
 
@@ -38,39 +62,180 @@ parser_to_json.add_argument(
     required=False,
     help="Path to output header JSON file; if not set, header saved in {output}.header.json",
 )
+parser_to_json.add_argument(
+    "--stream",
+    "-s",
+    action="store_true",
+    help="Write objects as they are decoded instead of building the whole save in memory",
+)
+parser_to_json.add_argument(
+    "--ndjson",
+    "-n",
+    action="store_true",
+    help="Write one JSON record per line; if --output is not set, saved in {input}.ndjson",
+)
 
+parser_export_sqlite = subparsers.add_parser("export-sqlite", help="Save to SQLite database")
+parser_export_sqlite.add_argument("filename", type=pathlib.Path, help="Path to the save file")
+parser_export_sqlite.add_argument(
+    "--output",
+    "-o",
+    type=pathlib.Path,
+    required=False,
+    help="Path to SQLite database, appended to if it exists; if not set, saved in {input}.sqlite",
+)
 
+parser_diff = subparsers.add_parser("diff", help="Compare two saves")
+parser_diff.add_argument("old", type=pathlib.Path, help="Path to the original save file")
+parser_diff.add_argument("new", type=pathlib.Path, help="Path to the changed save file")
+parser_diff.add_argument("--json", "-j", action="store_true", help="Show as JSON")
+parser_diff.add_argument("--plain", "-p", action="store_true", help="Disable indent and colors for JSON output")
+
+parser_bench = subparsers.add_parser("bench", help="Benchmark parsing and re-serializing a save")
+parser_bench.add_argument("filename", type=pathlib.Path, help="Path to the save file")
+parser_bench.add_argument("--iterations", "-n", type=int, default=3, help="Number of times each phase is run")
+parser_bench.add_argument("--json", "-j", action="store_true", help="Show as JSON")
+parser_bench.add_argument("--plain", "-p", action="store_true", help="Disable indent and colors for JSON output")
+
+parser_profile = subparsers.add_parser("profile", help="Show where parse time goes, per struct type")
+parser_profile.add_argument("filename", type=pathlib.Path, help="Path to the save file")
+parser_profile.add_argument(
+    "--output",
+    "-o",
+    type=pathlib.Path,
+    required=False,
+    help="Path to write collapsed stacks to, for flamegraph.pl, speedscope or inferno",
+)
+parser_profile.add_argument(
+    "--sort",
+    "-s",
+    choices=["self_time", "total_time", "count", "bytes"],
+    default="self_time",
+    help="Column to sort the report by",
+)
+parser_profile.add_argument("--limit", "-l", type=int, default=30, help="Number of struct types to show")
+
+parser_generate = subparsers.add_parser("generate", help="Generate a synthetic save for benchmarks")
+parser_generate.add_argument("output", type=pathlib.Path, help="Path to the save file to write")
+parser_generate.add_argument("--seed", type=int, default=0, help="Random seed; the same seed gives the same save")
+parser_generate.add_argument("--actors", "-a", type=int, default=10_000, help="Number of actors")
+parser_generate.add_argument("--sublevels", type=int, default=4, help="Number of sublevels")
+parser_generate.add_argument("--components", "-c", type=int, default=1, help="Number of components per actor")
+parser_generate.add_argument("--properties", type=int, default=6, help="Number of properties per object")
+parser_generate.add_argument(
+    "--property-mix",
+    type=str,
+    required=False,
+    help="Relative weights of generated property kinds, e.g. int=4,float=2,struct=1",
+)
+parser_generate.add_argument("--array-size", type=int, default=8, help="Element count of array, map and set properties")
+
+parser_batch = subparsers.add_parser("batch", help="Run an operation over many saves in parallel")
+parser_batch.add_argument("source", type=str, help="Directory of saves, or a glob such as 'saves/**/*.sav'")
+parser_batch.add_argument(
+    "operation",
+    choices=["info", "to-json", "stats", "export"],
+    help="Operation to run on every save",
+)
+parser_batch.add_argument(
+    "--output-dir",
+    "-o",
+    type=pathlib.Path,
+    required=False,
+    help="Directory for to-json and export outputs; if not set, written next to each save",
+)
+parser_batch.add_argument(
+    "--manifest",
+    "-m",
+    type=pathlib.Path,
+    required=False,
+    help="Path to the manifest of processed files; saves already completed in it are skipped",
+)
+parser_batch.add_argument("--workers", "-w", type=int, required=False, help="Worker processes; defaults to CPU count")
+parser_batch.add_argument("--json", "-j", action="store_true", help="Show as JSON")
+parser_batch.add_argument("--plain", "-p", action="store_true", help="Disable indent and colors for JSON output")
+
+parser_serve = subparsers.add_parser("serve", help="Serve parsed saves over localhost HTTP, keeping recent ones cached")
+parser_serve.add_argument("--host", type=str, default="127.0.0.1", help="Address to listen on")
+parser_serve.add_argument("--port", type=int, default=8765, help="Port to listen on")
+parser_serve.add_argument(
+    "--root",
+    type=pathlib.Path,
+    required=False,
+    help="Only serve saves inside this directory; requested paths are relative to it",
+)
+parser_serve.add_argument(
+    "--cache-size",
+    type=int,
+    default=1024,
+    help="Cache budget in MiB of estimated parsed-save memory",
+)
+
+parser_stats = subparsers.add_parser("stats", help="Show object counts and sizes without parsing properties")
+parser_stats.add_argument("filename", type=pathlib.Path, help="Path to the save file")
+parser_stats.add_argument("--limit", "-l", type=int, default=30, help="Number of type paths to show")
+parser_stats.add_argument("--json", "-j", action="store_true", help="Show as JSON")
+parser_stats.add_argument("--plain", "-p", action="store_true", help="Disable indent and colors for JSON output")
+
+parser_grep = subparsers.add_parser("grep", help="Search the decompressed body for a string and show matching objects")
+parser_grep.add_argument("filename", type=pathlib.Path, help="Path to the save file")
+parser_grep.add_argument("pattern", type=str, help="String to search for, e.g. an instance name or class")
+parser_grep.add_argument("--regex", "-e", action="store_true", help="Treat the pattern as a regular expression")
+parser_grep.add_argument("--ignore-case", "-i", action="store_true", help="Match case-insensitively")
+parser_grep.add_argument(
+    "--encoding",
+    choices=["utf-8", "utf-16"],
+    action="append",
+    help="Encoding to search; can be repeated, defaults to both",
+)
+parser_grep.add_argument(
+    "--max-match-size",
+    type=int,
+    default=4096,
+    help="Longest regex match, in bytes, found across a chunk boundary",
+)
+parser_grep.add_argument("--json", "-j", action="store_true", help="Show as JSON")
+parser_grep.add_argument("--plain", "-p", action="store_true", help="Disable indent and colors for JSON output")
+
+
+# command modules are imported on dispatch, so a command does not pay for the imports of the others
 COMMANDS = {
-    "info": info_command,
-    "to-json": to_json_command,
+    "info": ("sat_sav_parse.cli.info", "info_command"),
+    "to-json": ("sat_sav_parse.cli.to_json", "to_json_command"),
+    "export-sqlite": ("sat_sav_parse.cli.export_sqlite", "export_sqlite_command"),
+    "diff": ("sat_sav_parse.cli.diff", "diff_command"),
+    "bench": ("sat_sav_parse.cli.bench", "bench_command"),
+    "profile": ("sat_sav_parse.cli.profile", "profile_command"),
+    "generate": ("sat_sav_parse.cli.generate", "generate_command"),
+    "batch": ("sat_sav_parse.cli.batch", "batch_command"),
+    "serve": ("sat_sav_parse.cli.serve", "serve_command"),
+    "stats": ("sat_sav_parse.cli.stats", "stats_command"),
+    "grep": ("sat_sav_parse.cli.grep", "grep_command"),
 }
 
 
 def main():
     args = parser.parse_args()
 
-    command_func = COMMANDS.get(args.command)
-    if command_func is None:
+    command = COMMANDS.get(args.command)
+    if command is None:
         parser.print_help()
         sys.exit(1)
+    module_name, func_name = command
     kwargs = vars(args)
     kwargs.pop("command")
 
+    log_level = kwargs.pop("log_level")
     if kwargs.pop("disable_logging"):
         logging.disable(logging.CRITICAL)
     else:
-        log_level = kwargs.pop("log_level")
-        context_filter = ContextFilter()
-
-        console_handler = RichHandler(rich_tracebacks=True, tracebacks_show_locals=True, keywords=["TRACE_BIN"])
-        console_handler.addFilter(context_filter)
-        console_handler.setFormatter(logging.Formatter(RICH_FORMAT, datefmt="[%X]"))
         logging.basicConfig(
             level=getattr(logging, log_level.upper(), logging.INFO),
             datefmt="[%X]",
-            handlers=[console_handler],
+            handlers=[DeferredRichHandler()],
         )
 
+    command_func = getattr(__import__(module_name, fromlist=[func_name]), func_name)
     command_func(**kwargs)
 
 
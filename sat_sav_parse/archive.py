@@ -0,0 +1,136 @@
+import collections
+import collections.abc
+import concurrent.futures
+import contextlib
+import os
+import pathlib
+import tempfile
+
+import pydantic
+
+from sat_sav_parse.models import CSaveFileBody, CSaveFileChunk, SaveFileHeader, chunk_digest
+from sat_sav_parse.reader import map_file, read_header_prefix
+from sat_sav_parse.structs import SFSaveDeserializer
+from sat_sav_parse.utils import RawBytes, atomic_write
+
+__all__ = (
+    "ArchiveChunk",
+    "ArchiveManifest",
+    "ChunkStore",
+)
+
+
+class ArchiveChunk(pydantic.BaseModel):
+    # digest of the chunk record (header + compressed data) as it appears in the save
+    digest: str
+    size: int
+    body_size: int
+
+
+class ArchiveManifest(pydantic.BaseModel):
+    name: str
+    size: int
+    header: RawBytes
+    chunks: list[ArchiveChunk]
+
+    @property
+    def body_size(self) -> int:
+        return sum(chunk.body_size for chunk in self.chunks)
+
+
+class ChunkStore:
+    # Saves are stored as a manifest plus their chunk records, each record kept once under its digest
+    # in chunks/. Records are stored exactly as they appear in the save, so a restored save is
+    # byte-identical to the ingested one while successive autosaves share every unchanged chunk.
+    def __init__(self, root: pathlib.Path) -> None:
+        self.root = root
+        self.chunks_dir = root / "chunks"
+        self.manifests_dir = root / "manifests"
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+    def chunk_path(self, digest: str) -> pathlib.Path:
+        return self.chunks_dir / digest[:2] / digest
+
+    def manifest_path(self, name: str) -> pathlib.Path:
+        return self.manifests_dir / f"{name}.json"
+
+    def names(self) -> list[str]:
+        return sorted(path.stem for path in self.manifests_dir.glob("*.json"))
+
+    def manifest(self, name: str) -> ArchiveManifest:
+        return ArchiveManifest.model_validate_json(self.manifest_path(name).read_bytes())
+
+    def put_chunk(self, record: bytes) -> str:
+        digest = chunk_digest(record).hex()
+        path = self.chunk_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            with atomic_write(path) as f:
+                f.write(record)
+        return digest
+
+    def read_chunk(self, chunk: ArchiveChunk) -> bytes:
+        return self.chunk_path(chunk.digest).read_bytes()
+
+    def ingest(self, file_path: pathlib.Path, name: str | None = None) -> ArchiveManifest:
+        # The save is read one chunk record at a time.
+        with file_path.open("rb") as f:
+            _, header_size = read_header_prefix(f)
+            f.seek(0)
+            header = f.read(header_size)
+            chunks = []
+            for info in CSaveFileBody.scan_chunks(f, header_size):
+                f.seek(info.offset)
+                digest = self.put_chunk(f.read(info.size))
+                chunks.append(ArchiveChunk(digest=digest, size=info.size, body_size=info.body_size))
+            size = f.seek(0, os.SEEK_END)
+
+        manifest = ArchiveManifest(name=name or file_path.name, size=size, header=header, chunks=chunks)
+        with atomic_write(self.manifest_path(manifest.name)) as f:
+            f.write(manifest.model_dump_json().encode())
+        return manifest
+
+    def ingest_many(
+        self,
+        paths: collections.abc.Iterable[pathlib.Path],
+        *,
+        max_workers: int | None = None,
+    ) -> collections.abc.Iterator[ArchiveManifest]:
+        # Manifests are named after the save's file name, so saves with the same name from different
+        # directories would overwrite each other; they are rejected before anything is written.
+        paths = list(paths)
+        counts = collections.Counter(path.name for path in paths)
+        duplicates = sorted(name for name, count in counts.items() if count > 1)
+        if duplicates:
+            msg = f"Several saves would be stored under the same name: {', '.join(duplicates)}"
+            raise ValueError(msg)
+        return self._ingest_many(paths, max_workers)
+
+    def _ingest_many(
+        self,
+        paths: list[pathlib.Path],
+        max_workers: int | None,
+    ) -> collections.abc.Iterator[ArchiveManifest]:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(self.ingest, paths)
+
+    def restore(self, name: str, output_path: pathlib.Path) -> None:
+        manifest = self.manifest(name)
+        with atomic_write(output_path) as f:
+            f.write(manifest.header)
+            for chunk in manifest.chunks:
+                f.write(self.read_chunk(chunk))
+
+    @contextlib.contextmanager
+    def open_save(self, name: str) -> collections.abc.Iterator[tuple[SaveFileHeader, SFSaveDeserializer]]:
+        # Same as open_save_file(), with the body inflated straight from the stored chunks.
+        manifest = self.manifest(name)
+        header = SFSaveDeserializer(manifest.header).get(SaveFileHeader)
+        with tempfile.TemporaryFile() as body_file:
+            for chunk in manifest.chunks:
+                body_file.write(CSaveFileChunk.__deserialize__(SFSaveDeserializer(self.read_chunk(chunk))))
+            body_file.flush()
+
+            with map_file(body_file) as body:
+                yield header, SFSaveDeserializer(body)  # type: ignore
@@ -0,0 +1,260 @@
+import collections.abc
+import concurrent.futures
+import contextlib
+import glob
+import logging
+import os
+import pathlib
+import time
+import typing
+
+import pydantic
+
+from sat_sav_parse.exceptions import ParseError
+from sat_sav_parse.export import export_sqlite, write_save_body_json
+from sat_sav_parse.progress import LogProgress
+from sat_sav_parse.reader import open_save_file, read_save_header
+from sat_sav_parse.stats import read_save_stats
+
+__all__ = (
+    "BATCH_OPERATIONS",
+    "BatchFileResult",
+    "BatchOperation",
+    "BatchReport",
+    "load_batch_manifest",
+    "resolve_batch_paths",
+    "run_batch",
+)
+
+type BatchOperation = typing.Literal["info", "to-json", "stats", "export"]
+
+BATCH_OPERATIONS: typing.Final[tuple[BatchOperation, ...]] = ("info", "to-json", "stats", "export")
+
+
+class BatchFileResult(pydantic.BaseModel):
+    path: str
+    # size and mtime of the save when it was processed; a changed file is processed again on resume
+    size: int
+    mtime_ns: int
+    ok: bool
+    seconds: float
+    error: str | None = None
+    error_code: str | None = None
+    output: str | None = None
+    objects: int | None = None
+    data: dict[str, typing.Any] | None = None
+
+
+class BatchReport(pydantic.BaseModel):
+    operation: BatchOperation
+    workers: int
+    # wall time of the whole batch, in seconds
+    seconds: float
+    skipped: int
+    results: list[BatchFileResult]
+
+    @pydantic.computed_field
+    @property
+    def succeeded(self) -> int:
+        return sum(result.ok for result in self.results)
+
+    @pydantic.computed_field
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @pydantic.computed_field
+    @property
+    def bytes(self) -> int:
+        return sum(result.size for result in self.results)
+
+    @pydantic.computed_field
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / self.seconds / 1_000_000 if self.seconds else 0.0
+
+    @pydantic.computed_field
+    @property
+    def files_per_s(self) -> float:
+        return len(self.results) / self.seconds if self.seconds else 0.0
+
+
+def resolve_batch_paths(pattern: str | pathlib.Path) -> list[pathlib.Path]:
+    path = pathlib.Path(pattern)
+    if path.is_dir():
+        return sorted(path.glob("*.sav"))
+    if path.is_file():
+        return [path]
+    return sorted(pathlib.Path(match) for match in glob.glob(str(pattern), recursive=True))  # noqa: PTH207
+
+
+def load_batch_manifest(manifest_path: pathlib.Path) -> dict[str, BatchFileResult]:
+    # The manifest has one BatchFileResult per line, appended as files finish, so an interrupted
+    # batch loses at most the line being written; later lines for the same path win.
+    completed: dict[str, BatchFileResult] = {}
+    if not manifest_path.exists():
+        return completed
+    with manifest_path.open("r", encoding="utf-8") as fp:
+        for line in fp:
+            try:
+                result = BatchFileResult.model_validate_json(line)
+            except pydantic.ValidationError:
+                continue
+            completed[result.path] = result
+    return completed
+
+
+def _init_worker() -> None:
+    # results carry the errors; per-object logs and progress bars from every worker would interleave
+    logging.disable(logging.CRITICAL)
+    LogProgress.USE_RICH = False
+
+
+def _output_path(path: pathlib.Path, output_dir: pathlib.Path | None, suffix: str) -> pathlib.Path:
+    return (output_dir or path.parent) / path.with_suffix(suffix).name
+
+
+def _run_operation(
+    operation: BatchOperation,
+    path: pathlib.Path,
+    output_dir: pathlib.Path | None,
+) -> tuple[str | None, int | None, dict[str, typing.Any] | None]:
+    match operation:
+        case "info":
+            return None, None, read_save_header(path).model_dump(mode="json")
+        case "to-json":
+            output = _output_path(path, output_dir, ".json")
+            with open_save_file(path) as (header, des):
+                output.with_suffix(".header.json").write_text(header.model_dump_json(indent=2))
+                with output.open("wb") as fp:
+                    write_save_body_json(des, fp)
+            return str(output), None, None
+        case "stats":
+            stats = read_save_stats(path)
+            return None, stats.objects, stats.model_dump(mode="json")
+        case "export":
+            output = _output_path(path, output_dir, ".sqlite")
+            output.unlink(missing_ok=True)
+            return str(output), export_sqlite(path, output), None
+
+
+def _process_file(operation: BatchOperation, path: pathlib.Path, output_dir: pathlib.Path | None) -> BatchFileResult:
+    stat = path.stat()
+    started = time.perf_counter()
+    try:
+        output, objects, data = _run_operation(operation, path, output_dir)
+    except Exception as e:  # noqa: BLE001
+        return BatchFileResult(
+            path=str(path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            ok=False,
+            seconds=time.perf_counter() - started,
+            error=str(e) or type(e).__name__,
+            error_code=e.code if isinstance(e, ParseError) else type(e).__name__,
+        )
+    return BatchFileResult(
+        path=str(path),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        ok=True,
+        seconds=time.perf_counter() - started,
+        output=output,
+        objects=objects,
+        data=data,
+    )
+
+
+def _error_result(path: pathlib.Path, e: BaseException) -> BatchFileResult:
+    stat = path.stat()
+    return BatchFileResult(
+        path=str(path),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        ok=False,
+        seconds=0.0,
+        error=str(e) or type(e).__name__,
+        error_code=type(e).__name__,
+    )
+
+
+def _is_completed(path: pathlib.Path, completed: dict[str, BatchFileResult]) -> bool:
+    result = completed.get(str(path))
+    if result is None or not result.ok:
+        return False
+    stat = path.stat()
+    return result.size == stat.st_size and result.mtime_ns == stat.st_mtime_ns
+
+
+def run_batch(
+    paths: collections.abc.Iterable[pathlib.Path],
+    operation: BatchOperation,
+    *,
+    output_dir: pathlib.Path | None = None,
+    manifest_path: pathlib.Path | None = None,
+    max_workers: int | None = None,
+    on_result: collections.abc.Callable[[BatchFileResult], None] | None = None,
+) -> BatchReport:
+    # Files already recorded as done in the manifest (same size and mtime) are skipped, failed ones
+    # are retried. The largest saves are submitted first so a big one does not start last and
+    # leave the other workers idle at the end of the batch.
+    paths = list(paths)
+    completed = load_batch_manifest(manifest_path) if manifest_path is not None else {}
+    pending = [path for path in paths if not _is_completed(path, completed)]
+    pending.sort(key=lambda path: path.stat().st_size, reverse=True)
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(pending) or 1))
+
+    results: list[BatchFileResult] = []
+    started = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        manifest = stack.enter_context(manifest_path.open("a", encoding="utf-8")) if manifest_path else None
+
+        def record(result: BatchFileResult) -> None:
+            if manifest is not None:
+                manifest.write(result.model_dump_json() + "\n")
+                manifest.flush()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        # A worker that dies (e.g. killed for running out of memory) breaks the whole pool and every
+        # unfinished file fails with BrokenProcessPool. Those files are run again on a fresh pool with
+        # a single worker, which runs them in submission order, so the first one that does not finish
+        # is the file that killed its worker: only that one is recorded as failed and the rest go
+        # back to a full pool.
+        queue, isolate = pending, False
+        while queue:
+            broken: dict[pathlib.Path, BaseException] = {}
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=1 if isolate else workers,
+                initializer=_init_worker,
+            ) as executor:
+                futures = {executor.submit(_process_file, operation, path, output_dir): path for path in queue}
+                for future in concurrent.futures.as_completed(futures):
+                    path = futures[future]
+                    try:
+                        result = future.result()
+                    except concurrent.futures.process.BrokenProcessPool as e:
+                        broken[path] = e
+                        continue
+                    except Exception as e:  # noqa: BLE001
+                        # the worker could not send the result back (e.g. it did not pickle)
+                        result = _error_result(path, e)
+                    record(result)
+            queue = [path for path in queue if path in broken]
+            if not queue:
+                break
+            if isolate or len(queue) == 1:
+                record(_error_result(queue[0], broken[queue[0]]))
+                queue, isolate = queue[1:], False
+            else:
+                isolate = True
+    return BatchReport(
+        operation=operation,
+        workers=workers,
+        seconds=time.perf_counter() - started,
+        skipped=len(paths) - len(pending),
+        results=results,
+    )
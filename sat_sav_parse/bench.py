@@ -0,0 +1,188 @@
+import collections.abc
+import contextlib
+import functools
+import importlib.metadata
+import io
+import pathlib
+import platform
+import statistics
+import time
+import typing
+
+import pydantic
+
+from sat_sav_parse.models import CSaveFileBody, SaveFileBody
+from sat_sav_parse.reader import read_header_prefix
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+
+__all__ = (
+    "BENCH_PHASES",
+    "BenchPhase",
+    "BenchResult",
+    "run_bench",
+)
+
+BENCH_PHASES: typing.Final[tuple[str, ...]] = (
+    "header",
+    "chunk_scan",
+    "decompress",
+    "parse",
+    "json",
+    "serialize",
+    "compress",
+)
+
+_PROC_STATUS = pathlib.Path("/proc/self/status")
+_PROC_CLEAR_REFS = pathlib.Path("/proc/self/clear_refs")
+
+
+class BenchPhase(pydantic.BaseModel):
+    name: str
+    # wall time of every iteration, in seconds
+    times: list[float]
+    bytes: int
+    objects: int | None
+    # peak resident set size while the phase ran; process-wide peak where it cannot be reset
+    peak_rss: int | None
+
+    @pydantic.computed_field
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @pydantic.computed_field
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times)
+
+    @pydantic.computed_field
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / self.best / 1_000_000 if self.best else 0.0
+
+    @pydantic.computed_field
+    @property
+    def objects_per_s(self) -> float | None:
+        if self.objects is None:
+            return None
+        return self.objects / self.best if self.best else 0.0
+
+
+class BenchResult(pydantic.BaseModel):
+    path: str
+    file_size: int
+    body_size: int
+    objects: int
+    iterations: int
+    version: str
+    python: str
+    platform: str
+    phases: list[BenchPhase]
+
+
+def _package_version() -> str:
+    try:
+        return importlib.metadata.version("sat-sav-parse")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _reset_peak_rss() -> None:
+    # Linux only: writing 5 to clear_refs resets VmHWM
+    with contextlib.suppress(OSError):
+        _PROC_CLEAR_REFS.write_text("5")
+
+
+def _peak_rss() -> int | None:
+    try:
+        for line in _PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if platform.system() == "Darwin" else peak * 1024
+
+
+def _count_objects(body: SaveFileBody) -> int:
+    return sum(len(level.objects) for level in (*body.sublevels, body.persistent_level))
+
+
+class _PhaseTimer:
+    def __init__(self) -> None:
+        self.times: dict[str, list[float]] = {name: [] for name in BENCH_PHASES}
+        self.peak_rss: dict[str, int | None] = dict.fromkeys(BENCH_PHASES)
+
+    def run[T](self, name: str, fn: collections.abc.Callable[[], T]) -> T:
+        _reset_peak_rss()
+        start = time.perf_counter()
+        result = fn()
+        self.times[name].append(time.perf_counter() - start)
+        peak = _peak_rss()
+        if peak is not None:
+            self.peak_rss[name] = max(peak, self.peak_rss[name] or 0)
+        return result
+
+
+def _decompress(data: bytes, header_size: int) -> bytes:
+    des = SFSaveDeserializer(data)
+    des.offset = header_size
+    return des.get(CSaveFileBody)
+
+
+def _run_iteration(timer: _PhaseTimer, data: bytes) -> tuple[dict[str, int], int]:
+    _, header_size = timer.run("header", functools.partial(read_header_prefix, io.BytesIO(data)))
+    timer.run("chunk_scan", functools.partial(CSaveFileBody.scan_chunks, io.BytesIO(data), header_size))
+    body_bytes = timer.run("decompress", functools.partial(_decompress, data, header_size))
+    body = timer.run("parse", functools.partial(SFSaveDeserializer(body_bytes).get, SaveFileBody))
+    dumped = timer.run("json", body.model_dump_json)
+    serialized = timer.run("serialize", functools.partial(SFSaveSerializer.get, body))
+    timer.run("compress", functools.partial(SFSaveSerializer.get, CSaveFileBody(serialized)))
+    sizes = {
+        "header": header_size,
+        "chunk_scan": len(data) - header_size,
+        "decompress": len(body_bytes),
+        "parse": len(body_bytes),
+        "json": len(dumped),
+        "serialize": len(serialized),
+        "compress": len(serialized),
+    }
+    return sizes, _count_objects(body)
+
+
+def run_bench(file_path: pathlib.Path, iterations: int = 3) -> BenchResult:
+    # Every phase runs once per iteration on the output of the previous one. The file is read once
+    # up front so the timings measure decoding rather than disk I/O.
+    if iterations < 1:
+        msg = "iterations must be at least 1"
+        raise ValueError(msg)
+    data = file_path.read_bytes()
+    timer = _PhaseTimer()
+    for _ in range(iterations):
+        sizes, objects = _run_iteration(timer, data)
+
+    return BenchResult(
+        path=str(file_path),
+        file_size=len(data),
+        body_size=sizes["decompress"],
+        objects=objects,
+        iterations=iterations,
+        version=_package_version(),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        phases=[
+            BenchPhase(
+                name=name,
+                times=timer.times[name],
+                bytes=sizes[name],
+                objects=objects if name in {"parse", "json", "serialize"} else None,
+                peak_rss=timer.peak_rss[name],
+            )
+            for name in BENCH_PHASES
+        ],
+    )
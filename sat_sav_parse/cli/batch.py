@@ -0,0 +1,64 @@
+import pathlib
+
+import rich.console
+from rich.table import Table
+
+from sat_sav_parse.batch import BatchFileResult, BatchOperation, resolve_batch_paths, run_batch
+
+console = rich.console.Console(record=True)
+
+
+def _print_result(result: BatchFileResult) -> None:
+    name = pathlib.Path(result.path).name
+    if result.ok:
+        console.print(f"[green]done[/green] {name} in {result.seconds:.2f}s")
+    else:
+        console.print(f"[bold red]failed[/bold red] {name}: {result.error}")
+
+
+def batch_command(
+    source: str,
+    operation: BatchOperation,
+    output_dir: pathlib.Path | None = None,
+    manifest: pathlib.Path | None = None,
+    workers: int | None = None,
+    json: bool = False,
+    plain: bool = False,
+) -> None:
+    paths = resolve_batch_paths(source)
+    if not paths:
+        console.print(f"No save files match {source}", style="bold red")
+        return
+
+    report = run_batch(
+        paths,
+        operation,
+        output_dir=output_dir,
+        manifest_path=manifest,
+        max_workers=workers,
+        on_result=None if json else _print_result,
+    )
+    if json:
+        (print if plain else console.print_json)(report.model_dump_json(indent=None if plain else 2))
+        return
+
+    table = Table(title=f"Batch {operation}: {source}", show_lines=False)
+    table.add_column("Files", style="bold cyan", justify="right")
+    table.add_column("Succeeded", style="green", justify="right")
+    table.add_column("Failed", style="red", justify="right")
+    table.add_column("Skipped", style="yellow", justify="right")
+    table.add_column("Workers", justify="right")
+    table.add_column("Wall time", style="magenta", justify="right")
+    table.add_column("MB/s", style="green", justify="right")
+    table.add_column("Files/s", style="green", justify="right")
+    table.add_row(
+        str(len(paths)),
+        str(report.succeeded),
+        str(report.failed),
+        str(report.skipped),
+        str(report.workers),
+        f"{report.seconds:.2f} s",
+        f"{report.mb_per_s:.1f}",
+        f"{report.files_per_s:.2f}",
+    )
+    console.print(table, soft_wrap=True)
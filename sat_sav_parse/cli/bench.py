@@ -0,0 +1,49 @@
+import pathlib
+
+import rich.console
+from rich.table import Table
+
+from sat_sav_parse.bench import run_bench
+
+console = rich.console.Console(record=True)
+
+
+def _format_size(size: int | None) -> str:
+    return "-" if size is None else f"{size / 1024 / 1024:.1f} MiB"
+
+
+def bench_command(filename: pathlib.Path, iterations: int = 3, json: bool = False, plain: bool = False) -> None:
+    if not filename.exists():
+        console.print(f"File {filename} does not exist", style="bold red")
+        return
+
+    try:
+        result = run_bench(filename, iterations)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to benchmark {filename}: {e}", style="bold red")
+        return
+    if json:
+        (print if plain else console.print_json)(result.model_dump_json(indent=None if plain else 2))
+        return
+
+    console.print(
+        f"{result.path}: {_format_size(result.file_size)} on disk, {_format_size(result.body_size)} body, "
+        f"{result.objects} objects; sat-sav-parse {result.version}, Python {result.python}",
+    )
+    table = Table(title=f"Benchmark: {filename.name} ({result.iterations} iterations)", show_lines=False)
+    table.add_column("Phase", style="bold cyan")
+    table.add_column("Best", style="magenta", justify="right")
+    table.add_column("Mean", style="magenta", justify="right")
+    table.add_column("MB/s", style="green", justify="right")
+    table.add_column("Objects/s", style="green", justify="right")
+    table.add_column("Peak RSS", style="yellow", justify="right")
+    for phase in result.phases:
+        table.add_row(
+            phase.name,
+            f"{phase.best:.3f} s",
+            f"{phase.mean:.3f} s",
+            f"{phase.mb_per_s:.1f}",
+            "-" if phase.objects_per_s is None else f"{phase.objects_per_s:.0f}",
+            _format_size(phase.peak_rss),
+        )
+    console.print(table, soft_wrap=True)
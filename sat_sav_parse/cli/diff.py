@@ -0,0 +1,43 @@
+import pathlib
+
+import rich.console
+from rich.table import Table
+
+from sat_sav_parse.diff import diff_saves
+
+console = rich.console.Console(record=True)
+
+
+def diff_command(old: pathlib.Path, new: pathlib.Path, json: bool = False, plain: bool = False) -> None:
+    for filename in (old, new):
+        if not filename.exists():
+            console.print(f"File {filename} does not exist", style="bold red")
+            return
+
+    try:
+        result = diff_saves(old, new)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to compare {old} and {new}: {e}", style="bold red")
+        return
+    if json:
+        (print if plain else console.print_json)(result.model_dump_json(indent=None if plain else 2))
+        return
+    if result.identical:
+        console.print("Save bodies are identical", style="bold green")
+        return
+
+    console.print(
+        f"{result.changed_chunks} of {result.total_chunks} chunks differ: "
+        f"{len(result.added)} added, {len(result.removed)} removed, {len(result.changed)} changed objects",
+    )
+    table = Table(title=f"{old.name} -> {new.name}", show_lines=False)
+    table.add_column("Change", style="bold")
+    table.add_column("Object", style="cyan", overflow="fold")
+    table.add_column("Details", style="magenta", overflow="fold")
+    for name in result.added:
+        table.add_row("[green]added", name, "")
+    for name in result.removed:
+        table.add_row("[red]removed", name, "")
+    for change in result.changed:
+        table.add_row("[yellow]changed", change.instance_name, ", ".join([*change.fields, *change.properties]))
+    console.print(table, soft_wrap=True)
@@ -0,0 +1,26 @@
+import pathlib
+import time
+
+import rich.console
+
+from sat_sav_parse.export import export_sqlite
+
+console = rich.console.Console(record=True)
+
+
+def export_sqlite_command(filename: pathlib.Path, output: pathlib.Path | None = None) -> None:
+    if not filename.exists():
+        console.print(f"File {filename} does not exist", style="bold red")
+        return
+    output = output or filename.with_suffix(".sqlite")
+
+    try:
+        started = time.perf_counter()
+        count = export_sqlite(filename, output)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to export file {filename}: {e}", style="bold red")
+        return
+    console.print(
+        f"{count} objects exported to {output} in {time.perf_counter() - started:.2f}s",
+        style="bold green",
+    )
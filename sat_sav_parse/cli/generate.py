@@ -0,0 +1,45 @@
+import pathlib
+
+import rich.console
+
+from sat_sav_parse.generator import GeneratedPropertyKind, SaveGeneratorConfig, generate_save
+
+console = rich.console.Console(record=True)
+
+
+def _parse_property_mix(value: str) -> dict[GeneratedPropertyKind, float]:
+    mix: dict[GeneratedPropertyKind, float] = {}
+    for item in value.split(","):
+        kind, _, weight = item.partition("=")
+        mix[GeneratedPropertyKind(kind.strip())] = float(weight or 1)
+    return mix
+
+
+def generate_command(
+    output: pathlib.Path,
+    seed: int = 0,
+    actors: int = 10_000,
+    sublevels: int = 4,
+    components: int = 1,
+    properties: int = 6,
+    property_mix: str | None = None,
+    array_size: int = 8,
+) -> None:
+    try:
+        config = SaveGeneratorConfig(
+            seed=seed,
+            actors=actors,
+            sublevels=sublevels,
+            components_per_actor=components,
+            properties_per_object=properties,
+            array_size=array_size,
+            **({"property_mix": _parse_property_mix(property_mix)} if property_mix else {}),
+        )
+        generate_save(output, config)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to generate {output}: {e}", style="bold red")
+        return
+    console.print(
+        f"Generated {output} ({config.objects} objects, {output.stat().st_size} bytes)",
+        style="bold green",
+    )
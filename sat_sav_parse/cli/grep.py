@@ -0,0 +1,74 @@
+import json as json_module
+import pathlib
+
+import rich.console
+from rich.table import Table
+
+from sat_sav_parse.grep import DEFAULT_MAX_MATCH_SIZE, GREP_ENCODINGS, GrepEncoding, grep_save
+
+console = rich.console.Console(record=True)
+
+
+def grep_command(
+    filename: pathlib.Path,
+    pattern: str,
+    regex: bool = False,
+    ignore_case: bool = False,
+    encoding: list[GrepEncoding] | None = None,
+    max_match_size: int = DEFAULT_MAX_MATCH_SIZE,
+    json: bool = False,
+    plain: bool = False,
+) -> None:
+    if not filename.exists():
+        console.print(f"File {filename} does not exist", style="bold red")
+        return
+
+    try:
+        hits = grep_save(
+            filename,
+            pattern,
+            regex=regex,
+            ignore_case=ignore_case,
+            encodings=encoding or GREP_ENCODINGS,
+            max_match_size=max_match_size,
+        )
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to search file {filename}: {e}", style="bold red")
+        return
+    if json:
+        data = [
+            {
+                "offset": hit.match.offset,
+                "size": hit.match.size,
+                "encoding": hit.match.encoding,
+                "text": hit.match.text,
+                "region": hit.region,
+                "sublevel_name": hit.sublevel_name,
+                "instance_name": hit.instance_name,
+            }
+            for hit in hits
+        ]
+        (print if plain else console.print_json)(json_module.dumps(data, indent=None if plain else 2))
+        return
+
+    objects = {hit.instance_name for hit in hits if hit.location is not None}
+    console.print(f"{filename.name}: {len(hits)} matches in {len(objects)} objects")
+    if not hits:
+        return
+    table = Table(show_lines=False)
+    table.add_column("Offset", style="magenta", justify="right")
+    table.add_column("Encoding")
+    table.add_column("Level", style="bold cyan")
+    table.add_column("Object", style="bold cyan", overflow="fold")
+    table.add_column("Region")
+    table.add_column("Match", style="green", overflow="fold")
+    for hit in hits:
+        table.add_row(
+            str(hit.match.offset),
+            hit.match.encoding,
+            "" if hit.location is None else hit.sublevel_name or "(persistent)",
+            hit.instance_name or "",
+            hit.region or "",
+            hit.match.text,
+        )
+    console.print(table, soft_wrap=True)
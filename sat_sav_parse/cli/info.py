@@ -1,31 +1,43 @@
+import functools
+import json as json_module
 import pathlib
+import typing
 
-import rich
-from rich.table import Table
-
-from sat_sav_parse import SaveFileHeader, SFSaveDeserializer
+from sat_sav_parse import read_save_header, scan_save_headers
 from sat_sav_parse.utils import b64_bytes
 
-console = rich.console.Console(record=True)
+if typing.TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def get_console() -> "Console":
+    # info is the command most often run in scripts, so rich is only imported once there is
+    # something to render with it
+    from rich.console import Console  # noqa: PLC0415
+
+    return Console(record=True)
 
 
 def info_command(filename: pathlib.Path, json: bool = False, plain: bool = False) -> None:
     if not filename.exists():
-        console.print(f"File {filename} does not exist", style="bold red")
+        get_console().print(f"File {filename} does not exist", style="bold red")
+        return
+    if filename.is_dir():
+        info_dir_command(filename, json=json, plain=plain)
         return
 
     try:
-        file = filename.read_bytes()
-        des = SFSaveDeserializer(file)
-
-        file_info = des.get(SaveFileHeader)
+        file_info = read_save_header(filename)
     except Exception as e:  # noqa: BLE001
-        console.print(f"Failed to read file {filename}: {e}", style="bold red")
+        get_console().print(f"Failed to read file {filename}: {e}", style="bold red")
         return
     if json:
-        (print if plain else console.print)(file_info.model_dump_json(indent=2 if not plain else None))
+        (print if plain else get_console().print)(file_info.model_dump_json(indent=2 if not plain else None))
         return
 
+    from rich.table import Table  # noqa: PLC0415
+
     table = Table(title=f"Save file info: {filename.name}", show_lines=True)
 
     table.add_column("Field", style="bold cyan")
@@ -50,4 +62,40 @@ def info_command(filename: pathlib.Path, json: bool = False, plain: bool = False
     table.add_row("Creative Mode Enabled", str(file_info.creative_mode_enabled), "Is creative mode enabled")
     table.add_row("Checksum", str(b64_bytes(file_info.checksum)), "Checksum")
     table.add_row("Is Cheat", str(file_info.is_cheat), "Is cheat enabled")
-    console.print(table, soft_wrap=True)
+    get_console().print(table, soft_wrap=True)
+
+
+def info_dir_command(directory: pathlib.Path, json: bool = False, plain: bool = False) -> None:
+    results = list(scan_save_headers(sorted(directory.glob("*.sav"))))
+    if json:
+        data = [
+            {
+                "path": str(result.path),
+                "header": result.header.model_dump(mode="json") if result.header else None,
+                "error": str(result.error) if result.error else None,
+            }
+            for result in results
+        ]
+        (print if plain else get_console().print_json)(json_module.dumps(data, indent=None if plain else 2))
+        return
+
+    from rich.table import Table  # noqa: PLC0415
+
+    table = Table(title=f"Saves in {directory}", show_lines=False)
+    table.add_column("File", style="bold cyan")
+    table.add_column("Session Name", style="magenta")
+    table.add_column("Build Version")
+    table.add_column("Play Duration")
+    table.add_column("Save Datetime", style="green")
+    for result in results:
+        if result.header is None:
+            table.add_row(result.path.name, f"[bold red]{result.error}", "", "", "")
+            continue
+        table.add_row(
+            result.path.name,
+            result.header.session_name,
+            str(result.header.build_version),
+            str(result.header.play_timedelta),
+            str(result.header.save_datetime),
+        )
+    get_console().print(table, soft_wrap=True)
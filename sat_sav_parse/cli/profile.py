@@ -0,0 +1,48 @@
+import pathlib
+import typing
+
+import rich.console
+from rich.table import Table
+
+from sat_sav_parse import parse_save_file
+from sat_sav_parse.profiler import Profiler
+
+console = rich.console.Console(record=True)
+
+
+def profile_command(
+    filename: pathlib.Path,
+    output: pathlib.Path | None = None,
+    sort: typing.Literal["self_time", "total_time", "count", "bytes"] = "self_time",
+    limit: int = 30,
+) -> None:
+    if not filename.exists():
+        console.print(f"File {filename} does not exist", style="bold red")
+        return
+
+    profiler = Profiler()
+    try:
+        with profiler.activate():
+            parse_save_file(filename)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to parse {filename}: {e}", style="bold red")
+        return
+    if output is not None:
+        profiler.write_collapsed(output)
+        console.print(f"Collapsed stacks written to {output}", style="bold green")
+
+    table = Table(title=f"Profile: {filename.name}", show_lines=False)
+    table.add_column("Struct", style="bold cyan", overflow="fold")
+    table.add_column("Calls", style="magenta", justify="right")
+    table.add_column("Bytes", style="magenta", justify="right")
+    table.add_column("Total", style="green", justify="right")
+    table.add_column("Self", style="green", justify="right")
+    for stat in profiler.stats(sort)[:limit]:
+        table.add_row(
+            stat.name,
+            str(stat.count),
+            str(stat.bytes),
+            f"{stat.total_time:.3f} s",
+            f"{stat.self_time:.3f} s",
+        )
+    console.print(table, soft_wrap=True)
@@ -0,0 +1,30 @@
+import pathlib
+
+import rich.console
+
+from sat_sav_parse.server import SaveCache, SaveServer
+
+console = rich.console.Console(record=True)
+
+
+def serve_command(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    root: pathlib.Path | None = None,
+    cache_size: int = 1024,
+) -> None:
+    if root is not None and not root.is_dir():
+        console.print(f"Directory {root} does not exist", style="bold red")
+        return
+
+    try:
+        server = SaveServer((host, port), cache=SaveCache(cache_size * 1024 * 1024), root=root)
+    except OSError as e:
+        console.print(f"Failed to listen on {host}:{port}: {e}", style="bold red")
+        return
+    console.print(f"Serving saves on {server.url}", style="bold green")
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("Stopped", style="bold yellow")
@@ -0,0 +1,55 @@
+import pathlib
+
+import rich.console
+from rich.table import Table
+
+from sat_sav_parse.stats import read_save_stats
+
+console = rich.console.Console(record=True)
+
+
+def stats_command(filename: pathlib.Path, limit: int = 30, json: bool = False, plain: bool = False) -> None:
+    if not filename.exists():
+        console.print(f"File {filename} does not exist", style="bold red")
+        return
+
+    try:
+        stats = read_save_stats(filename)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to read file {filename}: {e}", style="bold red")
+        return
+    if json:
+        (print if plain else console.print_json)(stats.model_dump_json(indent=None if plain else 2))
+        return
+
+    console.print(
+        f"{filename.name}: {stats.objects} objects in {len(stats.levels)} levels, "
+        f"{stats.bytes} object bytes of {stats.body_size} body bytes, {stats.references} body references",
+    )
+    levels = Table(title="Levels", show_lines=False)
+    levels.add_column("Level", style="bold cyan")
+    levels.add_column("Objects", style="magenta", justify="right")
+    levels.add_column("Actors", justify="right")
+    levels.add_column("Components", justify="right")
+    levels.add_column("Bytes", style="green", justify="right")
+    levels.add_column("Collectables", justify="right")
+    levels.add_column("References", justify="right")
+    for level in stats.levels:
+        levels.add_row(
+            level.sublevel_name or "(persistent)",
+            str(level.objects),
+            str(level.actors),
+            str(level.components),
+            str(level.bytes),
+            str(level.collectables),
+            str(level.references),
+        )
+    console.print(levels, soft_wrap=True)
+
+    types = Table(title=f"Types ({len(stats.types)})", show_lines=False)
+    types.add_column("Type Path", style="bold cyan", overflow="fold")
+    types.add_column("Objects", style="magenta", justify="right")
+    types.add_column("Bytes", style="green", justify="right")
+    for type_stats in stats.types[:limit]:
+        types.add_row(type_stats.type_path, str(type_stats.objects), str(type_stats.bytes))
+    console.print(types, soft_wrap=True)
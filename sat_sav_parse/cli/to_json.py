@@ -1,8 +1,10 @@
 import pathlib
 
-import rich
+import rich.console
 
 from sat_sav_parse import CSaveFileBody, SaveFileBody, SaveFileHeader, SFSaveDeserializer
+from sat_sav_parse.export import write_save_body_json, write_save_ndjson
+from sat_sav_parse.reader import open_save_file
 
 console = rich.console.Console(record=True)
 
@@ -11,13 +13,22 @@ def to_json_command(
     filename: pathlib.Path,
     output: pathlib.Path | None = None,
     header: pathlib.Path | None = None,
+    stream: bool = False,
+    ndjson: bool = False,
 ) -> None:
     if not filename.exists():
         console.print(f"File {filename} does not exist", style="bold red")
         return
+    if ndjson:
+        to_ndjson(filename, output or filename.with_suffix(".ndjson"))
+        return
     output = output or filename.with_suffix(".json")
     header = header or output.with_suffix(".header.json")
 
+    if stream:
+        to_json_stream(filename, output, header)
+        return
+
     try:
         file = filename.read_bytes()
         des = SFSaveDeserializer(file)
@@ -34,3 +45,27 @@ def to_json_command(
     except Exception as e:  # noqa: BLE001
         console.print(f"Failed to read file {filename}: {e}", style="bold red")
         return
+
+
+def to_json_stream(filename: pathlib.Path, output: pathlib.Path, header: pathlib.Path) -> None:
+    try:
+        with open_save_file(filename) as (file_info, dec_des):
+            header.write_text(file_info.model_dump_json(indent=2))
+            console.print(f"Header saved to {header}", style="bold green")
+
+            with output.open("wb") as fp:
+                write_save_body_json(dec_des, fp)
+            console.print(f"Save body saved to {output}", style="bold green")
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to read file {filename}: {e}", style="bold red")
+        return
+
+
+def to_ndjson(filename: pathlib.Path, output: pathlib.Path) -> None:
+    try:
+        with open_save_file(filename) as (file_info, dec_des), output.open("wb") as fp:
+            count = write_save_ndjson(file_info, dec_des, fp)
+        console.print(f"{count} records saved to {output}", style="bold green")
+    except Exception as e:  # noqa: BLE001
+        console.print(f"Failed to read file {filename}: {e}", style="bold red")
+        return
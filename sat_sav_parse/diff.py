@@ -0,0 +1,113 @@
+import functools
+import itertools
+import pathlib
+
+import pydantic
+
+from sat_sav_parse.const import MAX_CHUNK_SIZE
+from sat_sav_parse.index import ObjectLocation, build_object_index
+from sat_sav_parse.models import LevelObjectType, chunk_digest, deserialize_level_object
+from sat_sav_parse.reader import open_save_file
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "ObjectChange",
+    "SaveDiff",
+    "diff_save_bodies",
+    "diff_saves",
+)
+
+
+class ObjectChange(pydantic.BaseModel):
+    instance_name: str
+    type_path: str
+    # changed object and header fields other than properties, e.g. "header.position" or "trailing"
+    fields: list[str]
+    properties: list[str]
+
+
+class SaveDiff(pydantic.BaseModel):
+    total_chunks: int
+    changed_chunks: int
+    added: list[str]
+    removed: list[str]
+    changed: list[ObjectChange]
+
+    @property
+    def identical(self) -> bool:
+        return not self.changed_chunks
+
+
+def _chunk_digests(content: bytes) -> list[bytes]:
+    return [chunk_digest(content[i : i + MAX_CHUNK_SIZE]) for i in range(0, len(content), MAX_CHUNK_SIZE)]
+
+
+def _raw_object(des: SFSaveDeserializer, location: ObjectLocation) -> bytes:
+    return des.content[location.object_offset : location.end_offset]
+
+
+def _decode_object(des: SFSaveDeserializer, location: ObjectLocation) -> LevelObjectType:
+    des.offset = location.object_offset
+    return des.get_fn(functools.partial(deserialize_level_object, header=location.header))
+
+
+def _changed_fields(old: pydantic.BaseModel, new: pydantic.BaseModel, exclude: set[str], prefix: str = "") -> list[str]:
+    return [
+        f"{prefix}{name}"
+        for name in type(new).model_fields
+        if name not in exclude and getattr(old, name, None) != getattr(new, name)
+    ]
+
+
+def _object_change(old: LevelObjectType, new: LevelObjectType) -> ObjectChange:
+    old_properties = {(prop.name, prop.index): prop for prop in old.properties}
+    new_properties = {(prop.name, prop.index): prop for prop in new.properties}
+    changed_properties = {
+        name
+        for name, index in old_properties.keys() | new_properties.keys()
+        if old_properties.get((name, index)) != new_properties.get((name, index))
+    }
+    return ObjectChange(
+        instance_name=new.header.instance_name,
+        type_path=new.header.type_path,
+        fields=[
+            *_changed_fields(old.header, new.header, set(), "header."),
+            *_changed_fields(old, new, {"header", "properties", "size"}),
+        ],
+        properties=sorted(changed_properties),
+    )
+
+
+def diff_save_bodies(old_des: SFSaveDeserializer, new_des: SFSaveDeserializer) -> SaveDiff:
+    # Compares decompressed bodies chunk by chunk first; if any chunk differs, objects are matched by
+    # instance name and compared by their raw bytes, and only objects whose bytes differ are decoded.
+    old_chunks = _chunk_digests(old_des.content)
+    new_chunks = _chunk_digests(new_des.content)
+    changed_chunks = sum(old != new for old, new in itertools.zip_longest(old_chunks, new_chunks))
+    if not changed_chunks:
+        return SaveDiff(total_chunks=len(new_chunks), changed_chunks=0, added=[], removed=[], changed=[])
+
+    old_objects = build_object_index(old_des).by_key
+    new_objects = build_object_index(new_des).by_key
+    changed: list[ObjectChange] = []
+    for key, location in new_objects.items():
+        old_location = old_objects.get(key)
+        if old_location is None:
+            continue
+        old_raw = _raw_object(old_des, old_location)
+        if location.header == old_location.header and _raw_object(new_des, location) == old_raw:
+            continue
+        changed.append(_object_change(_decode_object(old_des, old_location), _decode_object(new_des, location)))
+
+    return SaveDiff(
+        total_chunks=len(new_chunks),
+        changed_chunks=changed_chunks,
+        added=[location.instance_name for key, location in new_objects.items() if key not in old_objects],
+        removed=[location.instance_name for key, location in old_objects.items() if key not in new_objects],
+        changed=changed,
+    )
+
+
+def diff_saves(old_path: pathlib.Path, new_path: pathlib.Path) -> SaveDiff:
+    with open_save_file(old_path) as (_, old_des), open_save_file(new_path) as (_, new_des):
+        return diff_save_bodies(old_des, new_des)
@@ -9,6 +9,8 @@ type ParseErrorCode = typing.Literal[
     "invalid_deserializer",
     "string_decode_failure",
     "invalid_size",
+    "unexpected_end_of_data",
+    "unsupported_property_type",
 ]
 
 
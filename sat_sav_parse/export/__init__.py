@@ -0,0 +1,14 @@
+from .json_stream import JsonStreamWriter, write_save_body_json
+from .ndjson import NdjsonRecordType, iter_save_ndjson, write_save_ndjson
+from .sqlite import SQLITE_SCHEMA, SqliteExporter, export_sqlite
+
+__all__ = (
+    "SQLITE_SCHEMA",
+    "JsonStreamWriter",
+    "NdjsonRecordType",
+    "SqliteExporter",
+    "export_sqlite",
+    "iter_save_ndjson",
+    "write_save_body_json",
+    "write_save_ndjson",
+)
@@ -0,0 +1,104 @@
+import collections.abc
+import functools
+import json
+import typing
+
+import pydantic
+
+from sat_sav_parse.models import Level, SaveFileBody
+from sat_sav_parse.models.level import LevelField
+from sat_sav_parse.models.save_file_body import iter_save_file_body
+
+if typing.TYPE_CHECKING:
+    from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "JsonStreamWriter",
+    "write_save_body_json",
+)
+
+type WriteItemFn = collections.abc.Callable[[typing.Any, int], None]
+
+
+@functools.cache
+def _field_adapter(model: type[pydantic.BaseModel], name: str) -> pydantic.TypeAdapter:
+    return pydantic.TypeAdapter(model.model_fields[name].annotation)
+
+
+class JsonStreamWriter:
+    def __init__(self, fp: typing.BinaryIO, indent: int | None = 2) -> None:
+        self.fp = fp
+        self.indent = indent
+        self.key_separator = b": " if indent is not None else b":"
+
+    def newline(self, depth: int) -> bytes:
+        if self.indent is None:
+            return b""
+        return b"\n" + b" " * (self.indent * depth)
+
+    def write_json(self, data: bytes, depth: int) -> None:
+        if self.indent is not None and depth:
+            data = data.replace(b"\n", self.newline(depth))
+        self.fp.write(data)
+
+    def write_model(self, model: pydantic.BaseModel, depth: int) -> None:
+        self.write_json(model.model_dump_json(indent=self.indent).encode(), depth)
+
+    def write_array(self, items: collections.abc.Iterable[typing.Any], depth: int, write_item: WriteItemFn) -> None:
+        empty = True
+        for item in items:
+            self.fp.write(b"[" if empty else b",")
+            self.fp.write(self.newline(depth + 1))
+            write_item(item, depth + 1)
+            empty = False
+        if empty:
+            self.fp.write(b"[]")
+        else:
+            self.fp.write(self.newline(depth) + b"]")
+
+    def write_fields(
+        self,
+        model: type[pydantic.BaseModel],
+        fields: collections.abc.Iterable[tuple[str, typing.Any]],
+        depth: int,
+        streamed: collections.abc.Mapping[str, WriteItemFn],
+    ) -> None:
+        self.fp.write(b"{")
+        first = True
+        for name, value in fields:
+            if name not in model.model_fields:
+                continue
+            self.fp.write((b"" if first else b",") + self.newline(depth + 1))
+            self.fp.write(json.dumps(name).encode() + self.key_separator)
+            if name in streamed:
+                streamed[name](value, depth + 1)
+            else:
+                self.write_json(_field_adapter(model, name).dump_json(value, indent=self.indent), depth + 1)
+            first = False
+        self.fp.write(self.newline(depth) + b"}")
+
+    def write_level(self, fields: collections.abc.Iterable[LevelField], depth: int) -> None:
+        self.write_fields(
+            Level,
+            fields,
+            depth,
+            {
+                "object_headers": lambda items, d: self.write_array(items, d, self.write_model),
+                "objects": lambda items, d: self.write_array(items, d, self.write_model),
+            },
+        )
+
+    def write_save_body(self, des: "SFSaveDeserializer") -> None:
+        self.write_fields(
+            SaveFileBody,
+            iter_save_file_body(des, retain_headers=False),
+            0,
+            {
+                "sublevels": lambda levels, d: self.write_array(levels, d, self.write_level),
+                "persistent_level": self.write_level,
+            },
+        )
+
+
+def write_save_body_json(des: "SFSaveDeserializer", fp: typing.BinaryIO, *, indent: int | None = 2) -> None:
+    JsonStreamWriter(fp, indent=indent).write_save_body(des)
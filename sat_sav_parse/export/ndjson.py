@@ -0,0 +1,72 @@
+import collections.abc
+import json
+import typing
+
+import pydantic
+
+from sat_sav_parse.models.level import LevelField
+from sat_sav_parse.models.save_file_body import iter_save_file_body
+
+if typing.TYPE_CHECKING:
+    from sat_sav_parse.models import SaveFileHeader
+    from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "NdjsonRecordType",
+    "iter_save_ndjson",
+    "write_save_ndjson",
+)
+
+type NdjsonRecordType = typing.Literal["header", "object", "collectable", "second_collectable", "reference"]
+
+
+def _record(record: NdjsonRecordType, level_name: str | None, key: str, model: pydantic.BaseModel) -> bytes:
+    return (
+        f'{{"record":"{record}","level_name":{json.dumps(level_name)},"{key}":'.encode()
+        + model.model_dump_json().encode()
+        + b"}\n"
+    )
+
+
+def _iter_level_records(
+    fields: collections.abc.Iterable[LevelField],
+    level_name: str,
+) -> collections.abc.Iterator[bytes]:
+    for name, value in fields:
+        match name:
+            case "sublevel_name" if value is not None:
+                level_name = value
+            case "objects":
+                for obj in value:
+                    yield _record("object", level_name, "object", obj)
+            case "collectables":
+                for collectable in value:
+                    yield _record("collectable", level_name, "collectable", collectable)
+            case "second_collectables":
+                # the list after the objects, kept apart so a level can be rebuilt from the records
+                for collectable in value:
+                    yield _record("second_collectable", level_name, "collectable", collectable)
+
+
+def iter_save_ndjson(header: "SaveFileHeader", des: "SFSaveDeserializer") -> collections.abc.Iterator[bytes]:
+    # One JSON document per line: the save header first, then every level object and
+    # collectable as it is decoded, then the trailing body references.
+    yield _record("header", None, "header", header)
+    for name, value in iter_save_file_body(des, retain_headers=False):
+        match name:
+            case "sublevels":
+                for level in value:
+                    yield from _iter_level_records(level, header.map_name)
+            case "persistent_level":
+                yield from _iter_level_records(value, header.map_name)
+            case "references":
+                for reference in value:
+                    yield _record("reference", None, "reference", reference)
+
+
+def write_save_ndjson(header: "SaveFileHeader", des: "SFSaveDeserializer", fp: typing.BinaryIO) -> int:
+    count = 0
+    for line in iter_save_ndjson(header, des):
+        fp.write(line)
+        count += 1
+    return count
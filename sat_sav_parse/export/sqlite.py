@@ -0,0 +1,269 @@
+import collections.abc
+import pathlib
+import sqlite3
+import typing
+
+from sat_sav_parse.models import (
+    ActorHeader,
+    ActorObject,
+    ArrayElementInterface,
+    ArrayElementObject,
+    ArrayProperty,
+    BoolProperty,
+    ByteProperty,
+    DoubleProperty,
+    EnumProperty,
+    FloatProperty,
+    Int8Property,
+    Int64Property,
+    IntProperty,
+    LevelObjectType,
+    NameProperty,
+    ObjectProperty,
+    ObjectReference,
+    PropertyType,
+    SaveFileHeader,
+    SoftObjectProperty,
+    StrProperty,
+    UInt32Property,
+)
+from sat_sav_parse.models.level import LevelField
+from sat_sav_parse.models.save_file_body import iter_save_file_body
+from sat_sav_parse.reader import open_save_file
+
+if typing.TYPE_CHECKING:
+    from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "SQLITE_SCHEMA",
+    "SqliteExporter",
+    "export_sqlite",
+)
+
+SCALAR_PROPERTIES: typing.Final[tuple[type, ...]] = (
+    BoolProperty,
+    ByteProperty,
+    DoubleProperty,
+    EnumProperty,
+    FloatProperty,
+    Int8Property,
+    Int64Property,
+    IntProperty,
+    NameProperty,
+    StrProperty,
+    UInt32Property,
+)
+
+HEADER_COLUMNS: typing.Final[tuple[str, ...]] = tuple(SaveFileHeader.model_fields)
+
+SQLITE_SCHEMA: typing.Final[str] = f"""
+CREATE TABLE IF NOT EXISTS saves (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    {", ".join(HEADER_COLUMNS)}
+);
+CREATE TABLE IF NOT EXISTS levels (
+    id INTEGER PRIMARY KEY,
+    save_id INTEGER NOT NULL REFERENCES saves (id),
+    name TEXT NOT NULL,
+    is_persistent INTEGER NOT NULL,
+    save_version INTEGER
+);
+CREATE TABLE IF NOT EXISTS objects (
+    id INTEGER PRIMARY KEY,
+    level_id INTEGER NOT NULL REFERENCES levels (id),
+    type INTEGER NOT NULL,
+    type_path TEXT NOT NULL,
+    root_object TEXT NOT NULL,
+    instance_name TEXT NOT NULL,
+    parent_actor_name TEXT,
+    save_version INTEGER NOT NULL,
+    flag INTEGER NOT NULL,
+    rot_x REAL, rot_y REAL, rot_z REAL, rot_w REAL,
+    pos_x REAL, pos_y REAL, pos_z REAL,
+    scale_x REAL, scale_y REAL, scale_z REAL
+);
+CREATE TABLE IF NOT EXISTS properties (
+    object_id INTEGER NOT NULL REFERENCES objects (id),
+    name TEXT NOT NULL,
+    "index" INTEGER NOT NULL,
+    type_name TEXT NOT NULL,
+    value
+);
+CREATE TABLE IF NOT EXISTS refs (
+    object_id INTEGER NOT NULL REFERENCES objects (id),
+    source TEXT NOT NULL,
+    level_name TEXT NOT NULL,
+    path_name TEXT NOT NULL
+);
+"""
+
+SQLITE_INDEXES: typing.Final[str] = """
+CREATE INDEX IF NOT EXISTS objects_type_path ON objects (type_path);
+CREATE INDEX IF NOT EXISTS objects_instance_name ON objects (instance_name);
+CREATE INDEX IF NOT EXISTS objects_position ON objects (pos_x, pos_y, pos_z);
+CREATE INDEX IF NOT EXISTS properties_object_id ON properties (object_id);
+CREATE INDEX IF NOT EXISTS refs_object_id ON refs (object_id);
+CREATE INDEX IF NOT EXISTS refs_path_name ON refs (path_name);
+"""
+
+# column names come from SaveFileHeader fields, not from the save
+INSERT_SAVE_SQL: typing.Final[str] = (
+    f"INSERT INTO saves (path, {', '.join(HEADER_COLUMNS)}) VALUES (?{', ?' * len(HEADER_COLUMNS)})"  # noqa: S608
+)
+INSERT_OBJECT_SQL: typing.Final[str] = (
+    "INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+type Row = tuple[typing.Any, ...]
+
+
+def _execute_script(conn: sqlite3.Connection, script: str) -> None:
+    # executescript() commits any open transaction first, so statements are run one by one.
+    for statement in script.split(";"):
+        if statement.strip():
+            conn.execute(statement)
+
+
+def _property_refs(prop: PropertyType) -> collections.abc.Iterator[ObjectReference]:
+    match prop:
+        case ObjectProperty():
+            yield prop.payload
+        case SoftObjectProperty():
+            yield prop.payload[0]
+        case ArrayProperty(payload=ArrayElementObject() | ArrayElementInterface() as elements):
+            yield from elements.elements
+
+
+class SqliteExporter:
+    def __init__(self, conn: sqlite3.Connection, *, batch_size: int = 10000) -> None:
+        self.conn = conn
+        self.batch_size = batch_size
+        self.objects: list[Row] = []
+        self.properties: list[Row] = []
+        self.refs: list[Row] = []
+        self.object_count = 0
+        self._next_object_id = 0
+
+    def flush(self) -> None:
+        self.conn.executemany(INSERT_OBJECT_SQL, self.objects)
+        self.conn.executemany("INSERT INTO properties VALUES (?, ?, ?, ?, ?)", self.properties)
+        self.conn.executemany("INSERT INTO refs VALUES (?, ?, ?, ?)", self.refs)
+        self.objects.clear()
+        self.properties.clear()
+        self.refs.clear()
+
+    def add_object(self, level_id: int, obj: LevelObjectType) -> None:
+        object_id = self._next_object_id
+        self._next_object_id += 1
+        header = obj.header
+        if isinstance(header, ActorHeader):
+            transform = (
+                *(header.rotation.x, header.rotation.y, header.rotation.z, header.rotation.w),
+                *(header.position.x, header.position.y, header.position.z),
+                *(header.scale.x, header.scale.y, header.scale.z),
+            )
+            parent_actor_name = None
+        else:
+            transform = (None,) * 10
+            parent_actor_name = header.parent_actor_name
+        self.objects.append(
+            (
+                object_id,
+                level_id,
+                int(header.type),
+                header.type_path,
+                header.root_object,
+                header.instance_name,
+                parent_actor_name,
+                obj.save_version,
+                obj.flag,
+                *transform,
+            ),
+        )
+
+        if isinstance(obj, ActorObject):
+            parent = obj.parent_object_reference
+            if parent.path_name:
+                self.refs.append((object_id, "parent", parent.level_name, parent.path_name))
+            self.refs.extend((object_id, "component", ref.level_name, ref.path_name) for ref in obj.components)
+
+        for prop in obj.properties:
+            if isinstance(prop, SCALAR_PROPERTIES):
+                self.properties.append((object_id, prop.name, prop.index, prop.type_name.value, prop.payload))
+            else:
+                self.refs.extend((object_id, prop.name, ref.level_name, ref.path_name) for ref in _property_refs(prop))
+
+        self.object_count += 1
+        if len(self.objects) >= self.batch_size:
+            self.flush()
+
+    def add_level(
+        self,
+        save_id: int,
+        fields: collections.abc.Iterable[LevelField],
+        *,
+        is_persistent: bool,
+        default_name: str,
+    ) -> None:
+        level_id = None
+        for name, value in fields:
+            match name:
+                case "sublevel_name":
+                    cursor = self.conn.execute(
+                        "INSERT INTO levels (save_id, name, is_persistent) VALUES (?, ?, ?)",
+                        (save_id, value if value is not None else default_name, is_persistent),
+                    )
+                    level_id = cursor.lastrowid
+                case "objects":
+                    for obj in value:
+                        self.add_object(typing.cast("int", level_id), obj)
+                case "save_version":
+                    self.conn.execute("UPDATE levels SET save_version = ? WHERE id = ?", (value, level_id))
+
+    def add_save(self, path: str, header: SaveFileHeader, des: "SFSaveDeserializer") -> int:
+        _execute_script(self.conn, SQLITE_SCHEMA)
+        (max_object_id,) = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM objects").fetchone()
+        self._next_object_id = max_object_id + 1
+
+        header_values = header.model_dump()
+        cursor = self.conn.execute(
+            INSERT_SAVE_SQL,
+            (path, *(header_values[column] for column in HEADER_COLUMNS)),
+        )
+        save_id = typing.cast("int", cursor.lastrowid)
+
+        for name, value in iter_save_file_body(des, retain_headers=False):
+            match name:
+                case "sublevels":
+                    for level in value:
+                        self.add_level(save_id, level, is_persistent=False, default_name=header.map_name)
+                case "persistent_level":
+                    self.add_level(save_id, value, is_persistent=True, default_name=header.map_name)
+        self.flush()
+        return save_id
+
+    def create_indexes(self) -> None:
+        _execute_script(self.conn, SQLITE_INDEXES)
+
+
+def export_sqlite(file_path: pathlib.Path, db_path: pathlib.Path, *, batch_size: int = 10000) -> int:
+    # The whole save is loaded in one transaction and indexes are built once the rows are in,
+    # which is far cheaper than maintaining them during the bulk insert.
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = OFF")
+        exporter = SqliteExporter(conn, batch_size=batch_size)
+        with open_save_file(file_path) as (header, des):
+            conn.execute("BEGIN")
+            try:
+                exporter.add_save(str(file_path), header, des)
+                exporter.create_indexes()
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return exporter.object_count
+    finally:
+        conn.close()
@@ -0,0 +1,392 @@
+import collections.abc
+import enum
+import itertools
+import logging
+import pathlib
+import random
+import tempfile
+import typing
+
+import pydantic
+
+from sat_sav_parse.const import SUPPORT_HEADER_TYPES, SUPPORT_SAVE_VERSIONS
+from sat_sav_parse.models import (
+    ActorHeader,
+    ActorObject,
+    ArrayElementInt,
+    ArrayElementObject,
+    ArrayProperty,
+    BoolProperty,
+    ComponentHeader,
+    ComponentObject,
+    CSaveFileBody,
+    DoubleProperty,
+    EnumProperty,
+    FloatProperty,
+    GridName,
+    Int64Property,
+    IntProperty,
+    KeyTypeName,
+    LevelGroupingGrid,
+    LevelInfo,
+    LevelObjectType,
+    LinearColor,
+    MapProperty,
+    NameProperty,
+    ObjectProperty,
+    ObjectReference,
+    PropertyType,
+    Quat,
+    Quaternion,
+    SaveFileHeader,
+    SessionVisibility,
+    SetProperty,
+    SetType,
+    StreamedLevel,
+    StrProperty,
+    StructProperty,
+    StructTypeName,
+    TextProperty,
+    TextValueNone,
+    ValueTypeName,
+    Vector,
+    Vector3,
+    read_property_tag,
+    write_save_file_body,
+)
+from sat_sav_parse.structs import SFSaveSerializer
+from sat_sav_parse.utils import atomic_write
+
+__all__ = (
+    "DEFAULT_PROPERTY_MIX",
+    "GeneratedPropertyKind",
+    "SaveGeneratorConfig",
+    "generate_properties",
+    "generate_save",
+)
+
+logger = logging.getLogger(__name__)
+
+PERSISTENT_LEVEL: typing.Final[str] = "Persistent_Level"
+
+ACTOR_TYPE_PATHS: typing.Final[tuple[str, ...]] = (
+    "/Game/FactoryGame/Buildable/Building/Foundation/Build_Foundation_8x4_01.Build_Foundation_8x4_01_C",
+    "/Game/FactoryGame/Buildable/Factory/ConstructorMk1/Build_ConstructorMk1.Build_ConstructorMk1_C",
+    "/Game/FactoryGame/Buildable/Factory/ConveyorBeltMk1/Build_ConveyorBeltMk1.Build_ConveyorBeltMk1_C",
+    "/Game/FactoryGame/Buildable/Factory/PowerLine/Build_PowerLine.Build_PowerLine_C",
+    "/Game/FactoryGame/Buildable/Factory/StorageContainerMk1/Build_StorageContainerMk1.Build_StorageContainerMk1_C",
+)
+COMPONENT_TYPE_PATHS: typing.Final[tuple[str, ...]] = (
+    "/Script/FactoryGame.FGFactoryConnectionComponent",
+    "/Script/FactoryGame.FGInventoryComponent",
+    "/Script/FactoryGame.FGPowerConnectionComponent",
+    "/Script/FactoryGame.FGPowerInfoComponent",
+)
+
+
+class GeneratedPropertyKind(enum.StrEnum):
+    INT = "int"
+    INT64 = "int64"
+    FLOAT = "float"
+    DOUBLE = "double"
+    BOOL = "bool"
+    ENUM = "enum"
+    STR = "str"
+    NAME = "name"
+    OBJECT = "object"
+    ARRAY = "array"
+    OBJECT_ARRAY = "object_array"
+    STRUCT = "struct"
+    MAP = "map"
+    SET = "set"
+    TEXT = "text"
+
+
+# relative weights, roughly the mix of a factory-heavy save
+DEFAULT_PROPERTY_MIX: typing.Final[dict[GeneratedPropertyKind, float]] = {
+    GeneratedPropertyKind.INT: 4,
+    GeneratedPropertyKind.INT64: 1,
+    GeneratedPropertyKind.FLOAT: 4,
+    GeneratedPropertyKind.DOUBLE: 1,
+    GeneratedPropertyKind.BOOL: 3,
+    GeneratedPropertyKind.ENUM: 1,
+    GeneratedPropertyKind.STR: 1,
+    GeneratedPropertyKind.NAME: 1,
+    GeneratedPropertyKind.OBJECT: 4,
+    GeneratedPropertyKind.ARRAY: 1,
+    GeneratedPropertyKind.OBJECT_ARRAY: 2,
+    GeneratedPropertyKind.STRUCT: 3,
+    GeneratedPropertyKind.MAP: 1,
+    GeneratedPropertyKind.SET: 1,
+    GeneratedPropertyKind.TEXT: 1,
+}
+
+
+class SaveGeneratorConfig(pydantic.BaseModel):
+    seed: int = 0
+    # actors are split evenly between the sublevels and the persistent level
+    actors: typing.Annotated[int, pydantic.Field(ge=0)] = 10_000
+    sublevels: typing.Annotated[int, pydantic.Field(ge=0)] = 4
+    components_per_actor: typing.Annotated[int, pydantic.Field(ge=0)] = 1
+    properties_per_object: typing.Annotated[int, pydantic.Field(ge=0)] = 6
+    property_mix: dict[GeneratedPropertyKind, float] = DEFAULT_PROPERTY_MIX
+    # element count of array, map and set properties
+    array_size: typing.Annotated[int, pydantic.Field(ge=0)] = 8
+    string_size: typing.Annotated[int, pydantic.Field(ge=0)] = 16
+    collectables_per_level: typing.Annotated[int, pydantic.Field(ge=0)] = 4
+
+    @property
+    def objects(self) -> int:
+        return self.actors * (1 + self.components_per_actor)
+
+
+class _LevelGenerator:
+    def __init__(self, config: SaveGeneratorConfig, rng: random.Random, level_name: str) -> None:
+        self.config = config
+        self.rng = rng
+        self.level_name = level_name
+        self.kinds = list(config.property_mix)
+        self.weights = list(config.property_mix.values())
+
+    def instance_name(self, name: str) -> str:
+        return f"{self.level_name}:PersistentLevel.{name}"
+
+    def reference(self) -> ObjectReference:
+        return ObjectReference(
+            level_name=self.level_name,
+            path_name=self.instance_name(f"Build_Foundation_8x4_01_C_{self.rng.randrange(1 << 30)}"),
+        )
+
+    def string(self) -> str:
+        return "".join(self.rng.choices("abcdefghijklmnopqrstuvwxyz ", k=self.config.string_size))
+
+    def property(self, kind: GeneratedPropertyKind, name: str) -> PropertyType:  # noqa: PLR0911
+        rng = self.rng
+        size = self.config.array_size
+        match kind:
+            case GeneratedPropertyKind.INT:
+                return IntProperty(name=name, payload_size=4, index=0, payload=rng.randint(-(1 << 31), (1 << 31) - 1))
+            case GeneratedPropertyKind.INT64:
+                return Int64Property(name=name, payload_size=8, index=0, payload=rng.getrandbits(62))
+            case GeneratedPropertyKind.FLOAT:
+                return FloatProperty(name=name, payload_size=4, index=0, payload=rng.uniform(-1e4, 1e4))
+            case GeneratedPropertyKind.DOUBLE:
+                return DoubleProperty(name=name, payload_size=8, index=0, payload=rng.uniform(-1e6, 1e6))
+            case GeneratedPropertyKind.BOOL:
+                return BoolProperty(name=name, payload_size=0, index=0, payload=rng.random() < 0.5)  # noqa: PLR2004
+            case GeneratedPropertyKind.ENUM:
+                value = f"EProductionStatus::IS_{rng.choice(('NONE', 'PRODUCING', 'STANDBY', 'ERROR'))}"
+                return EnumProperty(name=name, payload_size=0, index=0, type="EProductionStatus", payload=value)
+            case GeneratedPropertyKind.STR:
+                return StrProperty(name=name, payload_size=0, index=0, payload=self.string())
+            case GeneratedPropertyKind.NAME:
+                return NameProperty(name=name, payload_size=0, index=0, payload=self.string())
+            case GeneratedPropertyKind.OBJECT:
+                return ObjectProperty(name=name, payload_size=0, index=0, payload=self.reference())
+            case GeneratedPropertyKind.ARRAY:
+                elements = [rng.randint(-(1 << 31), (1 << 31) - 1) for _ in range(size)]
+                payload = ArrayElementInt(length=size, elements=elements)
+                return ArrayProperty(name=name, payload_size=4 + 4 * size, index=0, payload=payload)
+            case GeneratedPropertyKind.OBJECT_ARRAY:
+                payload = ArrayElementObject(length=size, elements=[self.reference() for _ in range(size)])
+                return ArrayProperty(name=name, payload_size=0, index=0, payload=payload)
+            case GeneratedPropertyKind.STRUCT:
+                return self.struct_property(name)
+            case GeneratedPropertyKind.MAP:
+                return MapProperty(
+                    name=name,
+                    payload_size=8 + 8 * size,
+                    index=0,
+                    key_type=KeyTypeName.INT,
+                    value_type=ValueTypeName.INT,
+                    mode=0,
+                    elements_count=size,
+                    payload={key: rng.randint(0, 1 << 20) for key in range(size)},
+                )
+            case GeneratedPropertyKind.SET:
+                payload = [rng.getrandbits(32) for _ in range(size)]
+                return SetProperty(
+                    name=name,
+                    payload_size=8 + 4 * size,
+                    index=0,
+                    set_type=SetType.U_INT_32,
+                    payload=payload,
+                )
+            case GeneratedPropertyKind.TEXT:
+                text = TextValueNone(has_culture_invariant_string=True, value=self.string(), flags=2)
+                return TextProperty(name=name, payload_size=0, index=0, payload=text)
+            case _:
+                typing.assert_never(kind)
+
+    def struct_property(self, name: str) -> StructProperty:
+        uniform = self.rng.uniform
+        match self.rng.randrange(3):
+            case 0:
+                value = Vector(x=uniform(-1e5, 1e5), y=uniform(-1e5, 1e5), z=uniform(-1e4, 1e4))
+                struct_type, payload_size = StructTypeName.VECTOR, 24
+            case 1:
+                value = Quat(x=uniform(-1, 1), y=uniform(-1, 1), z=uniform(-1, 1), w=uniform(-1, 1))
+                struct_type, payload_size = StructTypeName.QUAT, 32
+            case _:
+                value = LinearColor(r=uniform(0, 1), g=uniform(0, 1), b=uniform(0, 1), a=1.0)
+                struct_type, payload_size = StructTypeName.LINEAR_COLOR, 16
+        return StructProperty(name=name, payload_size=payload_size, index=0, type=struct_type, payload=value)
+
+    def properties(self) -> list[PropertyType]:
+        if not self.weights or not self.config.properties_per_object:
+            return []
+        kinds = self.rng.choices(self.kinds, self.weights, k=self.config.properties_per_object)
+        return [
+            _with_payload_size(self.property(kind, f"m{kind.title().replace('_', '')}{i}"))
+            for i, kind in enumerate(kinds)
+        ]
+
+    def actor(self, index: int) -> list[LevelObjectType]:
+        rng = self.rng
+        type_path = rng.choice(ACTOR_TYPE_PATHS)
+        actor_name = self.instance_name(f"{type_path.rsplit('.', 1)[-1]}_{index}")
+        component_names = [f"{actor_name}.Component_{i}" for i in range(self.config.components_per_actor)]
+
+        header = ActorHeader(
+            type_path=type_path,
+            root_object=self.level_name,
+            instance_name=actor_name,
+            unknown=0,
+            need_transform=True,
+            rotation=Quaternion(x=0, y=0, z=rng.uniform(-1, 1), w=rng.uniform(-1, 1)),
+            position=Vector3(x=rng.uniform(-3e5, 3e5), y=rng.uniform(-3e5, 3e5), z=rng.uniform(-1e4, 3e4)),
+            scale=Vector3(x=1, y=1, z=1),
+            was_placed_in_level=False,
+        )
+        objects: list[LevelObjectType] = [
+            ActorObject(
+                header=header,
+                save_version=SUPPORT_SAVE_VERSIONS[-1],
+                flag=0,
+                size=0,
+                parent_object_reference=ObjectReference(level_name="", path_name=""),
+                components=[ObjectReference(level_name=self.level_name, path_name=name) for name in component_names],
+                properties=self.properties(),
+                trailing=b"",
+            ),
+        ]
+        for component_name in component_names:
+            component_header = ComponentHeader(
+                type_path=rng.choice(COMPONENT_TYPE_PATHS),
+                root_object=self.level_name,
+                instance_name=component_name,
+                unknown=0,
+                parent_actor_name=actor_name,
+            )
+            objects.append(
+                ComponentObject(
+                    header=component_header,
+                    save_version=SUPPORT_SAVE_VERSIONS[-1],
+                    flag=0,
+                    size=0,
+                    properties=self.properties(),
+                    trailing=b"",
+                ),
+            )
+        return objects
+
+    def objects(self, actors: range) -> collections.abc.Iterator[LevelObjectType]:
+        for index in actors:
+            yield from self.actor(index)
+
+    def level(self, actors: range, *, is_persistent: bool) -> StreamedLevel:
+        collectables = [self.reference() for _ in range(self.config.collectables_per_level)]
+        return StreamedLevel(
+            sublevel_name=None if is_persistent else self.level_name,
+            objects=self.objects(actors),
+            collectables=collectables,
+            save_version=SUPPORT_SAVE_VERSIONS[-1],
+            second_collectables=[] if is_persistent else collectables,
+            extra_level_names_count=0 if is_persistent else None,
+        )
+
+
+def _with_payload_size(prop: PropertyType) -> PropertyType:
+    # properties are built with payload_size 0 when it depends on the generated values
+    if prop.payload_size or isinstance(prop, BoolProperty):
+        return prop
+    data = SFSaveSerializer.get(prop)
+    tag = read_property_tag(data, 0)
+    return prop.model_copy(update={"payload_size": len(data) - tag.value_offset})  # type: ignore
+
+
+def _split(total: int, parts: int) -> list[range]:
+    bounds = [total * i // parts for i in range(parts + 1)]
+    return [range(start, end) for start, end in itertools.pairwise(bounds)]
+
+
+def _header(config: SaveGeneratorConfig, rng: random.Random) -> SaveFileHeader:
+    return SaveFileHeader(
+        header_type=SUPPORT_HEADER_TYPES[-1],
+        save_version=SUPPORT_SAVE_VERSIONS[-1],
+        build_version=416835,
+        save_name=f"synthetic_{config.seed}",
+        map_name=PERSISTENT_LEVEL,
+        map_options="?startloc=Grass Fields",
+        session_name=f"synthetic_{config.seed}",
+        play_duration=rng.randrange(1 << 20),
+        save_ticks=638_000_000_000_000_000 + rng.randrange(1 << 40),
+        session_visibility=SessionVisibility.PRIVATE,
+        editor_object_version=1,
+        mod_metadata="",
+        mod_flags=0,
+        save_id=f"{rng.getrandbits(128):032x}",
+        is_partitioned_world=True,
+        creative_mode_enabled=False,
+        checksum=rng.randbytes(16),
+        is_cheat=False,
+    )
+
+
+def generate_properties(config: SaveGeneratorConfig | None = None) -> list[PropertyType]:
+    # one object's worth of properties, drawn the same way generate_save() draws them
+    config = config or SaveGeneratorConfig()
+    return _LevelGenerator(config, random.Random(config.seed), PERSISTENT_LEVEL).properties()  # noqa: S311
+
+
+def generate_save(output_path: pathlib.Path, config: SaveGeneratorConfig | None = None) -> SaveFileHeader:
+    # Objects are built from the model classes and written one actor at a time (see write_level),
+    # so memory stays flat however many actors a level has; the decompressed body is spooled to a
+    # temporary file and compressed from there. The output depends only on the config.
+    config = config or SaveGeneratorConfig()
+    rng = random.Random(config.seed)  # noqa: S311
+    header = _header(config, rng)
+    sublevel_names = [f"Sublevel_{i}" for i in range(config.sublevels)]
+    *sublevel_actors, persistent_actors = _split(config.actors, config.sublevels + 1)
+
+    def _sublevels() -> collections.abc.Iterator[StreamedLevel]:
+        for name, actors in zip(sublevel_names, sublevel_actors, strict=True):
+            logger.info("Generating %s (%d actors)", name, len(actors))
+            yield _LevelGenerator(config, rng, name).level(actors, is_persistent=False)
+
+    grids = [
+        LevelGroupingGrid(
+            grid_name=grid_name,
+            unknown_1=1,
+            unknown_2=0,
+            levels=[LevelInfo(name=name, value=rng.getrandbits(32)) for name in sublevel_names],
+        )
+        for grid_name in GridName
+    ]
+
+    with tempfile.TemporaryFile() as body_file, atomic_write(output_path) as dst:
+        persistent = _LevelGenerator(config, rng, PERSISTENT_LEVEL)
+        write_save_file_body(
+            body_file,
+            unknown_1=0,
+            unknown_2=0,
+            grids=grids,
+            sublevel_count=config.sublevels,
+            sublevels=_sublevels(),
+            persistent_level=persistent.level(persistent_actors, is_persistent=True),
+            references=[persistent.reference() for _ in range(config.collectables_per_level)],
+        )
+        body_file.seek(0)
+        dst.write(SFSaveSerializer.get(header))
+        CSaveFileBody.compress_to(body_file, dst)
+    return header
@@ -0,0 +1,203 @@
+import bisect
+import collections.abc
+import pathlib
+import re
+import tempfile
+import typing
+
+from sat_sav_parse.index import ObjectLocation, iter_level_locations, iter_level_objects
+from sat_sav_parse.models import CSaveFileBody, SaveFileHeader, deserialize_object_header
+from sat_sav_parse.models.save_file_body import iter_save_file_body
+from sat_sav_parse.reader import map_file
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "DEFAULT_MAX_MATCH_SIZE",
+    "GREP_ENCODINGS",
+    "GrepEncoding",
+    "GrepHit",
+    "GrepMatch",
+    "grep_save",
+    "iter_body_matches",
+    "locate_matches",
+)
+
+type GrepEncoding = typing.Literal["utf-8", "utf-16"]
+type GrepRegion = typing.Literal["header", "object"]
+
+GREP_ENCODINGS: typing.Final[tuple[GrepEncoding, ...]] = ("utf-8", "utf-16")
+# a regex match longer than this may be missed or cut short where it crosses a chunk boundary
+DEFAULT_MAX_MATCH_SIZE: typing.Final[int] = 4096
+
+
+class GrepMatch(typing.NamedTuple):
+    # position of the match in the decompressed body
+    offset: int
+    size: int
+    encoding: GrepEncoding
+    text: str
+
+
+class GrepHit(typing.NamedTuple):
+    match: GrepMatch
+    # None when the match is outside every object header and object, e.g. in a collectable reference
+    region: GrepRegion | None
+    location: ObjectLocation | None
+
+    @property
+    def sublevel_name(self) -> str | None:
+        return self.location.sublevel_name if self.location is not None else None
+
+    @property
+    def instance_name(self) -> str | None:
+        return self.location.instance_name if self.location is not None else None
+
+
+class _Searcher:
+    def __init__(self, encoding: GrepEncoding, pattern: str, *, regex: bool, ignore_case: bool) -> None:
+        self.encoding = encoding
+        flags = re.IGNORECASE if ignore_case else 0
+        source = pattern if regex else re.escape(pattern)
+        # UTF-8 is matched on the raw bytes; UTF-16 text is decoded at both byte alignments, since
+        # strings start at arbitrary offsets
+        self.utf8 = re.compile(source.encode(), flags) if encoding == "utf-8" else None
+        self.utf16 = re.compile(source, flags) if encoding == "utf-16" else None
+        # matches already reported end here; per alignment for UTF-16
+        self.resume = [0, 0]
+
+    def search(self, buffer: bytes, base: int, limit: int) -> collections.abc.Iterator[GrepMatch]:
+        if self.utf8 is not None:
+            for m in self.utf8.finditer(buffer):
+                if m.start() >= limit:
+                    break
+                if base + m.start() >= self.resume[0]:
+                    self.resume[0] = base + m.end()
+                    yield GrepMatch(base + m.start(), m.end() - m.start(), "utf-8", m.group().decode(errors="replace"))
+            return
+        assert self.utf16 is not None  # noqa: S101
+        for parity in (0, 1):
+            start = (parity - base) % 2
+            end = start + (len(buffer) - start) // 2 * 2
+            text = buffer[start:end].decode("utf-16-le", errors="replace")
+            # every code unit is one character unless the text holds surrogate pairs
+            narrow = len(text) * 2 == end - start
+            for m in self.utf16.finditer(text):
+                offset = start + (2 * m.start() if narrow else len(text[: m.start()].encode("utf-16-le")))
+                if offset >= limit:
+                    break
+                if base + offset >= self.resume[parity]:
+                    size = len(m.group().encode("utf-16-le"))
+                    self.resume[parity] = base + offset + size
+                    yield GrepMatch(base + offset, size, "utf-16", m.group())
+
+
+def iter_body_matches(
+    chunks: collections.abc.Iterable[bytes],
+    pattern: str,
+    *,
+    regex: bool = False,
+    ignore_case: bool = False,
+    encodings: collections.abc.Iterable[GrepEncoding] = GREP_ENCODINGS,
+    max_match_size: int = DEFAULT_MAX_MATCH_SIZE,
+) -> collections.abc.Iterator[GrepMatch]:
+    # Each chunk is searched together with the tail of the previous ones. Matches starting in the
+    # last `overlap` bytes are left for the next round, so one crossing a chunk boundary is found
+    # whole; for a plain string the overlap is the size of its longest encoding.
+    searchers = [_Searcher(encoding, pattern, regex=regex, ignore_case=ignore_case) for encoding in encodings]
+    overlap = max_match_size if regex else max(len(pattern.encode()), len(pattern.encode("utf-16-le")))
+    buffer = b""
+    base = 0
+    for chunk in chunks:
+        buffer += chunk
+        limit = len(buffer) - overlap
+        if limit <= 0:
+            continue
+        yield from sorted(match for searcher in searchers for match in searcher.search(buffer, base, limit))
+        buffer = buffer[limit:]
+        base += limit
+    yield from sorted(match for searcher in searchers for match in searcher.search(buffer, base, len(buffer)))
+
+
+def _object_regions(des: SFSaveDeserializer) -> list[tuple[int, int, GrepRegion, ObjectLocation]]:
+    # A header ends where the next header of its level starts; only the last header of each level
+    # is decoded again to find its end.
+    locations: list[ObjectLocation] = []
+    for name, value in iter_save_file_body(des, level_iter=iter_level_locations):
+        match name:
+            case "sublevels":
+                for level in value:
+                    locations.extend(iter_level_objects(level))
+            case "persistent_level":
+                locations.extend(iter_level_objects(value))
+    regions: list[tuple[int, int, GrepRegion, ObjectLocation]] = []
+    for idx, location in enumerate(locations):
+        following = locations[idx + 1] if idx + 1 < len(locations) else None
+        if (
+            following is not None
+            and following.sublevel_name == location.sublevel_name
+            and following.header_offset > location.header_offset
+        ):
+            header_end = following.header_offset
+        else:
+            header_des = SFSaveDeserializer(des.content, location.header_offset)
+            header_des.get_fn(deserialize_object_header)
+            header_end = header_des.offset
+        regions.append((location.header_offset, header_end, "header", location))
+        regions.append((location.object_offset, location.end_offset, "object", location))
+    regions.sort(key=lambda region: region[0])
+    return regions
+
+
+def locate_matches(des: SFSaveDeserializer, matches: collections.abc.Iterable[GrepMatch]) -> list[GrepHit]:
+    regions = _object_regions(des)
+    starts = [region[0] for region in regions]
+    hits: list[GrepHit] = []
+    for match in matches:
+        idx = bisect.bisect_right(starts, match.offset) - 1
+        if idx >= 0 and match.offset < regions[idx][1]:
+            _, _, region, location = regions[idx]
+            hits.append(GrepHit(match, region, location))
+        else:
+            hits.append(GrepHit(match, None, None))
+    return hits
+
+
+def grep_save(
+    file_path: pathlib.Path,
+    pattern: str,
+    *,
+    regex: bool = False,
+    ignore_case: bool = False,
+    encodings: collections.abc.Iterable[GrepEncoding] = GREP_ENCODINGS,
+    max_match_size: int = DEFAULT_MAX_MATCH_SIZE,
+) -> list[GrepHit]:
+    # The body is searched chunk by chunk as it is inflated and spooled to a temporary file; the
+    # object headers are only walked, over the memory-mapped spool, if something matched.
+    with (
+        file_path.open("rb") as f,
+        map_file(f) as content,
+        tempfile.TemporaryFile() as body_file,
+    ):
+        des = SFSaveDeserializer(content)  # type: ignore
+        des.get(SaveFileHeader)
+
+        def _spool() -> collections.abc.Iterator[bytes]:
+            for chunk in CSaveFileBody.iter_chunks(des):
+                body_file.write(chunk)
+                yield chunk
+
+        matches = list(
+            iter_body_matches(
+                _spool(),
+                pattern,
+                regex=regex,
+                ignore_case=ignore_case,
+                encodings=encodings,
+                max_match_size=max_match_size,
+            ),
+        )
+        if not matches:
+            return []
+        body_file.flush()
+        with map_file(body_file) as body:
+            return locate_matches(SFSaveDeserializer(body), matches)  # type: ignore
@@ -0,0 +1,160 @@
+import collections.abc
+import typing
+
+from sat_sav_parse.models import OBJECT_PREFIX_SIZE, ActorHeader, ObjectHeaderType, PropertyTag, iter_property_tags
+from sat_sav_parse.models.level import iter_level
+from sat_sav_parse.models.save_file_body import iter_save_file_body
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "ObjectIndex",
+    "ObjectKey",
+    "ObjectLocation",
+    "build_object_index",
+    "iter_level_locations",
+    "iter_level_objects",
+)
+
+
+# (sublevel name, None for the persistent level; instance name); instance names are only unique within a level
+type ObjectKey = tuple[str | None, str]
+
+
+class ObjectLocation(typing.NamedTuple):
+    # None for the persistent level
+    sublevel_name: str | None
+    header: ObjectHeaderType
+    header_offset: int
+    object_offset: int
+    size: int
+
+    @property
+    def instance_name(self) -> str:
+        return self.header.instance_name
+
+    @property
+    def key(self) -> ObjectKey:
+        return self.sublevel_name, self.header.instance_name
+
+    @property
+    def data_offset(self) -> int:
+        return self.object_offset + OBJECT_PREFIX_SIZE
+
+    @property
+    def end_offset(self) -> int:
+        return self.data_offset + self.size
+
+    def properties_offset(self, data: bytes) -> int:
+        offset = self.data_offset
+        if isinstance(self.header, ActorHeader):
+            # parent object reference, then the component references
+            offset, _ = SFSaveDeserializer.parse_string(offset, data)
+            offset, _ = SFSaveDeserializer.parse_string(offset, data)
+            offset, component_count = SFSaveDeserializer.parse_u32(offset, data)
+            for _ in range(component_count * 2):
+                offset, _ = SFSaveDeserializer.parse_string(offset, data)
+        return offset
+
+    def iter_property_tags(self, data: bytes) -> collections.abc.Iterator[PropertyTag]:
+        return iter_property_tags(data, self.properties_offset(data))
+
+    def find_property(self, data: bytes, name: str, index: int = 0) -> PropertyTag | None:
+        for tag in self.iter_property_tags(data):
+            if tag.name == name and tag.index == index:
+                return tag
+        return None
+
+    def position_offset(self, data: bytes) -> int:
+        if not isinstance(self.header, ActorHeader):
+            msg = f"{self.instance_name} is not an actor"
+            raise TypeError(msg)
+        # header type, type path, root object, instance name, unknown, need_transform, rotation
+        offset = self.header_offset + 4
+        for _ in range(3):
+            offset, _ = SFSaveDeserializer.parse_string(offset, data)
+        return offset + 4 + 4 + 16
+
+
+def _locate_object(
+    d: SFSaveDeserializer,
+    header: ObjectHeaderType,
+    header_offset: int,
+    sublevel_name: str | None,
+) -> ObjectLocation:
+    object_offset = d.offset
+    d.offset += OBJECT_PREFIX_SIZE - 4
+    size = d.get_u32()
+    d.offset += size
+    return ObjectLocation(sublevel_name, header, header_offset, object_offset, size)
+
+
+def iter_level_locations(
+    d: SFSaveDeserializer,
+    *,
+    is_persistent: bool,
+    retain_headers: bool = True,
+) -> collections.abc.Iterator[tuple[str, typing.Any]]:
+    # level_iter for iter_save_file_body that yields an ObjectLocation per object instead of decoding it
+    sublevel_name: str | None = None
+
+    def _locate(d: SFSaveDeserializer, header: ObjectHeaderType, header_offset: int) -> ObjectLocation:
+        return _locate_object(d, header, header_offset, sublevel_name)
+
+    for name, value in iter_level(d, is_persistent=is_persistent, retain_headers=retain_headers, object_fn=_locate):
+        if name == "sublevel_name":
+            sublevel_name = value
+        yield name, value
+
+
+class ObjectIndex:
+    # Objects are keyed by (sublevel name, instance name). A bare instance name also works as a key
+    # as long as only one level has an object of that name; otherwise the lookup raises KeyError
+    # instead of picking one of them.
+    def __init__(self, locations: list[ObjectLocation]) -> None:
+        self.locations = locations
+        self.by_key: dict[ObjectKey, ObjectLocation] = {}
+        self.by_name: dict[str, list[ObjectLocation]] = {}
+        for location in locations:
+            self.by_key[location.key] = location
+            self.by_name.setdefault(location.instance_name, []).append(location)
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def __iter__(self) -> collections.abc.Iterator[ObjectLocation]:
+        return iter(self.locations)
+
+    def __getitem__(self, key: str | ObjectKey) -> ObjectLocation:
+        if isinstance(key, tuple):
+            return self.by_key[key]
+        locations = self.by_name[key]
+        if len(locations) > 1:
+            levels = ", ".join(repr(location.sublevel_name) for location in locations)
+            msg = f"{key} is in several levels ({levels}); look it up by (sublevel_name, instance_name)"
+            raise KeyError(msg)
+        return locations[0]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.by_key if isinstance(key, tuple) else key in self.by_name
+
+
+def build_object_index(des: SFSaveDeserializer) -> ObjectIndex:
+    # Walks the decompressed body decoding only object headers; object data is skipped by size.
+    locations: list[ObjectLocation] = []
+    for name, value in iter_save_file_body(des, retain_headers=False, level_iter=iter_level_locations):
+        match name:
+            case "sublevels":
+                for level in value:
+                    locations.extend(iter_level_objects(level))
+            case "persistent_level":
+                locations.extend(iter_level_objects(value))
+    return ObjectIndex(locations)
+
+
+def iter_level_objects(
+    fields: collections.abc.Iterable[tuple[str, typing.Any]],
+) -> collections.abc.Iterator[ObjectLocation]:
+    # the object locations of one level from iter_level_locations; the other fields are consumed
+    for name, value in fields:
+        if name == "objects":
+            yield from value
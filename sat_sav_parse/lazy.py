@@ -0,0 +1,30 @@
+import collections.abc
+import sys
+import typing
+
+__all__ = ("lazy_exports",)
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, tuple[str, ...]],
+) -> tuple[collections.abc.Callable[[str], typing.Any], collections.abc.Callable[[], list[str]]]:
+    # Returns a module __getattr__ and __dir__ that import a re-exported name's submodule on first
+    # access, so importing the package does not import (and build the pydantic schemas of) every
+    # submodule. The value is then stored on the package and later lookups skip __getattr__.
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> typing.Any:  # noqa: N807
+        module = modules.get(name)
+        if module is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        # __import__ rather than importlib.import_module, which bypasses -X importtime reporting
+        value = getattr(__import__(f"{package}{module}", fromlist=[name]), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *modules})
+
+    return __getattr__, __dir__
@@ -54,10 +54,21 @@ def get_struct_name(item: str | typing.Callable | functools.partial | typing.Any
     return repr(item)
 
 
-def repr_result(result: typing.Any) -> str:
-    if isinstance(result, bytes):
-        return result.hex(" ")
-    return repr(result)
+class LazyRepr:
+    __slots__ = ("value",)
+
+    def __init__(self, value: typing.Any) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        if isinstance(self.value, bytes):
+            return self.value.hex(" ")
+        return repr(self.value)
+
+
+def repr_result(result: typing.Any) -> LazyRepr:
+    # rendered only when the TRACE_BIN record is actually emitted
+    return LazyRepr(result)
 
 
 @contextlib.contextmanager
@@ -1,104 +1,120 @@
-import inspect
 import typing
 
-import pydantic
+from sat_sav_parse.lazy import lazy_exports
 
-from .compressed_save_file_body import CSaveFileBody, CSaveFileChunk
-from .level import Level
-from .level_grouping_grid import (
-    GridName,
-    LevelGroupingGrid,
-    LevelInfo,
-)
-from .level_object import (
-    ActorObject,
-    ComponentObject,
-    LevelObjectType,
-    deserialize_level_object,
-)
-from .object_header import (
-    ActorHeader,
-    ComponentHeader,
-    HeaderType,
-    ObjectHeaderType,
-    Quaternion,
-    Vector3,
-    deserialize_object_header,
-    serialize_object_header,
-)
-from .object_reference import ObjectReference
-from .properties import (
-    ArrayElementByte,
-    ArrayElementEnum,
-    ArrayElementFloat,
-    ArrayElementInt,
-    ArrayElementInt64,
-    ArrayElementInterface,
-    ArrayElementObject,
-    ArrayElementSoftObject,
-    ArrayElementStr,
-    ArrayElementStruct,
-    ArrayElementStructValueType,
-    ArrayElementType,
-    ArrayElementTypeName,
-    ArrayProperty,
-    BaseArrayElement,
-    BaseProperty,
-    BoolProperty,
-    Box,
-    ByteProperty,
-    ClientIdentityInfo,
-    ClientIdentityInfoIdentity,
-    ClientIdentityInfoIdentityVariant,
-    DateTime,
-    DoubleProperty,
-    EnumProperty,
-    FloatProperty,
-    FluidBox,
-    Int8Property,
-    Int64Property,
-    IntProperty,
-    InventoryItem,
-    KeyTypeName,
-    LinearColor,
-    MapKeyType,
-    MapKeyValue,
-    MapProperty,
-    NameProperty,
-    ObjectProperty,
-    PropertyType,
-    PropertyTypeName,
-    Quat,
-    RailroadTrackPosition,
-    SetProperty,
-    SetType,
-    SoftObjectProperty,
-    SpawnData,
-    StrProperty,
-    StructProperty,
-    StructTypeName,
-    TextArgument,
-    TextArgumentInt,
-    TextArgumentText,
-    TextArgumentType,
-    TextProperty,
-    TextPropertyHistoryType,
-    TextValue,
-    TextValueBase,
-    TextValueNone,
-    TextValueStringTableEntry,
-    TextValueTransform,
-    TextValueWithArguments,
-    UInt32Property,
-    ValueTypeName,
-    Vector,
-    deserialize_properties,
-    deserialize_text_argument,
-)
-from .save_file_body import SaveFileBody
-from .save_file_header import SaveFileHeader, SessionVisibility
+if typing.TYPE_CHECKING:
+    from .compressed_save_file_body import (
+        CSaveFileBody,
+        CSaveFileChunk,
+        CSaveFileChunkInfo,
+        CSaveFileChunkRecord,
+        chunk_digest,
+    )
+    from .level import Level, StreamedLevel, write_level
+    from .level_grouping_grid import (
+        GridName,
+        LevelGroupingGrid,
+        LevelInfo,
+    )
+    from .level_object import (
+        OBJECT_PREFIX_SIZE,
+        ActorObject,
+        ComponentObject,
+        LevelObjectType,
+        deserialize_level_object,
+    )
+    from .object_cache import DEFAULT_OBJECT_CACHE_SIZE, ObjectCache
+    from .object_header import (
+        ActorHeader,
+        ComponentHeader,
+        HeaderType,
+        ObjectHeaderType,
+        Quaternion,
+        Vector3,
+        deserialize_object_header,
+        serialize_object_header,
+    )
+    from .object_reference import ObjectReference
+    from .properties import (
+        ArrayElementByte,
+        ArrayElementEnum,
+        ArrayElementFloat,
+        ArrayElementInt,
+        ArrayElementInt64,
+        ArrayElementInterface,
+        ArrayElementObject,
+        ArrayElementSoftObject,
+        ArrayElementStr,
+        ArrayElementStruct,
+        ArrayElementStructValueType,
+        ArrayElementType,
+        ArrayElementTypeName,
+        ArrayProperty,
+        BaseArrayElement,
+        BaseProperty,
+        BoolProperty,
+        Box,
+        ByteProperty,
+        ClientIdentityInfo,
+        ClientIdentityInfoIdentity,
+        ClientIdentityInfoIdentityVariant,
+        DateTime,
+        DoubleProperty,
+        EnumProperty,
+        FloatProperty,
+        FluidBox,
+        Int8Property,
+        Int64Property,
+        IntProperty,
+        InventoryItem,
+        KeyTypeName,
+        LinearColor,
+        MapKeyType,
+        MapKeyValue,
+        MapProperty,
+        NameProperty,
+        ObjectProperty,
+        PropertyLayoutCache,
+        PropertyTag,
+        PropertyType,
+        PropertyTypeName,
+        Quat,
+        RailroadTrackPosition,
+        SetProperty,
+        SetType,
+        SoftObjectProperty,
+        SpawnData,
+        StrProperty,
+        StructProperty,
+        StructTypeName,
+        TextArgument,
+        TextArgumentInt,
+        TextArgumentText,
+        TextArgumentType,
+        TextProperty,
+        TextPropertyHistoryType,
+        TextValue,
+        TextValueBase,
+        TextValueNone,
+        TextValueStringTableEntry,
+        TextValueTransform,
+        TextValueWithArguments,
+        UInt32Property,
+        ValueTypeName,
+        Vector,
+        deserialize_properties,
+        deserialize_text_argument,
+        iter_property_tags,
+        property_layout_cache,
+        read_property_tag,
+        serialize_properties,
+    )
+    from .save_file_body import SaveFileBody, save_file_body_from_fields, write_save_file_body
+    from .save_file_header import SaveFileHeader, SessionVisibility
 
 __all__ = (
+    "DEFAULT_OBJECT_CACHE_SIZE",
+    "OBJECT_PREFIX_SIZE",
     "ActorHeader",
     "ActorObject",
     "ArrayElementByte",
@@ -122,6 +138,8 @@ __all__ = (
     "ByteProperty",
     "CSaveFileBody",
     "CSaveFileChunk",
+    "CSaveFileChunkInfo",
+    "CSaveFileChunkRecord",
     "ClientIdentityInfo",
     "ClientIdentityInfoIdentity",
     "ClientIdentityInfoIdentityVariant",
@@ -148,9 +166,12 @@ __all__ = (
     "MapKeyValue",
     "MapProperty",
     "NameProperty",
+    "ObjectCache",
     "ObjectHeaderType",
     "ObjectProperty",
     "ObjectReference",
+    "PropertyLayoutCache",
+    "PropertyTag",
     "PropertyType",
     "PropertyTypeName",
     "Quat",
@@ -164,6 +185,7 @@ __all__ = (
     "SoftObjectProperty",
     "SpawnData",
     "StrProperty",
+    "StreamedLevel",
     "StructProperty",
     "StructTypeName",
     "TextArgument",
@@ -182,16 +204,145 @@ __all__ = (
     "ValueTypeName",
     "Vector",
     "Vector3",
+    "chunk_digest",
     "deserialize_level_object",
     "deserialize_object_header",
     "deserialize_properties",
     "deserialize_text_argument",
+    "iter_property_tags",
+    "property_layout_cache",
+    "read_property_tag",
+    "save_file_body_from_fields",
     "serialize_object_header",
+    "serialize_properties",
+    "write_level",
+    "write_save_file_body",
 )
 
+# submodule -> names it provides, imported on first access; keep in sync with the imports above
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".compressed_save_file_body": (
+        "CSaveFileBody",
+        "CSaveFileChunk",
+        "CSaveFileChunkInfo",
+        "CSaveFileChunkRecord",
+        "chunk_digest",
+    ),
+    ".level": (
+        "Level",
+        "StreamedLevel",
+        "write_level",
+    ),
+    ".level_grouping_grid": (
+        "GridName",
+        "LevelGroupingGrid",
+        "LevelInfo",
+    ),
+    ".level_object": (
+        "OBJECT_PREFIX_SIZE",
+        "ActorObject",
+        "ComponentObject",
+        "LevelObjectType",
+        "deserialize_level_object",
+    ),
+    ".object_cache": (
+        "DEFAULT_OBJECT_CACHE_SIZE",
+        "ObjectCache",
+    ),
+    ".object_header": (
+        "ActorHeader",
+        "ComponentHeader",
+        "HeaderType",
+        "ObjectHeaderType",
+        "Quaternion",
+        "Vector3",
+        "deserialize_object_header",
+        "serialize_object_header",
+    ),
+    ".object_reference": ("ObjectReference",),
+    ".properties": (
+        "ArrayElementByte",
+        "ArrayElementEnum",
+        "ArrayElementFloat",
+        "ArrayElementInt",
+        "ArrayElementInt64",
+        "ArrayElementInterface",
+        "ArrayElementObject",
+        "ArrayElementSoftObject",
+        "ArrayElementStr",
+        "ArrayElementStruct",
+        "ArrayElementStructValueType",
+        "ArrayElementType",
+        "ArrayElementTypeName",
+        "ArrayProperty",
+        "BaseArrayElement",
+        "BaseProperty",
+        "BoolProperty",
+        "Box",
+        "ByteProperty",
+        "ClientIdentityInfo",
+        "ClientIdentityInfoIdentity",
+        "ClientIdentityInfoIdentityVariant",
+        "DateTime",
+        "DoubleProperty",
+        "EnumProperty",
+        "FloatProperty",
+        "FluidBox",
+        "Int8Property",
+        "Int64Property",
+        "IntProperty",
+        "InventoryItem",
+        "KeyTypeName",
+        "LinearColor",
+        "MapKeyType",
+        "MapKeyValue",
+        "MapProperty",
+        "NameProperty",
+        "ObjectProperty",
+        "PropertyLayoutCache",
+        "PropertyTag",
+        "PropertyType",
+        "PropertyTypeName",
+        "Quat",
+        "RailroadTrackPosition",
+        "SetProperty",
+        "SetType",
+        "SoftObjectProperty",
+        "SpawnData",
+        "StrProperty",
+        "StructProperty",
+        "StructTypeName",
+        "TextArgument",
+        "TextArgumentInt",
+        "TextArgumentText",
+        "TextArgumentType",
+        "TextProperty",
+        "TextPropertyHistoryType",
+        "TextValue",
+        "TextValueBase",
+        "TextValueNone",
+        "TextValueStringTableEntry",
+        "TextValueTransform",
+        "TextValueWithArguments",
+        "UInt32Property",
+        "ValueTypeName",
+        "Vector",
+        "deserialize_properties",
+        "deserialize_text_argument",
+        "iter_property_tags",
+        "property_layout_cache",
+        "read_property_tag",
+        "serialize_properties",
+    ),
+    ".save_file_body": (
+        "SaveFileBody",
+        "save_file_body_from_fields",
+        "write_save_file_body",
+    ),
+    ".save_file_header": (
+        "SaveFileHeader",
+        "SessionVisibility",
+    ),
+}
 
-for item_cls in filter(
-    lambda item: inspect.isclass(item) and issubclass(item, pydantic.BaseModel),
-    {**locals(), **globals()}.values(),
-):
-    typing.cast("type[pydantic.BaseModel]", item_cls).model_rebuild()
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,16 +1,44 @@
+import collections.abc
+import hashlib
 import logging
 import typing
 import zlib
 
 from sat_sav_parse.const import MAX_CHUNK_SIZE
 from sat_sav_parse.exceptions import ParseError
-
-if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
 logger = logging.getLogger(__name__)
 
-__all__ = ("CSaveFileBody", "CSaveFileChunk")
+__all__ = (
+    "CHUNK_HEADER_SIZE",
+    "CSaveFileBody",
+    "CSaveFileChunk",
+    "CSaveFileChunkInfo",
+    "CSaveFileChunkRecord",
+    "chunk_digest",
+)
+
+CHUNK_HEADER_SIZE: typing.Final[int] = 49
+
+
+class CSaveFileChunkInfo(typing.NamedTuple):
+    # position of the whole chunk record (header + compressed data) in the save file
+    offset: int
+    size: int
+    # position of the chunk's data in the decompressed body
+    body_offset: int
+    body_size: int
+
+
+class CSaveFileChunkRecord(typing.NamedTuple):
+    # digest of the uncompressed chunk data and the serialized chunk record (header + compressed data)
+    digest: bytes
+    record: bytes
+
+
+def chunk_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 class CSaveFileChunk(bytes):
@@ -32,7 +60,7 @@ class CSaveFileChunk(bytes):
         ser.add_raw(compressed)
 
     @classmethod
-    def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
+    def read_header(cls, des: "SFSaveDeserializer") -> tuple[int, int]:
         des.confirm_basic_type(des.parse_u32, 0x9E2A83C1)
         des.confirm_basic_type(des.parse_u32, 0x22222222)
         des.confirm_basic_type(des.parse_u8, 0)
@@ -46,7 +74,11 @@ class CSaveFileChunk(bytes):
             raise ParseError("invalid_file", "Compressed size mismatch")
         if uncompressed_size != des.get_u64():
             raise ParseError("invalid_file", "Uncompressed size mismatch")
+        return compressed_size, uncompressed_size
 
+    @classmethod
+    def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
+        compressed_size, uncompressed_size = cls.read_header(des)
         result = zlib.decompress(des.content[des.offset : des.offset + compressed_size])
         des.offset += compressed_size
 
@@ -57,16 +89,123 @@ class CSaveFileChunk(bytes):
 
 
 class CSaveFileBody(bytes):
-    def __serialize__(self, ser: "SFSaveSerializer") -> None:
-        data = memoryview(self)
-        total_chunks = (len(data) + MAX_CHUNK_SIZE - 1) // MAX_CHUNK_SIZE
+    # chunks of the save this body was read from, in order; a new chunk identical to the original chunk
+    # at the same position is written from here instead of being compressed again
+    reusable_chunks: tuple[CSaveFileChunkRecord, ...] = ()
+
+    def reuse_chunks(self, chunks: collections.abc.Iterable[CSaveFileChunkRecord]) -> typing.Self:
+        # sets the chunks on this body rather than on a copy of it; a lazy iterator such as
+        # iter_chunk_records is read once here (the records are only as large as the compressed
+        # save), so every later serialization reuses them. To stream, pass it to write_to instead.
+        self.reusable_chunks = tuple(chunks)
+        return self
+
+    @classmethod
+    def iter_records(
+        cls,
+        data: collections.abc.Buffer,
+        reusable_chunks: collections.abc.Iterable[CSaveFileChunkRecord] = (),
+    ) -> collections.abc.Iterator[bytes]:
+        # serialized chunk records of data; only one chunk is held at a time
+        view = memoryview(data)
+        originals = iter(reusable_chunks)
+        total_chunks = (len(view) + MAX_CHUNK_SIZE - 1) // MAX_CHUNK_SIZE
+        reused_chunks = 0
 
         logger.info("Serializing save body (%d chunks)", total_chunks)
 
-        for i in range(0, len(data), MAX_CHUNK_SIZE):
-            ser.add(CSaveFileChunk(data[i : i + MAX_CHUNK_SIZE]))
+        for i in range(0, len(view), MAX_CHUNK_SIZE):
+            chunk = view[i : i + MAX_CHUNK_SIZE]
+            original = next(originals, None)
+            if original is not None and original.digest == chunk_digest(chunk):
+                yield original.record
+                reused_chunks += 1
+            else:
+                yield SFSaveSerializer.get(CSaveFileChunk(chunk))
 
-        logger.info("Serialization complete")
+        logger.info("Serialization complete (%d chunks reused)", reused_chunks)
+
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        for record in self.iter_records(self, self.reusable_chunks):
+            ser.add_raw(record)
+
+    @classmethod
+    def write_to(
+        cls,
+        data: collections.abc.Buffer,
+        fp: typing.BinaryIO,
+        reusable_chunks: collections.abc.Iterable[CSaveFileChunkRecord] = (),
+    ) -> None:
+        fp.writelines(cls.iter_records(data, reusable_chunks))
+
+    @classmethod
+    def read_chunk_records(cls, des: "SFSaveDeserializer") -> list[CSaveFileChunkRecord]:
+        records: list[CSaveFileChunkRecord] = []
+        while des.offset < len(des.content):
+            start = des.offset
+            chunk = des.get(CSaveFileChunk)
+            records.append(CSaveFileChunkRecord(chunk_digest(chunk), bytes(des.content[start : des.offset])))
+        return records
+
+    @classmethod
+    def iter_chunk_records(cls, fp: typing.BinaryIO, offset: int) -> collections.abc.Iterator[CSaveFileChunkRecord]:
+        # Like read_chunk_records, but reads the chunks one at a time from an open save; fp must stay
+        # open until the iterator is exhausted.
+        for info in cls.scan_chunks(fp, offset):
+            fp.seek(info.offset)
+            record = fp.read(info.size)
+            yield CSaveFileChunkRecord(chunk_digest(SFSaveDeserializer(record).get(CSaveFileChunk)), record)
+
+    @classmethod
+    def scan_chunks(cls, fp: typing.BinaryIO, offset: int) -> list[CSaveFileChunkInfo]:
+        # Reads only the chunk headers, seeking over the compressed data.
+        chunks: list[CSaveFileChunkInfo] = []
+        body_offset = 0
+        fp.seek(offset)
+        while header := fp.read(CHUNK_HEADER_SIZE):
+            if len(header) < CHUNK_HEADER_SIZE:
+                raise ParseError("unexpected_end_of_data", "Truncated chunk header at offset {}", offset)
+            compressed_size, uncompressed_size = CSaveFileChunk.read_header(SFSaveDeserializer(header))
+            chunks.append(
+                CSaveFileChunkInfo(offset, CHUNK_HEADER_SIZE + compressed_size, body_offset, uncompressed_size),
+            )
+            offset += CHUNK_HEADER_SIZE + compressed_size
+            body_offset += uncompressed_size
+            fp.seek(offset)
+        return chunks
+
+    @classmethod
+    def iter_chunks(cls, des: "SFSaveDeserializer") -> collections.abc.Iterator[bytes]:
+        while des.offset < len(des.content):
+            yield des.get(CSaveFileChunk)
+
+    @classmethod
+    def decompress_to(cls, des: "SFSaveDeserializer", fp: typing.BinaryIO) -> int:
+        total_size = 0
+        chunk_count = 0
+
+        logger.info("Decompressing save body")
+        for chunk in cls.iter_chunks(des):
+            fp.write(chunk)
+            total_size += len(chunk)
+            chunk_count += 1
+
+        logger.info("Decompression complete (%d chunks, %d bytes)", chunk_count, total_size)
+        return total_size
+
+    @classmethod
+    def compress_to(cls, src: typing.BinaryIO, fp: typing.BinaryIO) -> int:
+        total_size = 0
+        chunk_count = 0
+
+        logger.info("Compressing save body")
+        while chunk := src.read(MAX_CHUNK_SIZE):
+            fp.write(SFSaveSerializer.get(CSaveFileChunk(chunk)))
+            total_size += len(chunk)
+            chunk_count += 1
+
+        logger.info("Compression complete (%d chunks, %d bytes)", chunk_count, total_size)
+        return total_size
 
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
@@ -1,4 +1,9 @@
+import array
+import collections
+import collections.abc
 import functools
+import shutil
+import tempfile
 import typing
 
 import pydantic
@@ -8,12 +13,27 @@ from sat_sav_parse.models.level_object import LevelObjectType, deserialize_level
 from sat_sav_parse.models.object_header import ObjectHeaderType, deserialize_object_header, serialize_object_header
 from sat_sav_parse.models.object_reference import ObjectReference
 from sat_sav_parse.progress import LogProgress
+from sat_sav_parse.structs import SFSaveSerializer
 from sat_sav_parse.utils import expect_size
 
 if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+    from sat_sav_parse.structs import SFSaveDeserializer
 
-__all__ = ("Level",)
+__all__ = (
+    "Level",
+    "LevelField",
+    "LevelIterFn",
+    "LevelObjectFn",
+    "StreamedLevel",
+    "deserialize_level",
+    "iter_level",
+    "level_from_fields",
+    "write_level",
+)
+
+# serialized objects of a StreamedLevel stay in memory up to this size before spilling to disk
+_OBJECT_SPOOL_SIZE: typing.Final[int] = 64 * 1024 * 1024
+_WRITE_BUFFER_SIZE: typing.Final[int] = 1024 * 1024
 
 
 class Level(pydantic.BaseModel):
@@ -31,80 +51,196 @@ class Level(pydantic.BaseModel):
     def __serialize__(self, ser: "SFSaveSerializer") -> None:
         if self.sublevel_name is not None:
             ser.add_string(self.sublevel_name)
-        ser.add_u64(self.object_header_and_collectables_size)
-        ser.add_u32(len(self.object_headers))
+
+        headers = SFSaveSerializer()
+        headers.add_u32(len(self.object_headers))
         for object_header in self.object_headers:
-            ser.add_fn(serialize_object_header, object_header)
+            headers.add_fn(serialize_object_header, object_header)
         if self.extra_level_names_count is not None:
-            ser.add_u32(self.extra_level_names_count)
+            headers.add_u32(self.extra_level_names_count)
         if self.extra_level_names is not None:
-            ser.add_string(self.extra_level_names)
-        ser.add_u32(len(self.collectables))
+            headers.add_string(self.extra_level_names)
+        headers.add_u32(len(self.collectables))
         for collectable in self.collectables:
-            ser.add(collectable)
-        ser.add_u64(len(self.objects))
+            headers.add(collectable)
+        ser.add_u64(len(headers.buffer))
+        ser.add_raw(headers.buffer)
+
+        objects = SFSaveSerializer()
+        objects.add_u32(len(self.objects))
         for obj in self.objects:
-            ser.add(obj)
+            objects.add(obj)
+        ser.add_u64(len(objects.buffer))
+        ser.add_raw(objects.buffer)
+
         ser.add_u32(self.save_version)
-        ser.add_u32(len(self.second_collectables))
-        for collectable in self.second_collectables:
-            ser.add(collectable)
+        if self.sublevel_name is not None:
+            ser.add_u32(len(self.second_collectables))
+            for collectable in self.second_collectables:
+                ser.add(collectable)
 
 
-@set_struct_name("Level")
-def deserialize_level(d: "SFSaveDeserializer", *, is_persistent: bool) -> Level:
-    sublevel_name = d.get_string() if not is_persistent else None
+class StreamedLevel(typing.NamedTuple):
+    # A level whose objects are produced lazily; write_level() writes the same bytes as the Level
+    # holding these objects. The object headers are taken from the objects themselves.
+    sublevel_name: str | None
+    objects: collections.abc.Iterable[LevelObjectType]
+    collectables: list[ObjectReference]
+    save_version: int
+    second_collectables: list[ObjectReference]
+    extra_level_names_count: int | None = None
+    extra_level_names: str | None = None
+
+
+def write_level(fp: typing.BinaryIO, level: Level | StreamedLevel) -> int:
+    # Writes the bytes of Level.__serialize__. A StreamedLevel holds one object at a time: its
+    # headers go straight to fp and its serialized objects, which follow all the headers in the
+    # save, to a spool file. The counts and size prefixes are patched in once the objects are
+    # exhausted, so fp must be seekable.
+    if isinstance(level, Level):
+        data = SFSaveSerializer().add(level).buffer
+        fp.write(data)
+        return len(data)
+
+    start = fp.tell()
+    if level.sublevel_name is not None:
+        fp.write(SFSaveSerializer().add_string(level.sublevel_name).buffer)
+    headers_start = fp.tell()
+    # header block size and object count, patched below
+    fp.write(bytes(12))
+    count = 0
+    with tempfile.SpooledTemporaryFile(max_size=_OBJECT_SPOOL_SIZE) as spool:
+        headers, objects = SFSaveSerializer(), SFSaveSerializer()
+        for obj in level.objects:
+            headers.add_fn(serialize_object_header, obj.header)
+            objects.add(obj)
+            count += 1
+            if len(headers.buffer) + len(objects.buffer) >= _WRITE_BUFFER_SIZE:
+                fp.write(headers.buffer)
+                spool.write(objects.buffer)
+                headers, objects = SFSaveSerializer(), SFSaveSerializer()
+        if level.extra_level_names_count is not None:
+            headers.add_u32(level.extra_level_names_count)
+        if level.extra_level_names is not None:
+            headers.add_string(level.extra_level_names)
+        headers.add_u32(len(level.collectables))
+        for collectable in level.collectables:
+            headers.add(collectable)
+        fp.write(headers.buffer)
+        spool.write(objects.buffer)
+        headers_end = fp.tell()
+
+        fp.write(SFSaveSerializer().add_u64(spool.tell() + 4).add_u32(count).buffer)
+        spool.seek(0)
+        shutil.copyfileobj(spool, fp)
+
+    tail = SFSaveSerializer().add_u32(level.save_version)
+    if level.sublevel_name is not None:
+        tail.add_u32(len(level.second_collectables))
+        for collectable in level.second_collectables:
+            tail.add(collectable)
+    fp.write(tail.buffer)
+    end = fp.tell()
+    fp.seek(headers_start)
+    fp.write(SFSaveSerializer().add_u64(headers_end - headers_start - 8).add_u32(count).buffer)
+    fp.seek(end)
+    return end - start
+
+
+type LevelField = tuple[str, typing.Any]
+type LevelIterFn = collections.abc.Callable[..., collections.abc.Iterator[LevelField]]
+# (deserializer positioned at the object, its header, offset of that header) -> decoded object
+type LevelObjectFn = collections.abc.Callable[["SFSaveDeserializer", ObjectHeaderType, int], typing.Any]
+
+
+def _deserialize_level_object(
+    d: "SFSaveDeserializer",
+    header: ObjectHeaderType,
+    _header_offset: int,
+) -> LevelObjectType:
+    return d.get_fn(functools.partial(deserialize_level_object, header=header))
+
+
+def iter_level(
+    d: "SFSaveDeserializer",
+    *,
+    is_persistent: bool,
+    retain_headers: bool = True,
+    object_fn: LevelObjectFn = _deserialize_level_object,
+) -> collections.abc.Iterator[LevelField]:
+    # Yields (Level field name, value) pairs in serialization order. "object_headers" and "objects" are
+    # yielded as iterators that must be consumed before the next pair is requested; without
+    # retain_headers only header offsets are kept and each object's header is decoded again.
+    # object_fn decodes (or skips) each object in place of deserialize_level_object.
+    yield "sublevel_name", d.get_string() if not is_persistent else None
     object_header_and_collectables_size = d.get_u64()
+    yield "object_header_and_collectables_size", object_header_and_collectables_size
     object_header_and_collectable_start = d.offset
     object_header_count = d.get_u32()
-    object_headers = [d.get_fn(deserialize_object_header) for _ in range(object_header_count)]
+
+    header_offsets = array.array("Q")
+    object_headers: list[ObjectHeaderType] = []
+
+    def _iter_object_headers() -> collections.abc.Iterator[ObjectHeaderType]:
+        for _ in range(object_header_count):
+            header_offsets.append(d.offset)
+            object_header = d.get_fn(deserialize_object_header)
+            if retain_headers:
+                object_headers.append(object_header)
+            yield object_header
+
+    headers_iter = _iter_object_headers()
+    yield "object_headers", headers_iter
+    collections.deque(headers_iter, maxlen=0)
 
     extra_level_names_count = d.get_u32_bool() if is_persistent else None
-    extra_level_names = d.get_string() if is_persistent and extra_level_names_count else None
+    yield "extra_level_names_count", extra_level_names_count
+    yield "extra_level_names", d.get_string() if is_persistent and extra_level_names_count else None
     actual_size = d.offset - object_header_and_collectable_start
 
     if object_header_and_collectables_size != actual_size:
         collectables_count = d.get_u32()
-        collectables = [d.get(ObjectReference) for _ in range(collectables_count)]
+        yield "collectables", [d.get(ObjectReference) for _ in range(collectables_count)]
     else:
-        collectables = []
+        yield "collectables", []
 
     objects_size = d.get_u64()
-    with expect_size(
-        d,
-        objects_size,
-        "Level.objects",
-    ):
-        objects_count = d.get_u32()
-        objects = [
-            d.get_fn(functools.partial(deserialize_level_object, header=object_headers[idx]))
+    yield "objects_size", objects_size
+
+    def _iter_objects() -> collections.abc.Iterator[typing.Any]:
+        with expect_size(d, objects_size, "Level.objects"):
+            objects_count = d.get_u32()
             for idx in (
-                LogProgress.iter(
-                    range(objects_count),
-                    total=objects_count,
-                    desc="persistent level objects",
-                )
+                LogProgress.iter(range(objects_count), total=objects_count, desc="persistent level objects")
                 if is_persistent
                 else range(objects_count)
-            )
-        ]
+            ):
+                object_header = (
+                    object_headers[idx]
+                    if retain_headers
+                    else d.parse_fn(header_offsets[idx], d.content, deserialize_object_header)
+                )
+                yield object_fn(d, object_header, header_offsets[idx])
+
+    objects_iter = _iter_objects()
+    yield "objects", objects_iter
+    collections.deque(objects_iter, maxlen=0)
 
-    save_version = d.get_u32()
+    yield "save_version", d.get_u32()
 
     if not is_persistent:
         second_collectables_count = d.get_u32()
-        second_collectables = [d.get(ObjectReference) for _ in range(second_collectables_count)]
+        yield "second_collectables", [d.get(ObjectReference) for _ in range(second_collectables_count)]
     else:
-        second_collectables = []
+        yield "second_collectables", []
+
+
+def level_from_fields(fields: collections.abc.Iterable[LevelField]) -> Level:
     return Level(
-        sublevel_name=sublevel_name,
-        object_header_and_collectables_size=object_header_and_collectables_size,
-        object_headers=object_headers,
-        extra_level_names_count=extra_level_names_count,
-        extra_level_names=extra_level_names,
-        collectables=collectables,
-        objects_size=objects_size,
-        objects=objects,
-        save_version=save_version,
-        second_collectables=second_collectables,
+        **{name: list(value) if name in {"object_headers", "objects"} else value for name, value in fields},
     )
+
+
+@set_struct_name("Level")
+def deserialize_level(d: "SFSaveDeserializer", *, is_persistent: bool) -> Level:
+    return level_from_fields(iter_level(d, is_persistent=is_persistent))
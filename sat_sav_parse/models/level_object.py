@@ -6,19 +6,24 @@ import pydantic
 from sat_sav_parse.logger import set_struct_name
 from sat_sav_parse.models.object_header import ActorHeader, ComponentHeader, HeaderType, ObjectHeaderType
 from sat_sav_parse.models.object_reference import ObjectReference
-from sat_sav_parse.models.properties import PropertyType, deserialize_properties
-from sat_sav_parse.utils import b64_bytes, expect_size
+from sat_sav_parse.models.properties import PropertyType, deserialize_properties, serialize_properties
+from sat_sav_parse.structs import SFSaveSerializer
+from sat_sav_parse.utils import RawBytes, expect_size
 
 if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+    from sat_sav_parse.structs import SFSaveDeserializer
 
 __all__ = (
+    "OBJECT_PREFIX_SIZE",
     "ActorObject",
     "ComponentObject",
     "LevelObjectType",
     "deserialize_level_object",
 )
 
+# save_version, flag and size of a level object
+OBJECT_PREFIX_SIZE: typing.Final[int] = 12
+
 
 class ActorObject(pydantic.BaseModel):
     type: typing.Literal[HeaderType.ACTOR] = HeaderType.ACTOR
@@ -29,19 +34,22 @@ class ActorObject(pydantic.BaseModel):
     parent_object_reference: ObjectReference
     components: list[ObjectReference]
     properties: list[PropertyType]
-    trailing: pydantic.Base64Bytes  # TODO: КАЖЕТСЯ ЭТО ЧТО-ТО ЗНАЧИТ
+    trailing: RawBytes  # TODO: КАЖЕТСЯ ЭТО ЧТО-ТО ЗНАЧИТ
 
     def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        data = SFSaveSerializer()
+        data.add(self.parent_object_reference)
+        data.add_u32(len(self.components))
+        for component in self.components:
+            data.add(component)
+        data.add_fn(serialize_properties, self.properties)
+        data.add_u32(0)
+        data.add_raw(self.trailing)
+
         ser.add_u32(self.save_version)
         ser.add_u32(self.flag)
-        ser.add_u32(self.size)
-        ser.add(self.parent_object_reference)
-        for component in self.components:
-            ser.add(component)
-        for prop in self.properties:
-            ser.add(prop)
-        ser.add_u32(0)
-        ser.add_raw(self.trailing)
+        ser.add_u32(len(data.buffer))
+        ser.add_raw(data.buffer)
 
     @classmethod
     @set_struct_name("ActorObject")
@@ -53,7 +61,7 @@ class ActorObject(pydantic.BaseModel):
             start_offset = des.offset
             parent_object_reference = des.get(ObjectReference)
             components = [des.get(ObjectReference) for _ in range(des.get_u32())]
-            properties = des.get_fn(deserialize_properties)
+            properties = des.get_fn(functools.partial(deserialize_properties, layout_key=header.type_path))
             des.get_u32()
             remaining_size = size - (des.offset - start_offset)
             trailing = des.get_item(remaining_size)
@@ -66,7 +74,7 @@ class ActorObject(pydantic.BaseModel):
             parent_object_reference=parent_object_reference,
             components=components,
             properties=properties,
-            trailing=b64_bytes(trailing),  # type: ignore
+            trailing=trailing,
         )
 
 
@@ -77,16 +85,18 @@ class ComponentObject(pydantic.BaseModel):
     flag: int
     size: int
     properties: list[PropertyType]
-    trailing: pydantic.Base64Bytes  # TODO: КАЖЕТСЯ ЭТО ЧТО-ТО ЗНАЧИТ
+    trailing: RawBytes  # TODO: КАЖЕТСЯ ЭТО ЧТО-ТО ЗНАЧИТ
 
     def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        data = SFSaveSerializer()
+        data.add_fn(serialize_properties, self.properties)
+        data.add_u32(0)
+        data.add_raw(self.trailing)
+
         ser.add_u32(self.save_version)
         ser.add_u32(self.flag)
-        ser.add_u32(self.size)
-        for prop in self.properties:
-            ser.add(prop)
-        ser.add_u32(0)
-        ser.add_raw(self.trailing)
+        ser.add_u32(len(data.buffer))
+        ser.add_raw(data.buffer)
 
     @classmethod
     @set_struct_name("ComponentObject")
@@ -96,7 +106,7 @@ class ComponentObject(pydantic.BaseModel):
         size = des.get_u32()
         with expect_size(des, size, "ComponentObject"):
             start_offset = des.offset
-            properties = des.get_fn(deserialize_properties)
+            properties = des.get_fn(functools.partial(deserialize_properties, layout_key=header.type_path))
             des.get_u32()
             trailing_size = size - (des.offset - start_offset)
             trailing = des.get_item(trailing_size)
@@ -108,7 +118,7 @@ class ComponentObject(pydantic.BaseModel):
             flag=flag,
             size=size,
             properties=properties,
-            trailing=b64_bytes(trailing),  # type: ignore
+            trailing=trailing,
         )
 
 
@@ -0,0 +1,85 @@
+import collections
+import functools
+import hashlib
+import pickle
+import typing
+
+from sat_sav_parse.models.level_object import OBJECT_PREFIX_SIZE, LevelObjectType, deserialize_level_object
+from sat_sav_parse.models.object_header import HeaderType, ObjectHeaderType
+
+if typing.TYPE_CHECKING:
+    from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "DEFAULT_OBJECT_CACHE_SIZE",
+    "ObjectCache",
+)
+
+DEFAULT_OBJECT_CACHE_SIZE: typing.Final[int] = 256 * 1024 * 1024
+
+type ObjectCacheKey = tuple[HeaderType, str, bytes]
+
+
+class ObjectCache:
+    # Decoded level objects keyed by (header type, type path, hash of the object's raw bytes), kept
+    # across parses so objects that did not change between two saves are decoded only once.
+    # Entries are stored pickled, without their header: every hit unpickles a fresh object for the
+    # caller, so callers may edit what they get without changing later parses, and the object returned
+    # by a miss is never shared with the cache. max_size bounds the total size of the pickled entries,
+    # which is what the cache actually holds (about 3x the objects' raw bytes; a decoded object takes
+    # roughly 15x its raw size); least recently used entries are evicted. Pickling on a miss is
+    # cheaper than keeping a deep copy; unpickling a hit is slower than a copy but about half the
+    # cost of decoding the object again.
+    def __init__(self, max_size: int = DEFAULT_OBJECT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[ObjectCacheKey, bytes] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def deserialize(
+        self,
+        d: "SFSaveDeserializer",
+        header: ObjectHeaderType,
+        _header_offset: int = 0,
+    ) -> LevelObjectType:
+        start = d.offset
+        _, size = d.parse_u32(start + OBJECT_PREFIX_SIZE - 4, d.content)
+        end = start + OBJECT_PREFIX_SIZE + size
+        key = (header.type, header.type_path, hashlib.blake2b(d.content[start:end], digest_size=16).digest())
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            d.offset = end
+            obj = pickle.loads(entry)  # noqa: S301 - only ever holds what this cache pickled itself
+            obj.header = header
+            return obj
+
+        self.misses += 1
+        obj = d.get_fn(functools.partial(deserialize_level_object, header=header))
+        entry = pickle.dumps(obj.model_copy(update={"header": None}), pickle.HIGHEST_PROTOCOL)
+        if len(entry) <= self.max_size:
+            self._entries[key] = entry
+            self.size += len(entry)
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+        return obj
@@ -105,10 +105,10 @@ class ActorHeader(pydantic.BaseModel):
         ser.add_string(self.root_object)
         ser.add_string(self.instance_name)
         ser.add_u32(self.unknown)
+        ser.add_u32_bool(self.need_transform)
         ser.add(self.rotation)
         ser.add(self.position)
         ser.add(self.scale)
-        ser.add_u32_bool(self.need_transform)
         ser.add_u32_bool(self.was_placed_in_level)
 
     @classmethod
@@ -1,8 +1,11 @@
+import inspect
 import typing
 
 import pydantic
 
+from sat_sav_parse.exceptions import ParseError
 from sat_sav_parse.logger import set_struct_name
+from sat_sav_parse.utils import parse_str_enum
 
 from .array import (
     ArrayElementByte,
@@ -26,6 +29,7 @@ from .enums import (
     PropertyTypeName,
     StructTypeName,
 )
+from .layout_cache import PropertyLayoutCache, PropertyLayoutEntry, property_layout_cache
 from .map import (
     KeyTypeName,
     MapKeyType,
@@ -50,6 +54,7 @@ from .simple_preperties import (
     UInt32Property,
 )
 from .struct import StructProperty
+from .tag import PropertyTag, iter_property_tags, read_property_tag
 from .text import (
     TextArgument,
     TextArgumentInt,
@@ -81,10 +86,11 @@ from .typed_data import (
 )
 
 if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer
+    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
 
 __all__ = (
+    "PROPERTY_CLASSES",
     "ArrayElementByte",
     "ArrayElementEnum",
     "ArrayElementFloat",
@@ -123,6 +129,9 @@ __all__ = (
     "MapProperty",
     "NameProperty",
     "ObjectProperty",
+    "PropertyLayoutCache",
+    "PropertyLayoutEntry",
+    "PropertyTag",
     "PropertyType",
     "PropertyTypeName",
     "Quat",
@@ -151,6 +160,10 @@ __all__ = (
     "Vector",
     "deserialize_properties",
     "deserialize_text_argument",
+    "iter_property_tags",
+    "property_layout_cache",
+    "read_property_tag",
+    "serialize_properties",
 )
 
 type PropertyType = typing.Annotated[
@@ -176,54 +189,83 @@ type PropertyType = typing.Annotated[
 ]
 
 
+PROPERTY_CLASSES: dict[PropertyTypeName, type[BaseProperty]] = {
+    PropertyTypeName.ARRAY: ArrayProperty,
+    PropertyTypeName.BOOL: BoolProperty,
+    PropertyTypeName.BYTE: ByteProperty,
+    PropertyTypeName.ENUM: EnumProperty,
+    PropertyTypeName.FLOAT: FloatProperty,
+    PropertyTypeName.DOUBLE: DoubleProperty,
+    PropertyTypeName.INT: IntProperty,
+    PropertyTypeName.INT8: Int8Property,
+    PropertyTypeName.U_INT32: UInt32Property,
+    PropertyTypeName.INT64: Int64Property,
+    PropertyTypeName.NAME: NameProperty,
+    PropertyTypeName.OBJECT: ObjectProperty,
+    PropertyTypeName.SOFT_OBJECT: SoftObjectProperty,
+    PropertyTypeName.STR: StrProperty,
+    PropertyTypeName.TEXT: TextProperty,
+    PropertyTypeName.SET: SetProperty,
+    PropertyTypeName.STRUCT: StructProperty,
+    PropertyTypeName.MAP: MapProperty,
+}
+
+_NONE_TAG: typing.Final[bytes] = b"\x05\x00\x00\x00None\x00"
+
+
 @set_struct_name("PropertyList")
-def deserialize_properties(des: "SFSaveDeserializer") -> list[PropertyType]:
+def deserialize_properties(des: "SFSaveDeserializer", layout_key: str | None = None) -> list[PropertyType]:
     properties = []
+    layout = property_layout_cache.get(layout_key)
+    observed: list[PropertyLayoutEntry] = []
+
+    if layout is not None:
+        content = des.content
+        for entry in layout:
+            tag, property_cls = entry
+            if content[des.offset : des.offset + len(tag)] != tag:
+                break
+            properties.append(des.get(property_cls))  # type: ignore
+            observed.append(entry)
+        else:
+            if content[des.offset : des.offset + len(_NONE_TAG)] == _NONE_TAG:
+                des.offset += len(_NONE_TAG)
+                property_layout_cache.hits += 1
+                return properties
 
     while True:
-        next_offset, name = des.parse_string(des.offset, des.content)
+        start = des.offset
+        next_offset, name = des.parse_string(start, des.content)
         if name == "None":
             des.offset = next_offset
             break
-        property_type = des.parse(next_offset, des.content, PropertyTypeName)
-
-        match property_type:
-            case PropertyTypeName.ARRAY:
-                properties.append(des.get(ArrayProperty))
-            case PropertyTypeName.BOOL:
-                properties.append(des.get(BoolProperty))
-            case PropertyTypeName.BYTE:
-                properties.append(des.get(ByteProperty))
-            case PropertyTypeName.ENUM:
-                properties.append(des.get(EnumProperty))
-            case PropertyTypeName.FLOAT:
-                properties.append(des.get(FloatProperty))
-            case PropertyTypeName.DOUBLE:
-                properties.append(des.get(DoubleProperty))
-            case PropertyTypeName.INT:
-                properties.append(des.get(IntProperty))
-            case PropertyTypeName.INT8:
-                properties.append(des.get(Int8Property))
-            case PropertyTypeName.U_INT32:
-                properties.append(des.get(UInt32Property))
-            case PropertyTypeName.INT64:
-                properties.append(des.get(Int64Property))
-            case PropertyTypeName.NAME:
-                properties.append(des.get(NameProperty))
-            case PropertyTypeName.OBJECT:
-                properties.append(des.get(ObjectProperty))
-            case PropertyTypeName.SOFT_OBJECT:
-                properties.append(des.get(SoftObjectProperty))
-            case PropertyTypeName.STR:
-                properties.append(des.get(StrProperty))
-            case PropertyTypeName.TEXT:
-                properties.append(des.get(TextProperty))
-            case PropertyTypeName.SET:
-                properties.append(des.get(SetProperty))
-            case PropertyTypeName.STRUCT:
-                properties.append(des.get(StructProperty))
-            case PropertyTypeName.MAP:
-                properties.append(des.get(MapProperty))
-            case _:
-                typing.assert_never(property_type)
+        try:
+            tag_end, type_name = parse_str_enum(next_offset, des.content, PropertyTypeName)
+        except ParseError:
+            raise
+        except ValueError as exc:
+            raise ParseError("unsupported_property_type", "Property {} has an unsupported type: {}", name, exc) from exc
+        property_cls = PROPERTY_CLASSES[type_name]
+        properties.append(des.get(property_cls))  # type: ignore
+        if layout_key is not None:
+            observed.append((des.content[start:tag_end], property_cls))
+
+    if layout_key is not None:
+        property_layout_cache.misses += 1
+        property_layout_cache.put(layout_key, tuple(observed))
     return properties
+
+
+def serialize_properties(ser: "SFSaveSerializer", properties: list[PropertyType]) -> None:
+    for prop in properties:
+        ser.add(prop)  # type: ignore
+    ser.add_string("None")
+
+
+# Property models refer to each other through PropertyType, StructValue and TextValue, which only all
+# exist once this package is imported; models outside it are complete as soon as they are defined.
+for item_cls in filter(
+    lambda item: inspect.isclass(item) and issubclass(item, pydantic.BaseModel),
+    {**locals(), **globals()}.values(),
+):
+    typing.cast("type[pydantic.BaseModel]", item_cls).model_rebuild()
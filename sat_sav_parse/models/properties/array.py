@@ -14,11 +14,12 @@ from sat_sav_parse.models.properties.enums import (
 from sat_sav_parse.models.properties.typed_data import (
     StructValue,
     deserialize_struct_value,
+    serialize_struct_value,
 )
-from sat_sav_parse.utils import b64_bytes, expect_size
+from sat_sav_parse.utils import RawBytes, expect_size
 
 if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer
+    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
 
 __all__ = (
@@ -50,6 +51,11 @@ class BaseArrayElement[T](pydantic.BaseModel):
 class ArrayElementByte(BaseArrayElement[list[int]]):
     type: typing.Literal[ArrayElementTypeName.BYTE] = ArrayElementTypeName.BYTE
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add_u8(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -63,6 +69,11 @@ class ArrayElementByte(BaseArrayElement[list[int]]):
 class ArrayElementEnum(BaseArrayElement[list[str]]):
     type: typing.Literal[ArrayElementTypeName.ENUM] = ArrayElementTypeName.ENUM
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add_string(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -76,6 +87,11 @@ class ArrayElementEnum(BaseArrayElement[list[str]]):
 class ArrayElementStr(BaseArrayElement[list[str]]):
     type: typing.Literal[ArrayElementTypeName.STR] = ArrayElementTypeName.STR
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add_string(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -89,6 +105,11 @@ class ArrayElementStr(BaseArrayElement[list[str]]):
 class ArrayElementInterface(BaseArrayElement[list[ObjectReference]]):
     type: typing.Literal[ArrayElementTypeName.INTERFACE] = ArrayElementTypeName.INTERFACE
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -102,6 +123,11 @@ class ArrayElementInterface(BaseArrayElement[list[ObjectReference]]):
 class ArrayElementObject(BaseArrayElement[list[ObjectReference]]):
     type: typing.Literal[ArrayElementTypeName.OBJECT] = ArrayElementTypeName.OBJECT
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -115,6 +141,11 @@ class ArrayElementObject(BaseArrayElement[list[ObjectReference]]):
 class ArrayElementInt(BaseArrayElement[list[int]]):
     type: typing.Literal[ArrayElementTypeName.INT] = ArrayElementTypeName.INT
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add_i32(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -128,6 +159,11 @@ class ArrayElementInt(BaseArrayElement[list[int]]):
 class ArrayElementInt64(BaseArrayElement[list[int]]):
     type: typing.Literal[ArrayElementTypeName.INT64] = ArrayElementTypeName.INT64
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add_i64(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -141,6 +177,11 @@ class ArrayElementInt64(BaseArrayElement[list[int]]):
 class ArrayElementFloat(BaseArrayElement[list[float]]):
     type: typing.Literal[ArrayElementTypeName.FLOAT] = ArrayElementTypeName.FLOAT
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for element in self.elements:
+            ser.add_float(element)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -154,6 +195,12 @@ class ArrayElementFloat(BaseArrayElement[list[float]]):
 class ArrayElementSoftObject(BaseArrayElement[list[tuple[ObjectReference, int]]]):
     type: typing.Literal[ArrayElementTypeName.SOFT_OBJECT] = ArrayElementTypeName.SOFT_OBJECT
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(len(self.elements))
+        for reference, value in self.elements:
+            ser.add(reference)
+            ser.add_u32(value)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         length = des.get_u32()
@@ -164,7 +211,7 @@ class ArrayElementSoftObject(BaseArrayElement[list[tuple[ObjectReference, int]]]
         )
 
 
-type ArrayElementStructValueType = list[StructValue] | pydantic.Base64Bytes
+type ArrayElementStructValueType = list[StructValue] | RawBytes
 
 
 class ArrayElementStruct(BaseArrayElement[ArrayElementStructValueType]):
@@ -173,7 +220,21 @@ class ArrayElementStruct(BaseArrayElement[ArrayElementStructValueType]):
     type_name: str
     payload_size: int
     element_type: StructTypeName
-    uuid: pydantic.Base64Bytes
+    uuid: RawBytes
+
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(self.length)
+        ser.add_string(self.name)
+        ser.add_string(self.type_name)
+        ser.add_u32(self.payload_size)
+        ser.add_u32(0)
+        ser.add(self.element_type)
+        ser.add_raw(self.uuid)
+        if isinstance(self.elements, bytes):
+            ser.add_raw(self.elements)
+        else:
+            for element in self.elements:
+                ser.add_fn(serialize_struct_value, element)
 
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
@@ -206,12 +267,12 @@ class ArrayElementStruct(BaseArrayElement[ArrayElementStructValueType]):
                 elements.append(element)
         return cls(
             length=length,
-            elements=b64_bytes(elements),
+            elements=elements,
             name=name,
             type_name=type_name,
             payload_size=payload_size,
             element_type=element_type,
-            uuid=b64_bytes(uuid),
+            uuid=uuid,
         )
 
 
@@ -234,6 +295,15 @@ class ArrayProperty(BaseProperty[ArrayElementType]):
     type_name: typing.Literal[PropertyTypeName.ARRAY] = PropertyTypeName.ARRAY
     index: int
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_string(self.name)
+        ser.add(self.type_name)
+        ser.add_u32(self.payload_size)
+        ser.add_u32(self.index)
+        ser.add(self.payload.type)
+        ser.add_u8(0)
+        ser.add(self.payload)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         name = des.get_string()
@@ -0,0 +1,46 @@
+import typing
+
+from sat_sav_parse.models.properties.base import BaseProperty
+
+__all__ = (
+    "PropertyLayoutCache",
+    "PropertyLayoutEntry",
+    "property_layout_cache",
+)
+
+# raw property tag (length-prefixed name and type strings) -> property class
+type PropertyLayoutEntry = tuple[bytes, type[BaseProperty]]
+
+
+class PropertyLayoutCache:
+    def __init__(self, max_layouts: int = 16384) -> None:
+        self.max_layouts = max_layouts
+        self.hits = 0
+        self.misses = 0
+        self._layouts: dict[str, tuple[PropertyLayoutEntry, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def get(self, key: str | None) -> tuple[PropertyLayoutEntry, ...] | None:
+        if key is None:
+            return None
+        return self._layouts.get(key)
+
+    def put(self, key: str, layout: tuple[PropertyLayoutEntry, ...]) -> None:
+        if key not in self._layouts and len(self._layouts) >= self.max_layouts:
+            return
+        self._layouts[key] = layout
+
+    def clear(self) -> None:
+        self._layouts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+property_layout_cache: typing.Final[PropertyLayoutCache] = PropertyLayoutCache()
@@ -1,22 +1,32 @@
 import enum
+import struct
 import typing
 
+import pydantic
+
 from sat_sav_parse.models.properties.array import ObjectReference
 from sat_sav_parse.models.properties.base import BaseProperty
 from sat_sav_parse.models.properties.enums import PropertyTypeName, StrEnumSerializerMixin
 from sat_sav_parse.models.properties.text import TextProperty, TextValue
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 from sat_sav_parse.utils import StrEnumDeserializerMixin, expect_size
 
 if typing.TYPE_CHECKING:
     from sat_sav_parse.models.properties import PropertyType
-    from sat_sav_parse.structs import SFSaveDeserializer
+    from sat_sav_parse.structs import SFSaveDeserializeFn, SFSaveSerializeFn
 
 __all__ = (
+    "MAP_ITEMS_CONTEXT",
     "KeyTypeName",
     "MapKeyType",
     "MapKeyValue",
     "MapProperty",
     "ValueTypeName",
+    "deserialize_fixed_width_map",
+    "map_key_deserializer",
+    "map_key_serializer",
+    "map_value_deserializer",
+    "map_value_serializer",
 )
 
 
@@ -43,9 +53,174 @@ class ValueTypeName(StrEnumSerializerMixin, StrEnumDeserializerMixin, enum.StrEn
     STRUCT = "StructProperty"
 
 
+# serialization context key: when set, map payloads are dumped as [key, value] pairs, which keep int and
+# tuple keys through JSON; validation accepts both forms
+MAP_ITEMS_CONTEXT: typing.Final[str] = "map_items"
+
 type MapKeyType = tuple[str, str] | int | str | tuple[int, int, int]
 type MapKeyValue = "int | str | ObjectReference | float | list[PropertyType] | TextValue"
 
+_FIXED_KEY_FORMATS: typing.Final[dict[KeyTypeName, str]] = {
+    KeyTypeName.INT: "i",
+    KeyTypeName.INT64: "q",
+    KeyTypeName.STRUCT: "iii",
+}
+_FIXED_VALUE_FORMATS: typing.Final[dict[ValueTypeName, str]] = {
+    ValueTypeName.INT: "i",
+    ValueTypeName.INT64: "q",
+    ValueTypeName.FLOAT: "f",
+    ValueTypeName.DOUBLE: "d",
+}
+
+
+def _deserialize_object_key(des: "SFSaveDeserializer") -> tuple[str, str]:
+    return des.get_string(), des.get_string()
+
+
+def _deserialize_struct_key(des: "SFSaveDeserializer") -> tuple[int, int, int]:
+    return des.get_i32(), des.get_i32(), des.get_i32()
+
+
+def _deserialize_object_value(des: "SFSaveDeserializer") -> ObjectReference:
+    return des.get(ObjectReference)
+
+
+def _deserialize_text_value(des: "SFSaveDeserializer") -> TextValue:
+    return des.get_fn(TextProperty.deserialize_property_value)
+
+
+def _deserialize_struct_value(des: "SFSaveDeserializer") -> "list[PropertyType]":
+    from sat_sav_parse.models.properties import deserialize_properties  # noqa: PLC0415
+
+    return des.get_fn(deserialize_properties)
+
+
+def _serialize_object_key(ser: "SFSaveSerializer", key: tuple[str, str]) -> None:
+    ser.add_string(key[0])
+    ser.add_string(key[1])
+
+
+def _serialize_struct_key(ser: "SFSaveSerializer", key: tuple[int, int, int]) -> None:
+    ser.add_i32(key[0])
+    ser.add_i32(key[1])
+    ser.add_i32(key[2])
+
+
+def _serialize_model_value(ser: "SFSaveSerializer", value: "ObjectReference | TextValue") -> None:
+    ser.add(value)
+
+
+def _serialize_struct_value(ser: "SFSaveSerializer", value: "list[PropertyType]") -> None:
+    from sat_sav_parse.models.properties import serialize_properties  # noqa: PLC0415
+
+    serialize_properties(ser, value)
+
+
+def map_key_deserializer(key_type: KeyTypeName) -> "SFSaveDeserializeFn[MapKeyType]":
+    match key_type:
+        case KeyTypeName.INT:
+            return SFSaveDeserializer.get_i32
+        case KeyTypeName.INT64:
+            return SFSaveDeserializer.get_i64
+        case KeyTypeName.NAME | KeyTypeName.STR | KeyTypeName.ENUM:
+            return SFSaveDeserializer.get_string
+        case KeyTypeName.OBJECT:
+            return _deserialize_object_key
+        case KeyTypeName.STRUCT:
+            return _deserialize_struct_key
+        case _:
+            typing.assert_never(key_type)
+
+
+def map_value_deserializer(  # noqa: PLR0911
+    key_type: KeyTypeName,
+    value_type: ValueTypeName,
+) -> "SFSaveDeserializeFn[MapKeyValue]":
+    match value_type:
+        case ValueTypeName.BYTE:
+            return SFSaveDeserializer.get_string if key_type == KeyTypeName.STR else SFSaveDeserializer.get_u8
+        case ValueTypeName.BOOL:
+            return SFSaveDeserializer.get_u8_bool
+        case ValueTypeName.INT:
+            return SFSaveDeserializer.get_i32
+        case ValueTypeName.INT64:
+            return SFSaveDeserializer.get_i64
+        case ValueTypeName.FLOAT:
+            return SFSaveDeserializer.get_float
+        case ValueTypeName.DOUBLE:
+            return SFSaveDeserializer.get_double
+        case ValueTypeName.STR:
+            return SFSaveDeserializer.get_string
+        case ValueTypeName.OBJECT:
+            return _deserialize_object_value
+        case ValueTypeName.TEXT:
+            return _deserialize_text_value
+        case ValueTypeName.STRUCT:
+            return _deserialize_struct_value
+        case _:
+            typing.assert_never(value_type)
+
+
+def map_key_serializer(key_type: KeyTypeName) -> "SFSaveSerializeFn[typing.Any]":
+    match key_type:
+        case KeyTypeName.INT:
+            return SFSaveSerializer.add_i32
+        case KeyTypeName.INT64:
+            return SFSaveSerializer.add_i64
+        case KeyTypeName.NAME | KeyTypeName.STR | KeyTypeName.ENUM:
+            return SFSaveSerializer.add_string
+        case KeyTypeName.OBJECT:
+            return _serialize_object_key
+        case KeyTypeName.STRUCT:
+            return _serialize_struct_key
+        case _:
+            typing.assert_never(key_type)
+
+
+def map_value_serializer(  # noqa: PLR0911
+    key_type: KeyTypeName,
+    value_type: ValueTypeName,
+) -> "SFSaveSerializeFn[typing.Any]":
+    match value_type:
+        case ValueTypeName.BYTE:
+            return SFSaveSerializer.add_string if key_type == KeyTypeName.STR else SFSaveSerializer.add_u8
+        case ValueTypeName.BOOL:
+            return SFSaveSerializer.add_u8_bool
+        case ValueTypeName.INT:
+            return SFSaveSerializer.add_i32
+        case ValueTypeName.INT64:
+            return SFSaveSerializer.add_i64
+        case ValueTypeName.FLOAT:
+            return SFSaveSerializer.add_float
+        case ValueTypeName.DOUBLE:
+            return SFSaveSerializer.add_double
+        case ValueTypeName.STR:
+            return SFSaveSerializer.add_string
+        case ValueTypeName.OBJECT | ValueTypeName.TEXT:
+            return _serialize_model_value
+        case ValueTypeName.STRUCT:
+            return _serialize_struct_value
+        case _:
+            typing.assert_never(value_type)
+
+
+def deserialize_fixed_width_map(
+    des: "SFSaveDeserializer",
+    key_type: KeyTypeName,
+    value_type: ValueTypeName,
+    elements_count: int,
+) -> dict[MapKeyType, MapKeyValue] | None:
+    key_format = _FIXED_KEY_FORMATS.get(key_type)
+    value_format = _FIXED_VALUE_FORMATS.get(value_type)
+    if key_format is None or value_format is None:
+        return None
+
+    element = struct.Struct(f"<{key_format}{value_format}")
+    raw = des.get_item(element.size * elements_count)
+    if key_type == KeyTypeName.STRUCT:
+        return {(x, y, z): value for x, y, z, value in element.iter_unpack(raw)}
+    return dict(element.iter_unpack(raw))
+
 
 class MapProperty(BaseProperty[dict[MapKeyType, MapKeyValue]]):
     type_name: typing.Literal[PropertyTypeName.MAP] = PropertyTypeName.MAP
@@ -55,10 +230,42 @@ class MapProperty(BaseProperty[dict[MapKeyType, MapKeyValue]]):
     mode: int
     elements_count: int
 
+    @pydantic.field_validator("payload", mode="before")
     @classmethod
-    def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
-        from sat_sav_parse.models.properties import deserialize_properties  # noqa: PLC0415
+    def _payload_from_items(cls, value: typing.Any) -> typing.Any:
+        if isinstance(value, list):
+            return {tuple(key) if isinstance(key, list) else key: item for key, item in value}
+        return value
 
+    @pydantic.field_serializer("payload", mode="wrap")
+    def _payload_to_items(
+        self,
+        value: dict[MapKeyType, MapKeyValue],
+        handler: pydantic.SerializerFunctionWrapHandler,
+        info: pydantic.FieldSerializationInfo,
+    ) -> typing.Any:
+        if info.context is not None and info.context.get(MAP_ITEMS_CONTEXT):
+            return [[key, item] for key, item in value.items()]
+        return handler(value)
+
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_string(self.name)
+        ser.add(self.type_name)
+        ser.add_u32(self.payload_size)
+        ser.add_u32(self.index)
+        ser.add(self.key_type)
+        ser.add(self.value_type)
+        ser.add_u8(0)
+        ser.add_u32(self.mode)
+        ser.add_u32(len(self.payload))
+        add_key = map_key_serializer(self.key_type)
+        add_value = map_value_serializer(self.key_type, self.value_type)
+        for key, value in self.payload.items():
+            add_key(ser, key)
+            add_value(ser, value)
+
+    @classmethod
+    def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         name = des.get_string()
         des.get(PropertyTypeName)
         payload_size = des.get_u32()
@@ -70,51 +277,14 @@ class MapProperty(BaseProperty[dict[MapKeyType, MapKeyValue]]):
             mode = des.get_u32()
             elements_count = des.get_u32()
 
-            elemets = {}
-
-            for _ in range(elements_count):
-                match key_type:
-                    case KeyTypeName.INT:
-                        key = des.get_i32()
-                    case KeyTypeName.INT64:
-                        key = des.get_i64()
-                    case KeyTypeName.NAME:
-                        key = des.get_string()
-                    case KeyTypeName.STR:
-                        key = des.get_string()
-                    case KeyTypeName.ENUM:
-                        key = des.get_string()
-                    case KeyTypeName.OBJECT:
-                        ref = des.get(ObjectReference)
-                        key = (ref.level_name, ref.path_name)
-                    case KeyTypeName.STRUCT:
-                        key = (des.get_i32(), des.get_i32(), des.get_i32())
-                    case _:
-                        typing.assert_never(key_type)
-                match value_type:
-                    case ValueTypeName.BYTE:
-                        value = des.get_string() if key_type == KeyTypeName.STR else des.get_u8()
-                    case ValueTypeName.BOOL:
-                        value = des.get_u8_bool()
-                    case ValueTypeName.INT:
-                        value = des.get_i32()
-                    case ValueTypeName.INT64:
-                        value = des.get_i64()
-                    case ValueTypeName.FLOAT:
-                        value = des.get_float()
-                    case ValueTypeName.DOUBLE:
-                        value = des.get_double()
-                    case ValueTypeName.STR:
-                        value = des.get_string()
-                    case ValueTypeName.OBJECT:
-                        value = des.get(ObjectReference)
-                    case ValueTypeName.TEXT:
-                        value = des.get_fn(TextProperty.deserialize_property_value)
-                    case ValueTypeName.STRUCT:
-                        value = des.get_fn(deserialize_properties)
-                    case _:
-                        typing.assert_never(value_type)
-                elemets[key] = value
+            elemets = deserialize_fixed_width_map(des, key_type, value_type, elements_count)
+            if elemets is None:
+                get_key = map_key_deserializer(key_type)
+                get_value = map_value_deserializer(key_type, value_type)
+                elemets = {}
+                for _ in range(elements_count):
+                    key = get_key(des)
+                    elemets[key] = get_value(des)
         return cls(
             name=name,
             payload_size=payload_size,
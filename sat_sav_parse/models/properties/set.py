@@ -2,15 +2,13 @@ import enum
 import logging
 import typing
 
-import pydantic
-
 from sat_sav_parse.models.properties.array import ObjectReference
 from sat_sav_parse.models.properties.base import BaseProperty
 from sat_sav_parse.models.properties.enums import PropertyTypeName
-from sat_sav_parse.utils import StrEnumDeserializerMixin, StrEnumSerializerMixin, b64_bytes, expect_size
+from sat_sav_parse.utils import RawBytes, StrEnumDeserializerMixin, StrEnumSerializerMixin, expect_size
 
 if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer
+    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
 
 __all__ = (
@@ -27,11 +25,32 @@ class SetType(StrEnumSerializerMixin, StrEnumDeserializerMixin, enum.StrEnum):
     OBJECT = "ObjectProperty"
 
 
-class SetProperty(BaseProperty[list[ObjectReference] | list[int] | list[tuple[int, int]] | pydantic.Base64Bytes]):
+class SetProperty(BaseProperty[list[ObjectReference] | list[int] | list[tuple[int, int]] | RawBytes]):
     type_name: typing.Literal[PropertyTypeName.SET] = PropertyTypeName.SET
     set_type: SetType
     index: int
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_string(self.name)
+        ser.add(self.type_name)
+        ser.add_u32(self.payload_size)
+        ser.add_u32(self.index)
+        ser.add(self.set_type)
+        ser.add_u8(0)
+        ser.add_u32(0)
+        # an empty set is deserialized with the raw payload bytes in place of the values
+        values = self.payload if isinstance(self.payload, list) else []
+        ser.add_u32(len(values))
+        for value in values:
+            match value:
+                case ObjectReference():
+                    ser.add(value)
+                case int():
+                    ser.add_u32(value)
+                case (first, second):
+                    ser.add_u64(first)
+                    ser.add_u64(second)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         name = des.get_string()
@@ -64,5 +83,5 @@ class SetProperty(BaseProperty[list[ObjectReference] | list[int] | list[tuple[in
                 payload_size=payload_size,
                 set_type=set_type,
                 index=index,
-                payload=values or b64_bytes(value_bytes),
+                payload=values or value_bytes,
             )
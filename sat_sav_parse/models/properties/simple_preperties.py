@@ -136,7 +136,7 @@ class DoubleProperty(BaseProperty[float]):
         ser.add_u32(self.payload_size)
         ser.add_u32(self.index)
         ser.add_u8(0)
-        ser.add_float(self.payload)
+        ser.add_double(self.payload)
 
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
@@ -2,26 +2,33 @@ import functools
 import logging
 import typing
 
-import pydantic
-
 from sat_sav_parse.models.properties.base import BaseProperty
 from sat_sav_parse.models.properties.enums import PropertyTypeName, StructTypeName
-from sat_sav_parse.models.properties.typed_data import StructValue, deserialize_struct_value
-from sat_sav_parse.utils import b64_bytes
+from sat_sav_parse.models.properties.typed_data import StructValue, deserialize_struct_value, serialize_struct_value
+from sat_sav_parse.utils import RawBytes
 
 if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer
+    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
 __all__ = ("StructProperty",)
 
 logger = logging.getLogger(__name__)
 
 
-class StructProperty(BaseProperty[StructValue | pydantic.Base64Bytes]):
+class StructProperty(BaseProperty[StructValue | RawBytes]):
     type_name: typing.Literal[PropertyTypeName.STRUCT] = PropertyTypeName.STRUCT
     index: int
     type: StructTypeName
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_string(self.name)
+        ser.add(self.type_name)
+        ser.add_u32(self.payload_size)
+        ser.add_u32(self.index)
+        ser.add(self.type)
+        ser.add_raw(bytes(17))
+        ser.add_fn(serialize_struct_value, self.payload)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         name = des.get_string()
@@ -30,8 +37,6 @@ class StructProperty(BaseProperty[StructValue | pydantic.Base64Bytes]):
         index = des.get_u32()
         element_type = des.get(StructTypeName)
         des.get_item(17)
-        _, value = des.parse_item(des.offset, des.content, payload_size)
-
         value = des.get_fn(
             functools.partial(deserialize_struct_value, struct_type=element_type, payload_size=payload_size),
         )
@@ -41,5 +46,5 @@ class StructProperty(BaseProperty[StructValue | pydantic.Base64Bytes]):
             payload_size=payload_size,
             index=index,
             type=element_type,
-            payload=b64_bytes(value),
+            payload=value,
         )
@@ -0,0 +1,55 @@
+import collections.abc
+import typing
+
+from sat_sav_parse.models.properties.enums import PropertyTypeName
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "PropertyTag",
+    "iter_property_tags",
+    "read_property_tag",
+)
+
+
+class PropertyTag(typing.NamedTuple):
+    name: str
+    type_name: str
+    payload_size: int
+    index: int
+    # offset of the tag's value: the inline flag for BoolProperty, the payload for everything else
+    value_offset: int
+    end_offset: int
+
+
+def read_property_tag(data: bytes, offset: int) -> PropertyTag | None:
+    # Reads the tag at offset and skips its payload by payload_size without decoding it.
+    # Returns None for the "None" terminator.
+    offset, name = SFSaveDeserializer.parse_string(offset, data)
+    if name == "None":
+        return None
+    offset, type_name = SFSaveDeserializer.parse_string(offset, data)
+    offset, payload_size = SFSaveDeserializer.parse_u32(offset, data)
+    offset, index = SFSaveDeserializer.parse_u32(offset, data)
+
+    match type_name:
+        case PropertyTypeName.BOOL:
+            return PropertyTag(name, type_name, payload_size, index, offset, offset + 2)
+        case PropertyTypeName.BYTE | PropertyTypeName.ENUM | PropertyTypeName.ARRAY | PropertyTypeName.SET:
+            offset, _ = SFSaveDeserializer.parse_string(offset, data)
+            offset += 1
+        case PropertyTypeName.MAP:
+            offset, _ = SFSaveDeserializer.parse_string(offset, data)
+            offset, _ = SFSaveDeserializer.parse_string(offset, data)
+            offset += 1
+        case PropertyTypeName.STRUCT:
+            offset, _ = SFSaveDeserializer.parse_string(offset, data)
+            offset += 17
+        case _:
+            offset += 1
+    return PropertyTag(name, type_name, payload_size, index, offset, offset + payload_size)
+
+
+def iter_property_tags(data: bytes, offset: int) -> collections.abc.Iterator[PropertyTag]:
+    while (tag := read_property_tag(data, offset)) is not None:
+        yield tag
+        offset = tag.end_offset
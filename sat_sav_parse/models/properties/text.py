@@ -9,7 +9,7 @@ from sat_sav_parse.models.properties.enums import PropertyTypeName
 from sat_sav_parse.utils import U8EnumDeserializerMixin, U8EnumSerializerMixin
 
 if typing.TYPE_CHECKING:
-    from sat_sav_parse.structs import SFSaveDeserializer
+    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
 __all__ = (
     "TextArgument",
@@ -43,6 +43,12 @@ class TextValueBase(pydantic.BaseModel):
     key: str
     value: str
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add(self.history_type)
+        ser.add_string(self.namespace)
+        ser.add_string(self.key)
+        ser.add_string(self.value)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         des.get(TextPropertyHistoryType)
@@ -71,6 +77,12 @@ class TextArgumentInt(pydantic.BaseModel):
     value: int
     unknown: int
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_string(self.name)
+        ser.add(self.value_type)
+        ser.add_i32(self.value)
+        ser.add_i32(self.unknown)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         name = des.get_string()
@@ -85,6 +97,11 @@ class TextArgumentText(pydantic.BaseModel):
     value_type: typing.Literal[TextArgumentType.TEXT] = TextArgumentType.TEXT
     value: "TextValue"
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_string(self.name)
+        ser.add(self.value_type)
+        ser.add(self.value)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         name = des.get_string()
@@ -121,6 +138,14 @@ class TextValueWithArguments(pydantic.BaseModel):
     flags: int
     arguments: list[TextArgument]
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(self.flags)
+        ser.add(self.history_type)
+        ser.add(self.source_format)
+        ser.add_u32(len(self.arguments))
+        for argument in self.arguments:
+            ser.add(argument)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         flags = des.get_u32()
@@ -145,6 +170,12 @@ class TextValueTransform(pydantic.BaseModel):
     transform_type: int
     flags: int
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(self.flags)
+        ser.add(self.history_type)
+        ser.add(self.source_text)
+        ser.add_u8(self.transform_type)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         flags = des.get_u32()
@@ -166,6 +197,12 @@ class TextValueStringTableEntry(pydantic.BaseModel):
     table_key: str
     flags: int
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(self.flags)
+        ser.add(self.history_type)
+        ser.add_string(self.table_id)
+        ser.add_string(self.table_key)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         flags = des.get_u32()
@@ -185,6 +222,12 @@ class TextValueNone(pydantic.BaseModel):
     value: str
     flags: int
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_u32(self.flags)
+        ser.add(self.history_type)
+        ser.add_u32_bool(self.has_culture_invariant_string)
+        ser.add_string(self.value)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         flags = des.get_u32()
@@ -208,6 +251,14 @@ class TextProperty(BaseProperty[TextValue]):
     type_name: typing.Literal[PropertyTypeName.TEXT] = PropertyTypeName.TEXT
     index: int
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        ser.add_string(self.name)
+        ser.add(self.type_name)
+        ser.add_u32(self.payload_size)
+        ser.add_u32(self.index)
+        ser.add_u8(0)
+        ser.add(self.payload)
+
     @classmethod
     @set_struct_name("TextValue")
     def deserialize_property_value(cls, des: "SFSaveDeserializer") -> TextValue:
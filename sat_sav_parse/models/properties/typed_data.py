@@ -1,4 +1,5 @@
 import enum
+import functools
 import logging
 import typing
 
@@ -7,11 +8,12 @@ import pydantic
 from sat_sav_parse.logger import set_struct_name
 from sat_sav_parse.models.object_reference import ObjectReference
 from sat_sav_parse.models.properties.enums import StructTypeName
-from sat_sav_parse.utils import ParseError, U8EnumDeserializerMixin, U8EnumSerializerMixin, b64_bytes, expect_size
+from sat_sav_parse.structs import SFSaveSerializer
+from sat_sav_parse.utils import ParseError, RawBytes, U8EnumDeserializerMixin, U8EnumSerializerMixin, expect_size
 
 if typing.TYPE_CHECKING:
     from sat_sav_parse.models.properties import PropertyType
-    from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+    from sat_sav_parse.structs import SFSaveDeserializer
 
 
 __all__ = (
@@ -27,6 +29,8 @@ __all__ = (
     "RailroadTrackPosition",
     "SpawnData",
     "Vector",
+    "deserialize_struct_value",
+    "serialize_struct_value",
 )
 
 logger = logging.getLogger(__name__)
@@ -84,17 +88,17 @@ class InventoryItem(pydantic.BaseModel):
     properties: "list[PropertyType] | None"
 
     def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        from sat_sav_parse.models.properties import serialize_properties  # noqa: PLC0415
+
         ser.add_u32(0)
         ser.add_string(self.name)
         ser.add_u32_bool(self.has_properties)
         if self.has_properties:
-            if self.type is not None:
-                ser.add_string(self.type)
-            if self.properties_size is not None:
-                ser.add_u32(self.properties_size)
-            if self.properties:
-                for prop in self.properties:
-                    ser.add(prop)  # type: ignore
+            properties = SFSaveSerializer().add_fn(serialize_properties, self.properties or [])
+            ser.add_u32(0)
+            ser.add_string(self.type or "")
+            ser.add_u32(len(properties.buffer))
+            ser.add_raw(properties.buffer)
 
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
@@ -225,7 +229,7 @@ class ClientIdentityInfoIdentityVariant(U8EnumSerializerMixin, U8EnumDeserialize
 
 class ClientIdentityInfoIdentity(pydantic.BaseModel):
     variant: ClientIdentityInfoIdentityVariant
-    payload: pydantic.Base64Bytes
+    payload: RawBytes
 
     def __serialize__(self, ser: "SFSaveSerializer") -> None:
         ser.add(self.variant)
@@ -238,7 +242,7 @@ class ClientIdentityInfoIdentity(pydantic.BaseModel):
         data_size = des.get_u32()
         data = des.content[des.offset : des.offset + data_size]
         des.offset += data_size
-        return cls(variant=variant, payload=b64_bytes(data))
+        return cls(variant=variant, payload=data)
 
 
 class ClientIdentityInfo(pydantic.BaseModel):
@@ -266,6 +270,17 @@ class SpawnData(pydantic.BaseModel):
     level_path: ObjectReference
     properties: "list[PropertyType]"
 
+    def __serialize__(self, ser: "SFSaveSerializer") -> None:
+        from sat_sav_parse.models.properties import serialize_properties  # noqa: PLC0415
+
+        ser.add_string(self.name)
+        ser.add_string(self.type)
+        ser.add_u32(self.size)
+        ser.add_u32(0)
+        ser.add_u8(0)
+        ser.add(self.level_path)
+        ser.add_fn(serialize_properties, self.properties)
+
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
         from sat_sav_parse.models.properties import deserialize_properties  # noqa: PLC0415
@@ -307,7 +322,7 @@ def deserialize_struct_value(  # noqa: PLR0911
     des: "SFSaveDeserializer",
     struct_type: StructTypeName,
     payload_size: int,
-) -> StructValue | pydantic.Base64Bytes:
+) -> StructValue | bytes:
     from sat_sav_parse.models.properties import deserialize_properties  # noqa: PLC0415
 
     match struct_type:
@@ -338,8 +353,20 @@ def deserialize_struct_value(  # noqa: PLR0911
         case _:
             start_offset = des.offset
             try:
-                return des.get_fn(deserialize_properties)
+                return des.get_fn(functools.partial(deserialize_properties, layout_key=struct_type))
             except (ParseError, ValueError):
                 des.offset = start_offset
                 logger.warning("Failed to deserialize struct type %s, returning raw bytes", struct_type)
                 return des.get_item(payload_size)
+
+
+def serialize_struct_value(ser: "SFSaveSerializer", value: StructValue | bytes) -> None:
+    from sat_sav_parse.models.properties import serialize_properties  # noqa: PLC0415
+
+    match value:
+        case bytes():
+            ser.add_raw(value)
+        case list():
+            serialize_properties(ser, value)
+        case _:
+            ser.add(value)
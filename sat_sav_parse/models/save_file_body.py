@@ -1,17 +1,31 @@
-import functools
+import collections
+import collections.abc
 import itertools
 import logging
 import typing
 
 import pydantic
 
-from sat_sav_parse.models.level import Level, deserialize_level
+from sat_sav_parse.models.level import (
+    Level,
+    LevelField,
+    LevelIterFn,
+    StreamedLevel,
+    iter_level,
+    level_from_fields,
+    write_level,
+)
 from sat_sav_parse.models.level_grouping_grid import LevelGroupingGrid
 from sat_sav_parse.models.object_reference import ObjectReference
 from sat_sav_parse.progress import LogProgress
 from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
-__all__ = ("SaveFileBody",)
+__all__ = (
+    "SaveFileBody",
+    "iter_save_file_body",
+    "save_file_body_from_fields",
+    "write_save_file_body",
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,63 +40,147 @@ class SaveFileBody(pydantic.BaseModel):
 
     def __serialize__(self, ser: "SFSaveSerializer") -> None:
         ns = SFSaveSerializer()
-        ns.add_u32(6)
-        ns.add_string("None")
-        ns.add_u32(0)
-        ns.add_u32(self.unknown_1)
-        ns.add_u32(1)
-        ns.add_string("None")
-        ns.add_u32(self.unknown_2)
-
-        for grid in self.grids:
-            ns.add(grid)
-
-        ns.add_u32(len(self.sublevels))
+        _serialize_body_prefix(ns, self.unknown_1, self.unknown_2, self.grids, len(self.sublevels))
+
         for lvl in itertools.chain(self.sublevels, [self.persistent_level]):
             ns.add(lvl)
 
-        ns.add_u32(len(self.references))
-        for ref in self.references:
-            ns.add(ref)
+        _serialize_references(ns, self.references)
 
-        ser.add_u64(len(ns.content))
-        ser.add_raw(ns.content)
+        ser.add_u64(len(ns.buffer))
+        ser.add_raw(ns.buffer)
 
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
-        des.get_u64()
-        des.get_u32()
-        des.confirm_basic_type(des.parse_string, "None")
-        des.confirm_basic_type(des.parse_u32, 0)
-
-        unknown_1 = des.get_u32()
-        des.confirm_basic_type(des.parse_u32, 1)
-        des.confirm_basic_type(des.parse_string, "None")
-        unknown_2 = des.get_u32()
-
-        grids = [des.get(LevelGroupingGrid) for _ in range(5)]
-
-        sublevel_count = des.get_u32()
-        levels = LogProgress.iter_list(
-            [des.get_fn(functools.partial(deserialize_level, is_persistent=False)) for _ in range(sublevel_count)],
-            total=sublevel_count,
-            desc="sublevels",
-        )
-
-        persistent_level = des.get_fn(functools.partial(deserialize_level, is_persistent=True))
-
-        if des.offset == len(des.content):
-            logger.warning("Missing final refs count")
-            des.content += b"\x00\x00\x00\x00"
-
-        ref_count = des.get_u32()
-        refs = [des.get(ObjectReference) for _ in range(ref_count)]
-
-        return cls(
-            unknown_1=unknown_1,
-            unknown_2=unknown_2,
-            grids=grids,
-            sublevels=levels,
-            persistent_level=persistent_level,
-            references=refs,
-        )
+        return cls(**_collect_fields(iter_save_file_body(des)))
+
+
+def _serialize_body_prefix(
+    ser: "SFSaveSerializer",
+    unknown_1: int,
+    unknown_2: int,
+    grids: list[LevelGroupingGrid],
+    sublevel_count: int,
+) -> None:
+    ser.add_u32(6)
+    ser.add_string("None")
+    ser.add_u32(0)
+    ser.add_u32(unknown_1)
+    ser.add_u32(1)
+    ser.add_string("None")
+    ser.add_u32(unknown_2)
+
+    for grid in grids:
+        ser.add(grid)
+
+    ser.add_u32(sublevel_count)
+
+
+def _serialize_references(ser: "SFSaveSerializer", references: list[ObjectReference]) -> None:
+    ser.add_u32(len(references))
+    for ref in references:
+        ser.add(ref)
+
+
+def write_save_file_body(
+    fp: typing.BinaryIO,
+    *,
+    unknown_1: int,
+    unknown_2: int,
+    grids: list[LevelGroupingGrid],
+    sublevel_count: int,
+    sublevels: collections.abc.Iterable[Level | StreamedLevel],
+    persistent_level: Level | StreamedLevel,
+    references: list[ObjectReference],
+) -> int:
+    # Writes the same bytes as SaveFileBody.__serialize__, one level at a time, so sublevels can be
+    # produced lazily and dropped once written; a StreamedLevel is also written one object at a
+    # time. The size prefix is patched in at the end, so fp must be seekable.
+    start = fp.tell()
+    fp.write(bytes(8))
+
+    ser = SFSaveSerializer()
+    _serialize_body_prefix(ser, unknown_1, unknown_2, grids, sublevel_count)
+    fp.write(ser.buffer)
+    written = 0
+    for level in sublevels:
+        write_level(fp, level)
+        written += 1
+    if written != sublevel_count:
+        msg = f"sublevel_count is {sublevel_count}, but {written} sublevels were written"
+        raise ValueError(msg)
+    write_level(fp, persistent_level)
+    fp.write(SFSaveSerializer().add_fn(_serialize_references, references).buffer)
+
+    end = fp.tell()
+    fp.seek(start)
+    fp.write(SFSaveSerializer().add_u64(end - start - 8).buffer)
+    fp.seek(end)
+    return end - start
+
+
+def _collect_fields(fields: collections.abc.Iterable[tuple[str, typing.Any]]) -> dict[str, typing.Any]:
+    result = {}
+    for name, value in fields:
+        if name == "sublevels":
+            result[name] = LogProgress.iter_list(
+                (level_from_fields(level) for level in value),
+                total=result.pop("sublevel_count"),
+                desc="sublevels",
+            )
+        elif name == "persistent_level":
+            result[name] = level_from_fields(value)
+        else:
+            result[name] = value
+    return result
+
+
+def save_file_body_from_fields(fields: collections.abc.Iterable[tuple[str, typing.Any]]) -> SaveFileBody:
+    return SaveFileBody(**_collect_fields(fields))
+
+
+def iter_save_file_body(
+    des: "SFSaveDeserializer",
+    *,
+    retain_headers: bool = True,
+    level_iter: LevelIterFn = iter_level,
+) -> collections.abc.Iterator[tuple[str, typing.Any]]:
+    # Yields (SaveFileBody field name, value) pairs in serialization order, plus a leading
+    # "sublevel_count". "sublevels" is an iterator of iter_level() streams and "persistent_level"
+    # is an iter_level() stream; each must be consumed before the next pair is requested.
+    des.get_u64()
+    des.get_u32()
+    des.confirm_basic_type(des.parse_string, "None")
+    des.confirm_basic_type(des.parse_u32, 0)
+
+    yield "unknown_1", des.get_u32()
+    des.confirm_basic_type(des.parse_u32, 1)
+    des.confirm_basic_type(des.parse_string, "None")
+    yield "unknown_2", des.get_u32()
+
+    yield "grids", [des.get(LevelGroupingGrid) for _ in range(5)]
+
+    sublevel_count = des.get_u32()
+    yield "sublevel_count", sublevel_count
+
+    def _iter_sublevels() -> collections.abc.Iterator[collections.abc.Iterator[LevelField]]:
+        for _ in range(sublevel_count):
+            level = level_iter(des, is_persistent=False, retain_headers=retain_headers)
+            yield level
+            collections.deque(level, maxlen=0)
+
+    sublevels = _iter_sublevels()
+    yield "sublevels", sublevels
+    collections.deque(sublevels, maxlen=0)
+
+    persistent_level = level_iter(des, is_persistent=True, retain_headers=retain_headers)
+    yield "persistent_level", persistent_level
+    collections.deque(persistent_level, maxlen=0)
+
+    if des.offset == len(des.content):
+        logger.warning("Missing final refs count")
+        yield "references", []
+        return
+
+    ref_count = des.get_u32()
+    yield "references", [des.get(ObjectReference) for _ in range(ref_count)]
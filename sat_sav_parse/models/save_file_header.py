@@ -6,8 +6,7 @@ import pydantic
 
 from sat_sav_parse.const import EPOCH_1_TO_1970, SUPPORT_HEADER_TYPES, SUPPORT_SAVE_VERSIONS, TICKS_IN_SECOND
 from sat_sav_parse.exceptions import ParseError
-from sat_sav_parse.models.level_object import b64_bytes
-from sat_sav_parse.utils import U8EnumDeserializerMixin, U8EnumSerializerMixin
+from sat_sav_parse.utils import RawBytes, U8EnumDeserializerMixin, U8EnumSerializerMixin
 
 if typing.TYPE_CHECKING:
     from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
@@ -37,7 +36,7 @@ class SaveFileHeader(pydantic.BaseModel):
     save_id: str
     is_partitioned_world: bool
     creative_mode_enabled: bool
-    checksum: pydantic.Base64Bytes
+    checksum: RawBytes
     is_cheat: bool
 
     @property
@@ -120,6 +119,6 @@ class SaveFileHeader(pydantic.BaseModel):
             save_id=persistent_save_id,
             is_partitioned_world=is_partitioned_world,
             creative_mode_enabled=creative_mode_enabled,
-            checksum=b64_bytes(checksum),  # type: ignore
+            checksum=checksum,
             is_cheat=is_cheat,
         )
@@ -0,0 +1,110 @@
+import bisect
+import collections
+import collections.abc
+import pathlib
+import struct
+import typing
+
+from sat_sav_parse.exceptions import ParseError
+from sat_sav_parse.index import ObjectLocation
+from sat_sav_parse.models import CSaveFileBody, CSaveFileChunk, CSaveFileChunkInfo, PropertyTypeName
+from sat_sav_parse.reader import read_header_prefix
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+from sat_sav_parse.utils import atomic_write
+from sat_sav_parse.writer import COPY_BUFFER_SIZE
+
+__all__ = (
+    "BodyPatch",
+    "patch_save_body",
+    "position_patch",
+    "property_patch",
+)
+
+FIXED_SIZE_PROPERTY_FORMATS: typing.Final[dict[str, str]] = {
+    PropertyTypeName.BOOL: "<?",
+    PropertyTypeName.INT8: "<b",
+    PropertyTypeName.INT: "<i",
+    PropertyTypeName.U_INT32: "<I",
+    PropertyTypeName.INT64: "<q",
+    PropertyTypeName.FLOAT: "<f",
+    PropertyTypeName.DOUBLE: "<d",
+}
+
+
+class BodyPatch(typing.NamedTuple):
+    # offset in the decompressed body and the bytes to write there
+    offset: int
+    data: bytes
+
+
+def property_patch(data: bytes, location: ObjectLocation, name: str, value: float, index: int = 0) -> BodyPatch:
+    tag = location.find_property(data, name, index)
+    if tag is None:
+        msg = f"{location.instance_name} has no property {name}[{index}]"
+        raise KeyError(msg)
+    fmt = FIXED_SIZE_PROPERTY_FORMATS.get(tag.type_name)
+    if fmt is None:
+        msg = f"{name} is a {tag.type_name}, only fixed-size values can be patched in place"
+        raise TypeError(msg)
+    return BodyPatch(tag.value_offset, struct.pack(fmt, value))
+
+
+def position_patch(data: bytes, location: ObjectLocation, position: tuple[float, float, float]) -> BodyPatch:
+    return BodyPatch(location.position_offset(data), struct.pack("<3f", *position))
+
+
+def _patch_chunk(src: typing.BinaryIO, chunk: CSaveFileChunkInfo, patches: list[BodyPatch]) -> bytes:
+    src.seek(chunk.offset)
+    record = src.read(chunk.size)
+    data = bytearray(CSaveFileChunk.__deserialize__(SFSaveDeserializer(record)))
+    for patch in patches:
+        start = max(patch.offset, chunk.body_offset)
+        end = min(patch.offset + len(patch.data), chunk.body_offset + chunk.body_size)
+        data[start - chunk.body_offset : end - chunk.body_offset] = patch.data[
+            start - patch.offset : end - patch.offset
+        ]
+    return SFSaveSerializer.get(CSaveFileChunk(data))
+
+
+def patch_save_body(
+    file_path: pathlib.Path,
+    patches: collections.abc.Iterable[BodyPatch],
+    output_path: pathlib.Path | None = None,
+) -> int:
+    # Only the chunks touched by a patch are decompressed and recompressed; every other chunk
+    # record is copied from the original file unchanged. Returns the number of rewritten chunks.
+    output_path = output_path or file_path
+    with file_path.open("rb") as src:
+        _, header_size = read_header_prefix(src)
+        chunks = CSaveFileBody.scan_chunks(src, header_size)
+
+        chunk_patches: dict[int, list[BodyPatch]] = collections.defaultdict(list)
+        starts = [chunk.body_offset for chunk in chunks]
+        for patch in patches:
+            end = patch.offset + len(patch.data)
+            if patch.offset < 0 or not chunks or end > chunks[-1].body_offset + chunks[-1].body_size:
+                raise ParseError("invalid_size", "Patch at offset {} is outside the save body", patch.offset)
+            idx = bisect.bisect_right(starts, patch.offset) - 1
+            while idx < len(chunks) and chunks[idx].body_offset < end:
+                chunk_patches[idx].append(patch)
+                idx += 1
+
+        with atomic_write(output_path, mode_from=file_path) as dst:
+            src.seek(0)
+            dst.write(src.read(header_size))
+            for idx, chunk in enumerate(chunks):
+                if idx in chunk_patches:
+                    dst.write(_patch_chunk(src, chunk, chunk_patches[idx]))
+                else:
+                    src.seek(chunk.offset)
+                    _copy(src, dst, chunk.size)
+    return len(chunk_patches)
+
+
+def _copy(src: typing.BinaryIO, dst: typing.BinaryIO, size: int) -> None:
+    while size:
+        data = src.read(min(size, COPY_BUFFER_SIZE))
+        if not data:
+            raise ParseError("unexpected_end_of_data", "Save file ended while copying a chunk")
+        dst.write(data)
+        size -= len(data)
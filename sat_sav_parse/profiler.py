@@ -0,0 +1,161 @@
+import collections
+import collections.abc
+import contextlib
+import contextvars
+import pathlib
+import threading
+import time
+import typing
+
+from sat_sav_parse.logger import get_struct_name
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "ProfileStat",
+    "Profiler",
+    "get_active_profiler",
+)
+
+_active_profiler: contextvars.ContextVar["Profiler | None"] = contextvars.ContextVar("active_profiler", default=None)
+
+type ProfileSortKey = typing.Literal["self_time", "total_time", "count", "bytes"]
+
+
+class ProfileStat(typing.NamedTuple):
+    name: str
+    count: int
+    bytes: int
+    # seconds; total_time includes nested decodes, self_time does not
+    total_time: float
+    self_time: float
+
+
+def get_active_profiler() -> "Profiler | None":
+    return _active_profiler.get()
+
+
+# SFSaveDeserializer.get/get_fn are only swapped for the profiled versions below while some profiler is
+# active, so parsing without one does not pay for the profiler lookup on every call.
+_plain_get = SFSaveDeserializer.get
+_plain_get_fn = SFSaveDeserializer.get_fn
+_install_lock = threading.Lock()
+_install_count = 0
+
+
+def _profiled_get(self: SFSaveDeserializer, item: type) -> typing.Any:
+    # other threads and contexts still run through here while a profiler is installed, but record nothing
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return _plain_get(self, item)
+    start = self.offset
+    profiler.enter(get_struct_name(item))
+    try:
+        return _plain_get(self, item)
+    finally:
+        profiler.exit(self.offset - start)
+
+
+def _profiled_get_fn(self: SFSaveDeserializer, fn: collections.abc.Callable[..., typing.Any]) -> typing.Any:
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return _plain_get_fn(self, fn)
+    start = self.offset
+    profiler.enter(get_struct_name(fn))
+    try:
+        return _plain_get_fn(self, fn)
+    finally:
+        profiler.exit(self.offset - start)
+
+
+def _install() -> None:
+    global _install_count  # noqa: PLW0603
+    with _install_lock:
+        if not _install_count:
+            SFSaveDeserializer.get = _profiled_get  # type: ignore[method-assign]
+            SFSaveDeserializer.get_fn = _profiled_get_fn  # type: ignore[method-assign]
+        _install_count += 1
+
+
+def _uninstall() -> None:
+    global _install_count  # noqa: PLW0603
+    with _install_lock:
+        _install_count -= 1
+        if not _install_count:
+            SFSaveDeserializer.get = _plain_get  # type: ignore[method-assign]
+            SFSaveDeserializer.get_fn = _plain_get_fn  # type: ignore[method-assign]
+
+
+class Profiler:
+    # Aggregates SFSaveDeserializer.get/get_fn calls made while active, per struct name (properties
+    # are decoded with get(), so every property type gets its own entry) and per nested struct path.
+    # total_time and bytes of a struct nested inside itself are counted at the outermost call only.
+    def __init__(self) -> None:
+        self._names: list[str] = []
+        # [start time, time spent in nested calls], in nanoseconds
+        self._frames: list[list[int]] = []
+        # name -> [count, bytes, total ns, self ns]
+        self._stats: dict[str, list[int]] = {}
+        self._self_times: collections.Counter[tuple[str, ...]] = collections.Counter()
+
+    @contextlib.contextmanager
+    def activate(self) -> collections.abc.Iterator[typing.Self]:
+        token = _active_profiler.set(self)
+        _install()
+        try:
+            yield self
+        finally:
+            _uninstall()
+            _active_profiler.reset(token)
+
+    def clear(self) -> None:
+        self._stats.clear()
+        self._self_times.clear()
+
+    def enter(self, name: str) -> None:
+        self._names.append(name)
+        self._frames.append([time.perf_counter_ns(), 0])
+
+    def exit(self, size: int) -> None:
+        end = time.perf_counter_ns()
+        start, nested = self._frames.pop()
+        elapsed = end - start
+        self._self_times[tuple(self._names)] += elapsed - nested
+        name = self._names.pop()
+        if self._frames:
+            self._frames[-1][1] += elapsed
+
+        stat = self._stats.get(name)
+        if stat is None:
+            stat = self._stats[name] = [0, 0, 0, 0]
+        stat[0] += 1
+        stat[3] += elapsed - nested
+        if name not in self._names:
+            stat[1] += size
+            stat[2] += elapsed
+
+    def stats(self, sort_by: ProfileSortKey = "self_time") -> list[ProfileStat]:
+        stats = [
+            ProfileStat(name, count, size, total / 1e9, self_time / 1e9)
+            for name, (count, size, total, self_time) in self._stats.items()
+        ]
+        return sorted(stats, key=lambda stat: getattr(stat, sort_by), reverse=True)
+
+    def format_report(self, sort_by: ProfileSortKey = "self_time", limit: int | None = None) -> str:
+        lines = [f"{'struct':<48} {'calls':>10} {'bytes':>12} {'total s':>10} {'self s':>10}"]
+        lines.extend(
+            f"{stat.name:<48} {stat.count:>10} {stat.bytes:>12} {stat.total_time:>10.4f} {stat.self_time:>10.4f}"
+            for stat in self.stats(sort_by)[:limit]
+        )
+        return "\n".join(lines)
+
+    def collapsed_stacks(self) -> list[str]:
+        # one "outer;inner;leaf <self time in microseconds>" line per struct path, as read by
+        # flamegraph.pl, speedscope and inferno
+        return [
+            f"{';'.join(path)} {elapsed // 1000}"
+            for path, elapsed in sorted(self._self_times.items())
+            if elapsed >= 1000  # noqa: PLR2004
+        ]
+
+    def write_collapsed(self, output_path: pathlib.Path) -> None:
+        output_path.write_text("".join(f"{line}\n" for line in self.collapsed_stacks()))
@@ -3,6 +3,10 @@ import collections.abc
 import logging
 import os
 import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from rich.progress import Progress
 
 logger = logging.getLogger(__name__)
 
@@ -11,70 +15,86 @@ class LogProgress:
     USE_RICH = os.getenv("SF_PROGRESS_USE_RICH", "1") != "0"
     LOG_EVERY = int(os.getenv("SF_PROGRESS_LOG_EVERY", "100"))
 
-    if USE_RICH:
-        from rich.progress import (  # noqa: PLC0415
-            BarColumn,
-            MofNCompleteColumn,
-            Progress,
-            SpinnerColumn,
-            TextColumn,
-            TimeElapsedColumn,
-            TimeRemainingColumn,
-        )
-
-        progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
-        )
+    _progress: typing.ClassVar["Progress | None"] = None
 
-        @classmethod
-        def iter[T](  # type: ignore
-            cls,
-            iterable: collections.abc.Iterable[T],
-            total: int | None = None,
-            desc: str = "",
-        ) -> collections.abc.Iterable[T]:
-            if total == 0:
-                yield from iterable
-            with cls.progress:
-                task = cls.progress.add_task(desc, total=total)
-                for item in iterable:
-                    yield item
-                    cls.progress.advance(task)
+    @classmethod
+    def get_progress(cls) -> "Progress":
+        # rich is imported with the first progress bar rather than with the package
+        if cls._progress is None:
+            from rich.progress import (  # noqa: PLC0415
+                BarColumn,
+                MofNCompleteColumn,
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+                TimeElapsedColumn,
+                TimeRemainingColumn,
+            )
 
-    else:
+            cls._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+                TimeRemainingColumn(),
+            )
+        return cls._progress
 
-        @classmethod
-        def iter[T](
-            cls,
-            iterable: collections.abc.Iterable[T],
-            total: int | None = None,
-            desc: str = "",
-        ) -> collections.abc.Iterable[T]:
-            if total == 0:
-                yield from iterable
-            start = time.monotonic()
-            last_log = 0
+    @classmethod
+    def iter[T](
+        cls,
+        iterable: collections.abc.Iterable[T],
+        total: int | None = None,
+        desc: str = "",
+    ) -> collections.abc.Iterable[T]:
+        if cls.USE_RICH:
+            return cls._iter_rich(iterable, total, desc)
+        return cls._iter_log(iterable, total, desc)
 
-            for i, item in enumerate(iterable, 1):
+    @classmethod
+    def _iter_rich[T](
+        cls,
+        iterable: collections.abc.Iterable[T],
+        total: int | None,
+        desc: str,
+    ) -> collections.abc.Iterator[T]:
+        if total == 0:
+            yield from iterable
+        progress = cls.get_progress()
+        with progress:
+            task = progress.add_task(desc, total=total)
+            for item in iterable:
                 yield item
+                progress.advance(task)
+
+    @classmethod
+    def _iter_log[T](
+        cls,
+        iterable: collections.abc.Iterable[T],
+        total: int | None,
+        desc: str,
+    ) -> collections.abc.Iterator[T]:
+        if total == 0:
+            yield from iterable
+        start = time.monotonic()
+        last_log = 0
+
+        for i, item in enumerate(iterable, 1):
+            yield item
 
-                if i - last_log >= cls.LOG_EVERY or i == total:
-                    last_log = i
-                    elapsed = time.monotonic() - start
-                    rate = i / elapsed if elapsed > 0 else 0.0
-                    if total is not None:
-                        logger.info(f"{desc}: {i}/{total} ({i / total:.1%}) {rate:.1f} it/s")
-                    else:
-                        logger.info(f"{desc}: {i} it/s {rate:.1f} it/s")
-            if total is not None:
-                logger.info(f"{desc}: {total}/{total} (100.0%) Completed")
-            else:
-                logger.info(f"{desc}: Completed")
+            if i - last_log >= cls.LOG_EVERY or i == total:
+                last_log = i
+                elapsed = time.monotonic() - start
+                rate = i / elapsed if elapsed > 0 else 0.0
+                if total is not None:
+                    logger.info(f"{desc}: {i}/{total} ({i / total:.1%}) {rate:.1f} it/s")
+                else:
+                    logger.info(f"{desc}: {i} it/s {rate:.1f} it/s")
+        if total is not None:
+            logger.info(f"{desc}: {total}/{total} (100.0%) Completed")
+        else:
+            logger.info(f"{desc}: Completed")
 
     @classmethod
     def iter_list[T](
@@ -0,0 +1,120 @@
+import collections.abc
+import functools
+import pathlib
+import typing
+
+from sat_sav_parse.exceptions import ParseError
+from sat_sav_parse.index import ObjectLocation, iter_level_locations, iter_level_objects
+from sat_sav_parse.models import ObjectHeaderType, PropertyType, PropertyTypeName, read_property_tag
+from sat_sav_parse.models.properties import PROPERTY_CLASSES, deserialize_properties
+from sat_sav_parse.models.save_file_body import iter_save_file_body
+from sat_sav_parse.reader import open_save_file
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "SelectedObject",
+    "select",
+    "select_objects",
+)
+
+type HeaderPredicate = collections.abc.Callable[[ObjectHeaderType], bool]
+type PropertiesPredicate = collections.abc.Callable[[dict[str, PropertyType]], bool]
+
+
+class SelectedObject(typing.NamedTuple):
+    location: ObjectLocation
+    # only the selected properties, in file order
+    properties: list[PropertyType]
+
+    @property
+    def instance_name(self) -> str:
+        return self.location.instance_name
+
+    @property
+    def header(self) -> ObjectHeaderType:
+        return self.location.header
+
+    def by_name(self) -> dict[str, PropertyType]:
+        # static array elements after the first are only in properties
+        by_name: dict[str, PropertyType] = {}
+        for prop in self.properties:
+            by_name.setdefault(prop.name, prop)
+        return by_name
+
+
+def _read_properties(
+    data: bytes,
+    location: ObjectLocation,
+    fields: collections.abc.Collection[str] | None,
+) -> list[PropertyType]:
+    # Every tag is read, but only selected properties are decoded; the others, including ones of
+    # unsupported types, are skipped by their payload size. Selecting all of them is a plain property
+    # list parse, which can use the layout cache.
+    if fields is None:
+        des = SFSaveDeserializer(data, location.properties_offset(data))
+        return des.get_fn(functools.partial(deserialize_properties, layout_key=location.header.type_path))
+    properties: list[PropertyType] = []
+    if not fields:
+        return properties
+    offset = location.properties_offset(data)
+    while (tag := read_property_tag(data, offset)) is not None:
+        if tag.name in fields:
+            if tag.type_name not in PROPERTY_CLASSES:
+                raise ParseError(
+                    "unsupported_property_type",
+                    "Property {} of {} has an unsupported type: {}",
+                    tag.name,
+                    location.instance_name,
+                    tag.type_name,
+                )
+            property_cls = PROPERTY_CLASSES[PropertyTypeName(tag.type_name)]
+            properties.append(SFSaveDeserializer(data, offset).get(property_cls))  # type: ignore
+        offset = tag.end_offset
+    return properties
+
+
+def _iter_locations(des: SFSaveDeserializer) -> collections.abc.Iterator[ObjectLocation]:
+    for name, value in iter_save_file_body(des, level_iter=iter_level_locations):
+        match name:
+            case "sublevels":
+                for level in value:
+                    yield from iter_level_objects(level)
+            case "persistent_level":
+                yield from iter_level_objects(value)
+
+
+def select_objects(
+    des: SFSaveDeserializer,
+    *,
+    type_path: str | collections.abc.Container[str] | None = None,
+    header: HeaderPredicate | None = None,
+    where: PropertiesPredicate | None = None,
+    fields: collections.abc.Iterable[str] | None = None,
+) -> collections.abc.Iterator[SelectedObject]:
+    # Objects are walked header by header. An object whose header fails type_path or header is
+    # skipped by its size without reading its data; for the others only the properties named in
+    # fields (all when None) are decoded, and where is called with them by name.
+    type_paths = {type_path} if isinstance(type_path, str) else type_path
+    selected = frozenset(fields) if fields is not None else None
+    for location in _iter_locations(des):
+        if type_paths is not None and location.header.type_path not in type_paths:
+            continue
+        if header is not None and not header(location.header):
+            continue
+        result = SelectedObject(location, _read_properties(des.content, location, selected))
+        if where is not None and not where(result.by_name()):
+            continue
+        yield result
+
+
+def select(
+    file_path: pathlib.Path,
+    *,
+    type_path: str | collections.abc.Container[str] | None = None,
+    header: HeaderPredicate | None = None,
+    where: PropertiesPredicate | None = None,
+    fields: collections.abc.Iterable[str] | None = None,
+) -> collections.abc.Iterator[SelectedObject]:
+    # the save stays open until the iterator is exhausted or closed
+    with open_save_file(file_path) as (_, des):
+        yield from select_objects(des, type_path=type_path, header=header, where=where, fields=fields)
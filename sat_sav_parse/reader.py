@@ -0,0 +1,98 @@
+import collections.abc
+import concurrent.futures
+import contextlib
+import mmap
+import os
+import pathlib
+import tempfile
+import typing
+
+from sat_sav_parse.exceptions import ParseError
+from sat_sav_parse.models import CSaveFileBody, SaveFileHeader
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "HEADER_PREFIX_SIZE",
+    "SaveHeaderScan",
+    "map_file",
+    "open_save_file",
+    "read_header_prefix",
+    "read_save_header",
+    "scan_save_headers",
+)
+
+HEADER_PREFIX_SIZE: typing.Final[int] = 4096
+
+
+class SaveHeaderScan(typing.NamedTuple):
+    path: pathlib.Path
+    header: SaveFileHeader | None
+    error: Exception | None
+
+
+def read_header_prefix(f: typing.BinaryIO, prefix_size: int = HEADER_PREFIX_SIZE) -> tuple[SaveFileHeader, int]:
+    # Only a prefix of the save is read; it is doubled whenever a string (e.g. mod metadata)
+    # runs past it, until the header fits or the whole file has been read.
+    data = f.read(prefix_size)
+    while True:
+        des = SFSaveDeserializer(data)
+        try:
+            return des.get(SaveFileHeader), des.offset
+        except ParseError as e:
+            if e.code != "unexpected_end_of_data":
+                raise
+            more = f.read(len(data))
+            if not more:
+                raise
+            data += more
+
+
+def read_save_header(file_path: pathlib.Path, prefix_size: int = HEADER_PREFIX_SIZE) -> SaveFileHeader:
+    with file_path.open("rb") as f:
+        header, _ = read_header_prefix(f, prefix_size)
+    return header
+
+
+def scan_save_headers(
+    paths: collections.abc.Iterable[pathlib.Path],
+    *,
+    max_workers: int | None = None,
+) -> collections.abc.Iterator[SaveHeaderScan]:
+    def _scan(path: pathlib.Path) -> SaveHeaderScan:
+        try:
+            return SaveHeaderScan(path, read_save_header(path), None)
+        except (OSError, ValueError) as e:
+            return SaveHeaderScan(path, None, e)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(_scan, paths)
+
+
+@contextlib.contextmanager
+def map_file(f: typing.BinaryIO) -> collections.abc.Iterator[mmap.mmap | bytes]:
+    # mmap refuses to map an empty file, e.g. the spool of a save with an empty body
+    if not os.fstat(f.fileno()).st_size:
+        yield b""
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        yield content
+
+
+@contextlib.contextmanager
+def open_save_file(
+    file_path: pathlib.Path,
+) -> collections.abc.Iterator[tuple[SaveFileHeader, SFSaveDeserializer]]:
+    # The save is memory-mapped and the body is inflated chunk by chunk into an anonymous
+    # temporary file, so neither is held in process memory while the body is walked.
+    with (
+        file_path.open("rb") as f,
+        map_file(f) as content,
+        tempfile.TemporaryFile() as body_file,
+    ):
+        des = SFSaveDeserializer(content)  # type: ignore
+        header = des.get(SaveFileHeader)
+        CSaveFileBody.decompress_to(des, body_file)
+        body_file.flush()
+
+        with map_file(body_file) as body:
+            yield header, SFSaveDeserializer(body)  # type: ignore
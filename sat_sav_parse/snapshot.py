@@ -0,0 +1,423 @@
+import array
+import contextlib
+import functools
+import gc
+import hashlib
+import io
+import json
+import logging
+import pathlib
+import struct
+import typing
+
+import pydantic
+
+from sat_sav_parse.models import (
+    ActorHeader,
+    ActorObject,
+    ComponentHeader,
+    ComponentObject,
+    HeaderType,
+    Level,
+    LevelGroupingGrid,
+    LevelObjectType,
+    ObjectHeaderType,
+    ObjectReference,
+    PropertyType,
+    Quaternion,
+    SaveFileBody,
+    SaveFileHeader,
+    Vector3,
+)
+from sat_sav_parse.models.properties.map import MAP_ITEMS_CONTEXT
+from sat_sav_parse.utils import RawBytes, atomic_write
+
+__all__ = (
+    "SNAPSHOT_SUFFIX",
+    "SaveSnapshot",
+    "SnapshotLevel",
+    "load_snapshot",
+    "schema_digest",
+    "snapshot_path",
+    "write_snapshot",
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC: typing.Final[bytes] = b"SFSNAP\x00\x02"
+SNAPSHOT_SUFFIX: typing.Final[str] = ".snap"
+
+# A snapshot is a cache of one parsed save:
+#   magic, schema digest (32 bytes), u64 source file size, blob checksum, blob header and body fields (JSON),
+#   string table (u32 count, blob per string), u32 level count, then per level:
+#   blob level fields (JSON), u32 object count, object header columns, object columns,
+#   u64 blob offsets (count + 1) and the concatenated per-object JSON documents of
+#   (parent_object_reference, components, properties, trailing).
+# Header strings are interned in the table and referenced by index from the columns. Everything that is
+# not a column is validated when read, and a snapshot written against other model schemas is ignored.
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_NO_STRING: typing.Final[int] = 0xFFFFFFFF
+_TRANSFORM_SIZE: typing.Final[int] = 10
+_DUMP_CONTEXT: typing.Final[dict[str, bool]] = {MAP_ITEMS_CONTEXT: True}
+
+
+class _SnapshotModel(pydantic.BaseModel):
+    # NaN and infinite floats are written as JSON constants rather than null, so they load back
+    model_config = pydantic.ConfigDict(ser_json_inf_nan="constants")
+
+
+class _BodyFields(_SnapshotModel):
+    header: SaveFileHeader
+    unknown_1: int
+    unknown_2: int
+    grids: list[LevelGroupingGrid]
+    references: list[ObjectReference]
+
+
+class _LevelFields(_SnapshotModel):
+    sublevel_name: str | None
+    object_header_and_collectables_size: int
+    extra_level_names_count: int | None
+    extra_level_names: str | None
+    collectables: list[ObjectReference]
+    objects_size: int
+    save_version: int
+    second_collectables: list[ObjectReference]
+
+
+class _ObjectData(_SnapshotModel):
+    parent_object_reference: ObjectReference | None
+    components: list[ObjectReference] | None
+    properties: list[PropertyType]
+    trailing: RawBytes
+
+
+@functools.cache
+def schema_digest() -> bytes:
+    # Changes whenever a model that ends up in a snapshot changes shape, including the header models
+    # restored from the columns without validation.
+    schemas = [
+        model.model_json_schema() for model in (SaveFileHeader, SaveFileBody, _BodyFields, _LevelFields, _ObjectData)
+    ]
+    return hashlib.sha256(json.dumps([SNAPSHOT_MAGIC.hex(), schemas], sort_keys=True).encode()).digest()
+
+
+def _restore_model[T: pydantic.BaseModel](cls: type[T], state: dict[str, typing.Any]) -> T:
+    # Same result as model_construct() without its per-field default handling; state must be in
+    # field order, as serialization follows __dict__ order.
+    obj = cls.__new__(cls)
+    object.__setattr__(obj, "__dict__", state)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(state))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
+
+
+@contextlib.contextmanager
+def _gc_paused() -> typing.Iterator[None]:
+    # Materializing a level allocates hundreds of thousands of containers that all survive, and
+    # the cyclic collector would otherwise rescan them over and over.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def snapshot_path(file_path: pathlib.Path) -> pathlib.Path:
+    return file_path.with_name(file_path.name + SNAPSHOT_SUFFIX)
+
+
+class _Writer:
+    def __init__(self, fp: typing.BinaryIO) -> None:
+        self.fp = fp
+
+    def u32(self, value: int) -> None:
+        self.fp.write(_U32.pack(value))
+
+    def u64(self, value: int) -> None:
+        self.fp.write(_U64.pack(value))
+
+    def blob(self, value: bytes) -> None:
+        self.u32(len(value))
+        self.fp.write(value)
+
+    def model(self, value: pydantic.BaseModel) -> None:
+        self.blob(value.model_dump_json(context=_DUMP_CONTEXT).encode())
+
+    def column(self, value: array.array) -> None:
+        self.fp.write(value.tobytes())
+
+
+class _Reader:
+    def __init__(self, data: memoryview) -> None:
+        self.data = data
+        self.offset = 0
+
+    def raw(self, size: int) -> memoryview:
+        value = self.data[self.offset : self.offset + size]
+        self.offset += size
+        return value
+
+    def u32(self) -> int:
+        return _U32.unpack(self.raw(_U32.size))[0]
+
+    def u64(self) -> int:
+        return _U64.unpack(self.raw(_U64.size))[0]
+
+    def blob(self) -> memoryview:
+        return self.raw(self.u32())
+
+    def model[T: pydantic.BaseModel](self, cls: type[T]) -> T:
+        return cls.model_validate_json(bytes(self.blob()))
+
+    def column(self, typecode: str, count: int) -> array.array:
+        column = array.array(typecode)
+        column.frombytes(self.raw(column.itemsize * count))
+        return column
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+
+    def __call__(self, value: str | None) -> int:
+        if value is None:
+            return _NO_STRING
+        return self.index.setdefault(value, len(self.index))
+
+
+def _write_level(w: _Writer, level: Level, strings: _StringTable) -> None:
+    w.model(_LevelFields.model_validate({name: getattr(level, name) for name in _LevelFields.model_fields}))
+    types = array.array("B")
+    type_paths, root_objects, instance_names, unknowns, parents = (array.array("I") for _ in range(5))
+    flags = array.array("B")
+    transforms = array.array("f")
+    for header in level.object_headers:
+        types.append(header.type)
+        type_paths.append(strings(header.type_path))
+        root_objects.append(strings(header.root_object))
+        instance_names.append(strings(header.instance_name))
+        unknowns.append(header.unknown)
+        if isinstance(header, ActorHeader):
+            parents.append(_NO_STRING)
+            flags.append(header.need_transform | header.was_placed_in_level << 1)
+            transforms.extend(
+                (
+                    *(header.rotation.x, header.rotation.y, header.rotation.z, header.rotation.w),
+                    *(header.position.x, header.position.y, header.position.z),
+                    *(header.scale.x, header.scale.y, header.scale.z),
+                ),
+            )
+        else:
+            parents.append(strings(header.parent_actor_name))
+            flags.append(0)
+            transforms.extend((0.0,) * _TRANSFORM_SIZE)
+
+    w.u32(len(level.object_headers))
+    for column in (types, type_paths, root_objects, instance_names, unknowns, parents, flags, transforms):
+        w.column(column)
+
+    save_versions, object_flags, sizes = (array.array("I") for _ in range(3))
+    offsets = array.array("Q", [0])
+    blobs = io.BytesIO()
+    for obj in level.objects:
+        save_versions.append(obj.save_version)
+        object_flags.append(obj.flag)
+        sizes.append(obj.size)
+        data = _ObjectData.model_construct(
+            parent_object_reference=obj.parent_object_reference if isinstance(obj, ActorObject) else None,
+            components=obj.components if isinstance(obj, ActorObject) else None,
+            properties=obj.properties,
+            trailing=obj.trailing,
+        )
+        blobs.write(data.model_dump_json(context=_DUMP_CONTEXT).encode())
+        offsets.append(blobs.tell())
+    w.u32(len(level.objects))
+    for column in (save_versions, object_flags, sizes, offsets):
+        w.column(column)
+    w.fp.write(blobs.getbuffer())
+
+
+def write_snapshot(path: pathlib.Path, file_size: int, header: SaveFileHeader, body: SaveFileBody) -> None:
+    strings = _StringTable()
+    levels = io.BytesIO()
+    w = _Writer(levels)
+    for level in (*body.sublevels, body.persistent_level):
+        _write_level(w, level, strings)
+
+    with atomic_write(path) as fp:
+        w.fp = fp
+        fp.write(SNAPSHOT_MAGIC)
+        fp.write(schema_digest())
+        w.u64(file_size)
+        w.blob(header.checksum)
+        w.model(
+            _BodyFields.model_construct(
+                header=header,
+                unknown_1=body.unknown_1,
+                unknown_2=body.unknown_2,
+                grids=body.grids,
+                references=body.references,
+            ),
+        )
+        w.u32(len(strings.index))
+        for value in strings.index:
+            w.blob(value.encode())
+        w.u32(len(body.sublevels) + 1)
+        fp.write(levels.getbuffer())
+
+
+class SnapshotLevel:
+    def __init__(self, r: _Reader, strings: list[str]) -> None:
+        self.fields = dict(r.model(_LevelFields))
+        self.strings = strings
+        count = r.u32()
+        self.header_count = count
+        self.types = r.column("B", count)
+        self.type_paths = r.column("I", count)
+        self.root_objects = r.column("I", count)
+        self.instance_names = r.column("I", count)
+        self.unknowns = r.column("I", count)
+        self.parents = r.column("I", count)
+        self.flags = r.column("B", count)
+        self.transforms = r.column("f", count * _TRANSFORM_SIZE)
+
+        count = r.u32()
+        self.object_count = count
+        self.save_versions = r.column("I", count)
+        self.object_flags = r.column("I", count)
+        self.sizes = r.column("I", count)
+        self.offsets = r.column("Q", count + 1)
+        self.blobs = r.raw(self.offsets[-1])
+
+    def __len__(self) -> int:
+        return self.object_count
+
+    def object_header(self, idx: int) -> ObjectHeaderType:
+        strings = self.strings
+        if self.types[idx] == HeaderType.COMPONENT:
+            return _restore_model(
+                ComponentHeader,
+                {
+                    "type": HeaderType.COMPONENT,
+                    "type_path": strings[self.type_paths[idx]],
+                    "root_object": strings[self.root_objects[idx]],
+                    "instance_name": strings[self.instance_names[idx]],
+                    "unknown": self.unknowns[idx],
+                    "parent_actor_name": strings[self.parents[idx]],
+                },
+            )
+        t = self.transforms[idx * _TRANSFORM_SIZE : (idx + 1) * _TRANSFORM_SIZE]
+        return _restore_model(
+            ActorHeader,
+            {
+                "type": HeaderType.ACTOR,
+                "type_path": strings[self.type_paths[idx]],
+                "root_object": strings[self.root_objects[idx]],
+                "instance_name": strings[self.instance_names[idx]],
+                "unknown": self.unknowns[idx],
+                "rotation": _restore_model(Quaternion, {"x": t[0], "y": t[1], "z": t[2], "w": t[3]}),
+                "position": _restore_model(Vector3, {"x": t[4], "y": t[5], "z": t[6]}),
+                "scale": _restore_model(Vector3, {"x": t[7], "y": t[8], "z": t[9]}),
+                "need_transform": bool(self.flags[idx] & 1),
+                "was_placed_in_level": bool(self.flags[idx] & 2),
+            },
+        )
+
+    def object(self, idx: int, header: ObjectHeaderType | None = None) -> LevelObjectType:
+        if header is None:
+            header = self.object_header(idx)
+        data = _ObjectData.model_validate_json(bytes(self.blobs[self.offsets[idx] : self.offsets[idx + 1]]))
+        if isinstance(header, ActorHeader):
+            return _restore_model(
+                ActorObject,
+                {
+                    "type": HeaderType.ACTOR,
+                    "header": header,
+                    "save_version": self.save_versions[idx],
+                    "flag": self.object_flags[idx],
+                    "size": self.sizes[idx],
+                    "parent_object_reference": data.parent_object_reference,
+                    "components": data.components,
+                    "properties": data.properties,
+                    "trailing": data.trailing,
+                },
+            )
+        return _restore_model(
+            ComponentObject,
+            {
+                "type": HeaderType.COMPONENT,
+                "header": header,
+                "save_version": self.save_versions[idx],
+                "flag": self.object_flags[idx],
+                "size": self.sizes[idx],
+                "properties": data.properties,
+                "trailing": data.trailing,
+            },
+        )
+
+    def to_model(self) -> Level:
+        with _gc_paused():
+            return self._to_model()
+
+    def _to_model(self) -> Level:
+        object_headers = [self.object_header(idx) for idx in range(self.header_count)]
+        state = {
+            **self.fields,
+            "object_headers": object_headers,
+            "objects": [self.object(idx, object_headers[idx]) for idx in range(self.object_count)],
+        }
+        return _restore_model(Level, {name: state[name] for name in Level.model_fields})
+
+
+class SaveSnapshot:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        r = _Reader(memoryview(data))
+        if bytes(r.raw(len(SNAPSHOT_MAGIC))) != SNAPSHOT_MAGIC:
+            msg = "Not a save snapshot"
+            raise ValueError(msg)
+        if bytes(r.raw(len(schema_digest()))) != schema_digest():
+            msg = "Snapshot was written for other model schemas"
+            raise ValueError(msg)
+        self.file_size = r.u64()
+        self.checksum = bytes(r.blob())
+        fields = r.model(_BodyFields)
+        self.header = fields.header
+        self.fields = {name: value for name, value in fields if name != "header"}
+        strings = [bytes(r.blob()).decode() for _ in range(r.u32())]
+        *self.sublevels, self.persistent_level = [SnapshotLevel(r, strings) for _ in range(r.u32())]
+
+    def matches(self, file_size: int, checksum: bytes) -> bool:
+        return self.file_size == file_size and self.checksum == checksum
+
+    @functools.cached_property
+    def body(self) -> SaveFileBody:
+        with _gc_paused():
+            sublevels = [level.to_model() for level in self.sublevels]
+        state = {
+            **self.fields,
+            "sublevels": sublevels,
+            "persistent_level": self.persistent_level.to_model(),
+        }
+        return _restore_model(SaveFileBody, {name: state[name] for name in SaveFileBody.model_fields})
+
+
+def load_snapshot(path: pathlib.Path) -> SaveSnapshot | None:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    if data[: len(SNAPSHOT_MAGIC) + len(schema_digest())] != SNAPSHOT_MAGIC + schema_digest():
+        # e.g. written before the models changed; the save is parsed again and the snapshot replaced
+        logger.info("Ignoring snapshot %s written for other model schemas", path)
+        return None
+    try:
+        return SaveSnapshot(data)
+    except Exception:  # noqa: BLE001
+        logger.warning("Ignoring unreadable snapshot %s", path, exc_info=True)
+        return None
@@ -0,0 +1,123 @@
+import collections.abc
+import pathlib
+import typing
+
+import pydantic
+
+from sat_sav_parse.index import ObjectLocation, iter_level_locations
+from sat_sav_parse.models import ActorHeader
+from sat_sav_parse.models.save_file_body import iter_save_file_body
+from sat_sav_parse.reader import open_save_file
+from sat_sav_parse.structs import SFSaveDeserializer
+
+__all__ = (
+    "LevelStats",
+    "SaveStats",
+    "TypeStats",
+    "compute_save_stats",
+    "read_save_stats",
+)
+
+
+class TypeStats(pydantic.BaseModel):
+    type_path: str
+    objects: int
+    # sum of the objects' size fields: everything after the object prefix, properties included
+    bytes: int
+
+
+class LevelStats(pydantic.BaseModel):
+    # None for the persistent level
+    sublevel_name: str | None
+    objects: int
+    actors: int
+    components: int
+    bytes: int
+    collectables: int
+    # parent and component references at the start of actor data
+    references: int
+
+
+class SaveStats(pydantic.BaseModel):
+    body_size: int
+    levels: list[LevelStats]
+    # most common first
+    types: list[TypeStats]
+    # object references listed at the end of the body
+    references: int
+
+    @pydantic.computed_field
+    @property
+    def objects(self) -> int:
+        return sum(level.objects for level in self.levels)
+
+    @pydantic.computed_field
+    @property
+    def bytes(self) -> int:
+        return sum(level.bytes for level in self.levels)
+
+
+def _actor_references(data: bytes, location: ObjectLocation) -> int:
+    # parent object reference, then the component count; component references are string pairs
+    offset = location.data_offset
+    offset, _ = SFSaveDeserializer.parse_string(offset, data)
+    offset, parent = SFSaveDeserializer.parse_string(offset, data)
+    _, component_count = SFSaveDeserializer.parse_u32(offset, data)
+    return component_count + (parent != "")
+
+
+def _level_stats(
+    fields: collections.abc.Iterable[tuple[str, typing.Any]],
+    data: bytes,
+    types: dict[str, list[int]],
+) -> LevelStats:
+    stats = LevelStats(sublevel_name=None, objects=0, actors=0, components=0, bytes=0, collectables=0, references=0)
+    for name, value in fields:
+        match name:
+            case "sublevel_name":
+                stats.sublevel_name = value
+            case "collectables" | "second_collectables":
+                stats.collectables += len(value)
+            case "objects":
+                for location in value:
+                    stats.objects += 1
+                    stats.bytes += location.size
+                    if isinstance(location.header, ActorHeader):
+                        stats.actors += 1
+                        stats.references += _actor_references(data, location)
+                    else:
+                        stats.components += 1
+                    type_stats = types.setdefault(location.header.type_path, [0, 0])
+                    type_stats[0] += 1
+                    type_stats[1] += location.size
+    return stats
+
+
+def compute_save_stats(des: SFSaveDeserializer) -> SaveStats:
+    # Only object headers and the reference prefix of actor data are decoded; object data is skipped
+    # by its size field, so no property is parsed. Headers are retained so each is decoded once.
+    levels: list[LevelStats] = []
+    types: dict[str, list[int]] = {}
+    references = 0
+    for name, value in iter_save_file_body(des, level_iter=iter_level_locations):
+        match name:
+            case "sublevels":
+                levels.extend(_level_stats(level, des.content, types) for level in value)
+            case "persistent_level":
+                levels.append(_level_stats(value, des.content, types))
+            case "references":
+                references = len(value)
+    return SaveStats(
+        body_size=len(des.content),
+        levels=levels,
+        types=[
+            TypeStats(type_path=type_path, objects=count, bytes=size)
+            for type_path, (count, size) in sorted(types.items(), key=lambda item: (-item[1][0], item[0]))
+        ],
+        references=references,
+    )
+
+
+def read_save_stats(file_path: pathlib.Path) -> SaveStats:
+    with open_save_file(file_path) as (_, des):
+        return compute_save_stats(des)
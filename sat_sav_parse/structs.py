@@ -40,76 +40,81 @@ type SFSaveDeserializeFn[T] = collections.abc.Callable[["SFSaveDeserializer"], T
 
 class SFSaveSerializer:
     def __init__(self, init_content: bytes | None = None) -> None:
-        self.content = init_content or b""
-        logger.log(TRACE_BIN_LOG_LEVEL, "Serializator init size=%d", len(self.content))
+        # appended to in place; bytes concatenation would copy the whole content on every add
+        self.buffer = bytearray(init_content or b"")
+        logger.log(TRACE_BIN_LOG_LEVEL, "Serializator init size=%d", len(self.buffer))
+
+    @property
+    def content(self) -> bytes:
+        return bytes(self.buffer)
 
     def add(self, s: SFSaveSerializable) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "serialize object %s", type(s).__qualname__)
-        before = len(self.content)
+        before = len(self.buffer)
         s.__serialize__(self)
         logger.log(
             TRACE_BIN_LOG_LEVEL,
             "serialize object %s done: +%d bytes",
             type(s).__qualname__,
-            len(self.content) - before,
+            len(self.buffer) - before,
         )
         return self
 
     def add_fn[T](self, fn: SFSaveSerializeFn[T], obj: T) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "serialize fn %s(%r)", fn.__qualname__, obj)
-        before = len(self.content)
+        before = len(self.buffer)
         fn(self, obj)
         logger.log(
             TRACE_BIN_LOG_LEVEL,
             "serialize fn %s done: +%d bytes",
             fn.__qualname__,
-            len(self.content) - before,
+            len(self.buffer) - before,
         )
         return self
 
     def add_raw(self, value: bytes) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_raw %d bytes", len(value))
-        self.content += value
+        self.buffer += value
         return self
 
     def add_i8(self, value: int) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_i8 %d", value)
-        self.content += struct.pack("<b", value)
+        self.buffer += struct.pack("<b", value)
         return self
 
     def add_i32(self, value: int) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_i32 %d", value)
-        self.content += struct.pack("<i", value)
+        self.buffer += struct.pack("<i", value)
         return self
 
     def add_i64(self, value: int) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_i64 %d", value)
-        self.content += struct.pack("<q", value)
+        self.buffer += struct.pack("<q", value)
         return self
 
     def add_u8(self, value: int) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_u8 %d", value)
-        self.content += struct.pack("<B", value)
+        self.buffer += struct.pack("<B", value)
         return self
 
     def add_u32(self, value: int) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_u32 %d", value)
-        self.content += struct.pack("<I", value)
+        self.buffer += struct.pack("<I", value)
         return self
 
     def add_u64(self, value: int) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_u64 %d", value)
-        self.content += struct.pack("<Q", value)
+        self.buffer += struct.pack("<Q", value)
         return self
 
     def add_float(self, value: float) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_float %f", value)
-        self.content += struct.pack("<f", value)
+        self.buffer += struct.pack("<f", value)
         return self
 
     def add_double(self, value: float) -> typing.Self:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_double %f", value)
-        self.content += struct.pack("<d", value)
+        self.buffer += struct.pack("<d", value)
         return self
 
     def add_u8_bool(self, value: bool) -> typing.Self:
@@ -124,19 +129,19 @@ class SFSaveSerializer:
         logger.log(TRACE_BIN_LOG_LEVEL, "add_string %r", value)
 
         if not value:
-            self.content += struct.pack("<i", 0)
+            self.buffer += struct.pack("<i", 0)
             return self
 
         try:
             encoded = value.encode("utf-8")
             length = len(encoded) + 1
             logger.log(TRACE_BIN_LOG_LEVEL, "string utf-8 bytes=%d", length)
-            self.content += struct.pack("<i", length) + encoded + b"\x00"
+            self.buffer += struct.pack("<i", length) + encoded + b"\x00"
         except UnicodeEncodeError:
             encoded = value.encode("utf-16-le")
             char_count = (len(encoded) // 2) + 1
             logger.log(TRACE_BIN_LOG_LEVEL, "string utf-16 chars=%d", char_count)
-            self.content += struct.pack("<i", -char_count) + encoded + b"\x00\x00"
+            self.buffer += struct.pack("<i", -char_count) + encoded + b"\x00\x00"
 
         return self
 
@@ -144,13 +149,13 @@ class SFSaveSerializer:
     def get(cls, s: SFSaveSerializable) -> bytes:
         ser = cls()
         ser.add(s)  # type: ignore
-        return ser.content
+        return bytes(ser.content)
 
     @classmethod
     def get_fn[T](cls, fn: SFSaveSerializeFn[T], obj: T | None = None) -> bytes:
         ser = cls()
         ser.add_fn(fn, obj)  # type: ignore
-        return ser.content
+        return bytes(ser.content)
 
 
 class SFSaveDeserializer:
@@ -335,7 +340,12 @@ class SFSaveDeserializer:
                 data_len,
                 len(data),
             )
-            raise ParseError(f"Offset {offset} too large in {len(data)}-byte data.")
+            raise ParseError(
+                "unexpected_end_of_data",
+                "Offset {} too large in {}-byte data.",
+                offset,
+                len(data),
+            )
 
         raw = data[offset:next_offset]
         value = struct.unpack(unpack_flag, raw)[0] if unpack_flag else raw
@@ -411,7 +421,12 @@ class SFSaveDeserializer:
                 offset,
                 len(data),
             )
-            raise ParseError(f"String length too large, size {string_len} at offset {offset - 4}.")
+            raise ParseError(
+                "unexpected_end_of_data",
+                "String length too large, size {} at offset {}.",
+                string_len,
+                offset - 4,
+            )
 
         try:
             if string_len > 0:
@@ -1,20 +1,59 @@
 import base64
+import collections.abc
+import enum
+import functools
+import logging
+import os
+import pathlib
+import shutil
+import struct
+import tempfile
 import typing
 from contextlib import contextmanager
 
+import pydantic
+
+from sat_sav_parse.const import TRACE_BIN_LOG_LEVEL
 from sat_sav_parse.exceptions import ParseError
 from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
 
 __all__ = (
+    "RawBytes",
     "StrEnumDeserializerMixin",
     "StrEnumSerializerMixin",
     "U8EnumDeserializerMixin",
     "U8EnumSerializerMixin",
     "U32EnumDeserializerMixin",
     "U32EnumSerializerMixin",
+    "atomic_write",
     "expect_size",
+    "parse_str_enum",
 )
 
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def atomic_write(
+    path: pathlib.Path,
+    *,
+    mode_from: pathlib.Path | None = None,
+) -> collections.abc.Iterator[typing.BinaryIO]:
+    # Yields a temporary file next to path that replaces path once the block exits; if the block
+    # raises, the temporary file is removed and path is left as it was. mode_from is a file whose
+    # permission bits are copied to the result.
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+    tmp_path = pathlib.Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            yield fp
+        if mode_from is not None:
+            shutil.copymode(mode_from, tmp_path)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 @contextmanager
 def expect_size(p: SFSaveDeserializer, size: int, what: str):
@@ -30,10 +69,32 @@ class StrEnumSerializerMixin:
         ser.add_string(self)  # type: ignore
 
 
+@functools.cache
+def _str_enum_lookup[E: enum.StrEnum](enum_cls: type[E]) -> dict[bytes, E]:
+    lookup = {}
+    for member in enum_cls:
+        encoded = member.value.encode("utf-8")
+        lookup[struct.pack("<i", len(encoded) + 1) + encoded + b"\x00"] = member
+    return lookup
+
+
+def parse_str_enum[E: enum.StrEnum](offset: int, data: bytes, enum_cls: type[E]) -> tuple[int, E]:
+    if offset + 4 <= len(data):
+        next_offset = offset + 4 + struct.unpack_from("<i", data, offset)[0]
+        member = _str_enum_lookup(enum_cls).get(data[offset:next_offset])
+        if member is not None:
+            return next_offset, member
+    next_offset, value = SFSaveDeserializer.parse_string(offset, data)
+    return next_offset, enum_cls(value)
+
+
 class StrEnumDeserializerMixin:
     @classmethod
     def __deserialize__(cls, des: "SFSaveDeserializer") -> typing.Self:
-        return cls(des.get_string())  # type: ignore
+        old = des.offset
+        des.offset, value = parse_str_enum(des.offset, des.content, cls)  # type: ignore
+        logger.log(TRACE_BIN_LOG_LEVEL, "GET STR ENUM       of[%10d -> %-10d] | %r", old, des.offset, value)
+        return value
 
 
 class U8EnumSerializerMixin:
@@ -58,6 +119,24 @@ class U32EnumDeserializerMixin:
         return cls(des.get_u32())  # type: ignore
 
 
+def _decode_b64_str(value: typing.Any) -> typing.Any:
+    if isinstance(value, str):
+        return base64.b64decode(value)
+    return value
+
+
+def _encode_b64(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+
+type RawBytes = typing.Annotated[
+    bytes,
+    pydantic.BeforeValidator(_decode_b64_str),
+    pydantic.PlainSerializer(_encode_b64, return_type=str, when_used="json"),
+    pydantic.WithJsonSchema({"type": "string", "format": "base64"}),
+]
+
+
 def b64_bytes[T](v: T) -> T:
     if isinstance(v, bytes):
         return base64.b64encode(v).decode("ascii")  # type: ignore
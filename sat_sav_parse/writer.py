@@ -0,0 +1,62 @@
+import collections.abc
+import contextlib
+import pathlib
+import shutil
+import typing
+
+from sat_sav_parse.models import CSaveFileBody, CSaveFileChunkRecord, SaveFileHeader
+from sat_sav_parse.reader import read_header_prefix
+from sat_sav_parse.structs import SFSaveSerializer
+from sat_sav_parse.utils import atomic_write
+
+__all__ = (
+    "update_save_header",
+    "write_save_file",
+)
+
+COPY_BUFFER_SIZE: typing.Final[int] = 1024 * 1024
+
+
+def write_save_file(
+    output_path: pathlib.Path,
+    header: SaveFileHeader,
+    body: collections.abc.Buffer,
+    *,
+    original_path: pathlib.Path | None = None,
+) -> None:
+    # body is the decompressed save body. With original_path, every 128 KiB chunk that is unchanged
+    # from the original save is copied from it in compressed form, so only edited chunks are compressed.
+    # Chunks are read, compressed and written one at a time; body itself is not copied.
+    with contextlib.ExitStack() as stack:
+        reusable_chunks: collections.abc.Iterable[CSaveFileChunkRecord] = ()
+        if original_path is not None:
+            src = stack.enter_context(original_path.open("rb"))
+            _, header_size = read_header_prefix(src)
+            reusable_chunks = CSaveFileBody.iter_chunk_records(src, header_size)
+
+        dst = stack.enter_context(atomic_write(output_path, mode_from=original_path))
+        dst.write(SFSaveSerializer.get(header))
+        CSaveFileBody.write_to(body, dst, reusable_chunks)
+
+
+def update_save_header(
+    file_path: pathlib.Path,
+    output_path: pathlib.Path | None = None,
+    **changes: typing.Any,
+) -> SaveFileHeader:
+    # The compressed body that follows the header is copied as-is, so this never decompresses
+    # anything. The result is written to a temporary file next to the target and moved into place.
+    unknown = changes.keys() - SaveFileHeader.model_fields.keys()
+    if unknown:
+        msg = f"SaveFileHeader has no field(s) {', '.join(sorted(unknown))}"
+        raise TypeError(msg)
+    output_path = output_path or file_path
+    with file_path.open("rb") as src:
+        header, header_size = read_header_prefix(src)
+        new_header = SaveFileHeader.model_validate({**header.model_dump(), **changes})
+        src.seek(header_size)
+
+        with atomic_write(output_path, mode_from=file_path) as dst:
+            dst.write(SFSaveSerializer.get(new_header))
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+    return new_header
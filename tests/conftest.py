@@ -0,0 +1,27 @@
+import pytest
+
+from sat_sav_parse import SaveFileHeader, SessionVisibility
+
+
+@pytest.fixture
+def save_header() -> SaveFileHeader:
+    return SaveFileHeader(
+        header_type=14,
+        save_version=52,
+        build_version=400000,
+        save_name="save",
+        map_name="Persistent_Level",
+        map_options="",
+        session_name="session",
+        play_duration=60,
+        save_ticks=638000000000000000,
+        session_visibility=SessionVisibility.PRIVATE,
+        editor_object_version=1,
+        mod_metadata="",
+        mod_flags=0,
+        save_id="ID",
+        is_partitioned_world=True,
+        creative_mode_enabled=False,
+        checksum=bytes(range(16)),
+        is_cheat=False,
+    )
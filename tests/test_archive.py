@@ -0,0 +1,41 @@
+import pathlib
+
+import pytest
+
+from sat_sav_parse import ChunkStore, SaveFileHeader, write_save_file
+from sat_sav_parse.const import MAX_CHUNK_SIZE
+
+
+def test_chunk_store(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    body = bytes(range(256)) * (MAX_CHUNK_SIZE * 3 // 256)
+    edited = bytearray(body)
+    edited[5] = 0
+    first, second = tmp_path / "first.sav", tmp_path / "second.sav"
+    write_save_file(first, save_header, body)
+    write_save_file(second, save_header, bytes(edited))
+
+    store = ChunkStore(tmp_path / "store")
+    manifests = list(store.ingest_many([first, second]))
+    assert [manifest.name for manifest in manifests] == store.names() == ["first.sav", "second.sav"]
+    # every chunk of the first body is the same, the second body only differs in its first chunk
+    assert len({chunk.digest for manifest in manifests for chunk in manifest.chunks}) == 2
+    assert sum(1 for path in store.chunks_dir.rglob("*") if path.is_file()) == 2
+
+    restored = tmp_path / "restored.sav"
+    store.restore("second.sav", restored)
+    assert restored.read_bytes() == second.read_bytes()
+    with store.open_save("second.sav") as (header, des):
+        assert header == save_header
+        assert des.content[:] == edited
+
+
+def test_chunk_store_rejects_duplicate_names(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    paths = [tmp_path / "a" / "autosave.sav", tmp_path / "b" / "autosave.sav", tmp_path / "other.sav"]
+    for path in paths:
+        path.parent.mkdir(exist_ok=True)
+        write_save_file(path, save_header, b"\x00" * 16)
+
+    store = ChunkStore(tmp_path / "store")
+    with pytest.raises(ValueError, match=r"autosave\.sav"):
+        store.ingest_many(paths)
+    assert store.names() == []
@@ -0,0 +1,71 @@
+import multiprocessing
+import os
+import pathlib
+import sqlite3
+
+import pytest
+
+import sat_sav_parse.batch
+from sat_sav_parse import SaveGeneratorConfig, generate_save, load_batch_manifest, parse_save_file, run_batch
+
+
+def test_run_batch(tmp_path: pathlib.Path):
+    saves = tmp_path / "saves"
+    saves.mkdir()
+    for seed in range(2):
+        generate_save(saves / f"save_{seed}.sav", SaveGeneratorConfig(seed=seed, actors=20, sublevels=1))
+    (saves / "broken.sav").write_bytes(b"\x00" * 64)
+    paths = sorted(saves.glob("*.sav"))
+    manifest = tmp_path / "manifest.ndjson"
+
+    report = run_batch(paths, "stats", manifest_path=manifest, max_workers=2)
+    assert (report.succeeded, report.failed, report.skipped) == (2, 1, 0)
+    failed = next(result for result in report.results if not result.ok)
+    assert failed.path == str(saves / "broken.sav")
+    assert all(result.objects == 40 for result in report.results if result.ok)
+    assert len(load_batch_manifest(manifest)) == 3
+
+    report = run_batch(paths, "stats", manifest_path=manifest, max_workers=2)
+    assert (report.succeeded, report.failed, report.skipped) == (0, 1, 2)
+
+
+def test_run_batch_outputs(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=5, actors=20, sublevels=1, components_per_actor=1))
+    header, body = parse_save_file(path)
+    objects = sum(len(level.objects) for level in (*body.sublevels, body.persistent_level))
+    output_dir = tmp_path / "out"
+
+    report = run_batch([path], "to-json", output_dir=output_dir, max_workers=1)
+    assert report.succeeded == 1
+    assert report.results[0].output == str(output_dir / "save.json")
+    assert (output_dir / "save.json").read_text() == body.model_dump_json(indent=2)
+    assert (output_dir / "save.header.json").read_text() == header.model_dump_json(indent=2)
+
+    report = run_batch([path], "export", output_dir=output_dir, max_workers=1)
+    assert report.succeeded == 1
+    assert report.results[0].output == str(output_dir / "save.sqlite")
+    assert report.results[0].objects == objects
+    with sqlite3.connect(output_dir / "save.sqlite") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM objects").fetchone() == (objects,)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched module")
+def test_run_batch_worker_dies(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    saves = tmp_path / "saves"
+    saves.mkdir()
+    for seed in range(5):
+        generate_save(saves / f"save_{seed}.sav", SaveGeneratorConfig(seed=seed, actors=10 + seed, sublevels=1))
+    crashing = saves / "save_2.sav"
+    run_operation = sat_sav_parse.batch._run_operation  # noqa: SLF001
+
+    def crash(operation: sat_sav_parse.batch.BatchOperation, path: pathlib.Path, output_dir: pathlib.Path | None):
+        if path == crashing:
+            os._exit(1)
+        return run_operation(operation, path, output_dir)
+
+    monkeypatch.setattr(sat_sav_parse.batch, "_run_operation", crash)
+    report = run_batch(sorted(saves.glob("*.sav")), "stats", max_workers=3)
+    assert (report.succeeded, report.failed) == (4, 1)
+    failed = next(result for result in report.results if not result.ok)
+    assert (failed.path, failed.error_code) == (str(crashing), "BrokenProcessPool")
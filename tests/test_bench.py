@@ -0,0 +1,29 @@
+import pathlib
+
+from sat_sav_parse import (
+    BENCH_PHASES,
+    SaveGeneratorConfig,
+    generate_save,
+    open_save_file,
+    parse_save_file,
+    run_bench,
+)
+
+
+def test_run_bench(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=8, actors=30, sublevels=2, components_per_actor=1))
+    result = run_bench(path, iterations=1)
+
+    _, body = parse_save_file(path)
+    with open_save_file(path) as (_, des):
+        body_size = len(des.content)
+    phases = {phase.name: phase for phase in result.phases}
+    assert list(phases) == list(BENCH_PHASES)
+    assert all(len(phase.times) == 1 for phase in result.phases)
+    assert result.objects == sum(len(level.objects) for level in (*body.sublevels, body.persistent_level)) == 60
+    assert result.file_size == path.stat().st_size
+    assert result.body_size == phases["decompress"].bytes == body_size
+    assert phases["serialize"].bytes == body_size
+    assert phases["parse"].objects == result.objects
+    assert phases["compress"].objects is None
@@ -0,0 +1,68 @@
+import pathlib
+import struct
+import typing
+
+import pytest
+
+import sat_sav_parse.diff
+from sat_sav_parse import (
+    BodyPatch,
+    PropertyTypeName,
+    SaveGeneratorConfig,
+    build_object_index,
+    diff_saves,
+    generate_save,
+    open_save_file,
+    patch_save_body,
+    property_patch,
+)
+
+
+def test_diff_saves(tmp_path: pathlib.Path):
+    path = tmp_path / "old.sav"
+    generate_save(path, SaveGeneratorConfig(seed=3, actors=30, sublevels=2, components_per_actor=1))
+    with open_save_file(path) as (_, des):
+        data = bytes(des.content)
+        locations = list(build_object_index(des))
+
+    # an int property of one object is changed, and another object is renamed in place, which shows
+    # up as one removed and one added object
+    edited, tag = next(
+        (location, tag)
+        for location in locations
+        for tag in location.iter_property_tags(data)
+        if tag.type_name == PropertyTypeName.INT
+    )
+    (value,) = struct.unpack_from("<i", data, tag.value_offset)
+    renamed = next(location for location in locations if location.instance_name != edited.instance_name)
+    new_name = renamed.instance_name[:-1] + ("x" if renamed.instance_name[-1] != "x" else "y")
+    name_offset = data.index(renamed.instance_name.encode(), renamed.header_offset, renamed.object_offset)
+
+    new_path = tmp_path / "new.sav"
+    patches = [
+        property_patch(data, edited, tag.name, value + 1, tag.index),
+        BodyPatch(name_offset, new_name.encode()),
+    ]
+    patch_save_body(path, patches, new_path)
+
+    diff = diff_saves(path, new_path)
+    assert not diff.identical
+    assert diff.added == [new_name]
+    assert diff.removed == [renamed.instance_name]
+    assert [(change.instance_name, change.fields, change.properties) for change in diff.changed] == [
+        (edited.instance_name, [], [tag.name]),
+    ]
+
+
+def test_diff_saves_identical(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=4, actors=10, sublevels=1))
+
+    def fail(*_: object) -> typing.NoReturn:
+        raise AssertionError("identical bodies must not be indexed")
+
+    monkeypatch.setattr(sat_sav_parse.diff, "build_object_index", fail)
+    diff = diff_saves(path, path)
+    assert diff.identical
+    assert diff.total_chunks > 0
+    assert (diff.added, diff.removed, diff.changed) == ([], [], [])
@@ -0,0 +1,18 @@
+import pathlib
+
+from sat_sav_parse import SaveGeneratorConfig, generate_save, parse_save_file
+
+
+def test_generate_save(tmp_path: pathlib.Path):
+    config = SaveGeneratorConfig(seed=7, actors=30, sublevels=2, components_per_actor=2, properties_per_object=5)
+    first = tmp_path / "first.sav"
+    second = tmp_path / "second.sav"
+    generate_save(first, config)
+    generate_save(second, config)
+    assert first.read_bytes() == second.read_bytes()
+
+    _, body = parse_save_file(first)
+    levels = [*body.sublevels, body.persistent_level]
+    assert [level.sublevel_name for level in body.sublevels] == ["Sublevel_0", "Sublevel_1"]
+    assert sum(len(level.objects) for level in levels) == config.objects
+    assert all(len(obj.properties) == 5 for level in levels for obj in level.objects)
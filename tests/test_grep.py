@@ -0,0 +1,39 @@
+import pathlib
+
+from sat_sav_parse import SaveGeneratorConfig, generate_save, grep_save, iter_body_matches, parse_save_file
+
+
+def test_grep_save(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=5, actors=40, sublevels=2, components_per_actor=2))
+    _, body = parse_save_file(path)
+    level = body.sublevels[1]
+    obj = level.objects[-1]
+
+    hits = grep_save(path, obj.header.instance_name)
+    assert hits
+    assert all(hit.match.text == obj.header.instance_name for hit in hits)
+    assert [hit.match.offset for hit in hits] == sorted(hit.match.offset for hit in hits)
+    own = [hit for hit in hits if hit.instance_name == obj.header.instance_name]
+    assert {hit.region for hit in own} >= {"header"}
+    assert all(hit.sublevel_name == level.sublevel_name for hit in own)
+    for hit in hits:
+        assert hit.location is not None
+        start = hit.location.header_offset if hit.region == "header" else hit.location.object_offset
+        assert start <= hit.match.offset < hit.location.end_offset
+
+    assert grep_save(path, "no such object") == []
+
+
+def test_iter_body_matches_across_chunks():
+    text = "Persistent_Level:PersistentLevel.Build_Wall_C_7 — ü"
+    data = b"\x00" * 3 + text.encode() + b"\x01" + text.encode("utf-16-le") + b"\x02" + text.encode("utf-16-le")[1:]
+    expected = [(3, "utf-8"), (3 + len(text.encode()) + 1, "utf-16")]
+    for size in (1, 2, 5, 16, len(data)):
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+        matches = list(iter_body_matches(chunks, text))
+        assert [(match.offset, match.encoding) for match in matches] == expected
+        assert all(match.text == text for match in matches)
+        regex_matches = list(iter_body_matches(chunks, r"Build_\w+_C_\d+", regex=True, encodings=["utf-16"]))
+        # the last copy only lost the first byte of its first character
+        assert [match.text for match in regex_matches] == ["Build_Wall_C_7", "Build_Wall_C_7"]
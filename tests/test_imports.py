@@ -0,0 +1,46 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from sat_sav_parse import SaveGeneratorConfig, generate_save
+
+# imported only by the commands that need them, never on `import sat_sav_parse` or by `info`
+HEAVY_MODULES = ("rich.console", "sat_sav_parse.models.properties", "sqlite3", "http.server")
+
+
+def _imported_modules(*args: str) -> set[str]:
+    # -X importtime lists every module imported by the process on stderr, one "| name" per line
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=pathlib.Path(__file__).parent.parent,
+    )
+    return {line.rsplit("|", 1)[1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+def test_package_import_is_lazy():
+    modules = _imported_modules("-c", "import sat_sav_parse")
+    assert "sat_sav_parse" in modules
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+def test_info_command_imports(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(actors=10, sublevels=1))
+    modules = _imported_modules("-m", "sat_sav_parse", "--disable-logging", "info", str(path), "--json", "--plain")
+    assert "sat_sav_parse.models.save_file_header" in modules
+    assert not modules.intersection(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("name", ["SaveFileBody", "ArrayProperty", "parse_save_file", "ParseError"])
+def test_lazy_attributes(name: str):
+    import sat_sav_parse  # noqa: PLC0415
+
+    assert name in dir(sat_sav_parse)
+    assert getattr(sat_sav_parse, name) is not None
+    with pytest.raises(AttributeError):
+        sat_sav_parse.DoesNotExist  # noqa: B018
@@ -0,0 +1,39 @@
+import io
+import pathlib
+
+import pytest
+
+from sat_sav_parse import (
+    CSaveFileBody,
+    ParseError,
+    SaveFileHeader,
+    SaveGeneratorConfig,
+    SFSaveSerializer,
+    generate_save,
+    open_save_file,
+    parse_save_file,
+)
+from sat_sav_parse.export import write_save_body_json
+
+
+@pytest.mark.parametrize("indent", [2, None])
+def test_write_save_body_json(tmp_path: pathlib.Path, indent: int | None):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=2, actors=30, sublevels=2, components_per_actor=1))
+    _, body = parse_save_file(path)
+
+    fp = io.BytesIO()
+    with open_save_file(path) as (_, des):
+        write_save_body_json(des, fp, indent=indent)
+    assert fp.getvalue() == body.model_dump_json(indent=indent).encode()
+
+
+def test_write_save_body_json_empty_body(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    path = tmp_path / "empty.sav"
+    path.write_bytes(SFSaveSerializer.get(save_header) + SFSaveSerializer.get(CSaveFileBody(b"")))
+    with open_save_file(path) as (header, des):
+        assert header == save_header
+        assert not des.content
+        with pytest.raises(ParseError) as exc_info:
+            write_save_body_json(des, io.BytesIO())
+    assert exc_info.value.code == "unexpected_end_of_data"
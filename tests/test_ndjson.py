@@ -0,0 +1,31 @@
+import collections
+import io
+import json
+import pathlib
+
+from sat_sav_parse import SaveGeneratorConfig, generate_save, open_save_file, parse_save_file
+from sat_sav_parse.export import write_save_ndjson
+
+
+def test_write_save_ndjson(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=6, actors=30, sublevels=2, components_per_actor=1))
+    header, body = parse_save_file(path)
+
+    fp = io.BytesIO()
+    with open_save_file(path) as (_, des):
+        count = write_save_ndjson(header, des, fp)
+    records = [json.loads(line) for line in fp.getvalue().splitlines()]
+    assert len(records) == count
+
+    levels = (*body.sublevels, body.persistent_level)
+    assert collections.Counter(record["record"] for record in records) == {
+        "header": 1,
+        "object": sum(len(level.objects) for level in levels),
+        "collectable": sum(len(level.collectables) for level in levels),
+        "second_collectable": sum(len(level.second_collectables) for level in levels),
+        "reference": len(body.references),
+    }
+    assert [record["collectable"] for record in records if record["record"] == "second_collectable"] == [
+        collectable.model_dump(mode="json") for level in levels for collectable in level.second_collectables
+    ]
@@ -0,0 +1,82 @@
+from sat_sav_parse import (
+    ActorHeader,
+    IntProperty,
+    ObjectCache,
+    ObjectReference,
+    Quaternion,
+    SFSaveDeserializer,
+    SFSaveSerializer,
+    Vector3,
+)
+
+
+def make_header(i: int) -> ActorHeader:
+    return ActorHeader(
+        type_path="/Game/Build_Foundation.Build_Foundation_C",
+        root_object="Persistent_Level",
+        instance_name=f"Persistent_Level:PersistentLevel.Build_Foundation_C_{i}",
+        unknown=0,
+        rotation=Quaternion(x=0, y=0, z=0, w=1),
+        position=Vector3(x=i, y=0, z=0),
+        scale=Vector3(x=1, y=1, z=1),
+        need_transform=True,
+        was_placed_in_level=False,
+    )
+
+
+def serialize_object(count: int) -> bytes:
+    data = SFSaveSerializer()
+    data.add(ObjectReference(level_name="", path_name=""))
+    data.add_u32(0)
+    data.add(IntProperty(name="mCount", payload_size=4, index=0, payload=count))
+    data.add_string("None")
+    data.add_u32(0)
+    return SFSaveSerializer().add_u32(52).add_u32(0).add_u32(len(data.content)).add_raw(data.content).content
+
+
+def test_object_cache():
+    cache = ObjectCache()
+    data = serialize_object(1) + serialize_object(1) + serialize_object(2)
+    des = SFSaveDeserializer(data)
+
+    objects = [cache.deserialize(des, make_header(i)) for i in range(3)]
+    assert des.offset == len(data)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+    assert cache.hit_rate == 1 / 3
+    assert [obj.header.instance_name for obj in objects] == [make_header(i).instance_name for i in range(3)]
+    assert objects[1].properties == objects[0].properties
+    assert objects[2].properties[0].payload == 2
+
+
+def test_object_cache_evicts_least_recently_used():
+    first, second = serialize_object(1), serialize_object(2)
+    sizes = []
+    for data in (first, second):
+        sizing = ObjectCache()
+        sizing.deserialize(SFSaveDeserializer(data), make_header(0))
+        sizes.append(sizing.size)
+    assert sizes[0] > len(first)
+
+    cache = ObjectCache(max_size=sum(sizes) - 1)
+    for data in (first, second, first):
+        cache.deserialize(SFSaveDeserializer(data), make_header(0))
+    assert (cache.hits, cache.misses, len(cache)) == (0, 3, 1)
+    assert cache.size == sizes[0]
+
+
+def test_object_cache_returns_independent_copies():
+    cache = ObjectCache()
+    data = serialize_object(1)
+    first = cache.deserialize(SFSaveDeserializer(data), make_header(0))
+    first.properties[0].payload = 5
+    first.properties.append(IntProperty(name="mExtra", payload_size=4, index=0, payload=0))
+
+    header = make_header(1)
+    second = cache.deserialize(SFSaveDeserializer(data), header)
+    assert cache.hits == 1
+    assert second.header is header
+    assert [(prop.name, prop.payload) for prop in second.properties] == [("mCount", 1)]
+    second.properties[0].payload = 6
+
+    third = cache.deserialize(SFSaveDeserializer(data), make_header(2))
+    assert third.properties[0].payload == 1
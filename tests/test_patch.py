@@ -0,0 +1,134 @@
+import pathlib
+import struct
+import typing
+
+import pytest
+
+from sat_sav_parse import (
+    ActorHeader,
+    BodyPatch,
+    BoolProperty,
+    CSaveFileBody,
+    FloatProperty,
+    IntProperty,
+    ObjectIndex,
+    ObjectKey,
+    PropertyTypeName,
+    SaveFileHeader,
+    SaveGeneratorConfig,
+    SFSaveDeserializer,
+    SFSaveSerializer,
+    build_object_index,
+    generate_save,
+    iter_property_tags,
+    open_save_file,
+    parse_save_file,
+    patch_save_body,
+    position_patch,
+    property_patch,
+)
+from sat_sav_parse.const import MAX_CHUNK_SIZE
+
+
+def test_iter_property_tags():
+    ser = SFSaveSerializer()
+    ser.add(IntProperty(name="mCount", payload_size=4, index=0, payload=5))
+    ser.add(BoolProperty(name="mIsOn", payload_size=0, index=2, payload=False))
+    ser.add(FloatProperty(name="mSpeed", payload_size=4, index=0, payload=1.5))
+    ser.add_string("None")
+    data = ser.content
+
+    tags = list(iter_property_tags(data, 0))
+    assert [(tag.name, tag.type_name, tag.index) for tag in tags] == [
+        ("mCount", "IntProperty", 0),
+        ("mIsOn", "BoolProperty", 2),
+        ("mSpeed", "FloatProperty", 0),
+    ]
+    assert struct.unpack_from("<i", data, tags[0].value_offset) == (5,)
+    assert data[tags[1].value_offset] == 0
+    assert struct.unpack_from("<f", data, tags[2].value_offset) == (1.5,)
+
+
+def test_patch_save_body(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    body = bytes(range(256)) * (MAX_CHUNK_SIZE * 3 // 256)
+    path = tmp_path / "save.sav"
+    path.write_bytes(SFSaveSerializer.get(save_header) + SFSaveSerializer.get(CSaveFileBody(body)))
+    original = path.read_bytes()
+
+    output = tmp_path / "patched.sav"
+    patches = [BodyPatch(10, b"\xff\xff"), BodyPatch(2 * MAX_CHUNK_SIZE - 2, b"abcd")]
+    assert patch_save_body(path, patches, output) == 3
+
+    des = SFSaveDeserializer(output.read_bytes())
+    assert des.get(SaveFileHeader) == save_header
+    expected = bytearray(body)
+    expected[10:12] = b"\xff\xff"
+    expected[2 * MAX_CHUNK_SIZE - 2 : 2 * MAX_CHUNK_SIZE + 2] = b"abcd"
+    assert des.get(CSaveFileBody) == expected
+    assert path.read_bytes() == original
+
+
+def test_property_and_position_patch(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=12, actors=60, sublevels=2, components_per_actor=1))
+    with open_save_file(path) as (_, des):
+        data = bytes(des.content)
+        index = build_object_index(des)
+
+    actor = next(
+        location
+        for location in index
+        if isinstance(location.header, ActorHeader) and location.sublevel_name is not None
+    )
+    new_values: dict[ObjectKey, dict[str, typing.Any]] = {}
+    patches = [position_patch(data, actor, (1.5, -2.25, 8.0))]
+    # every new value differs from the one in the save, so a patch written to the wrong offset is caught
+    edits = [
+        (PropertyTypeName.INT, "<i", lambda old: old + 12345),
+        (PropertyTypeName.FLOAT, "<f", lambda old: old + 0.5),
+        (PropertyTypeName.BOOL, "<?", lambda old: not old),
+    ]
+    for type_name, fmt, change in edits:
+        location, tag = next(
+            (location, tag)
+            for location in index
+            for tag in location.iter_property_tags(data)
+            if tag.type_name == type_name and tag.index == 0
+        )
+        (old,) = struct.unpack_from(fmt, data, tag.value_offset)
+        value = change(old)
+        patches.append(property_patch(data, location, tag.name, value))
+        new_values.setdefault(location.key, {})[tag.name] = value
+    patch_save_body(path, patches)
+
+    _, body = parse_save_file(path)
+    objects = {
+        (level.sublevel_name, obj.header.instance_name): obj
+        for level in (*body.sublevels, body.persistent_level)
+        for obj in level.objects
+    }
+    position = objects[actor.key].header.position
+    assert (position.x, position.y, position.z) == (1.5, -2.25, 8.0)
+    for key, values in new_values.items():
+        payloads = {prop.name: prop.payload for prop in objects[key].properties if prop.index == 0}
+        for name, value in values.items():
+            assert payloads[name] == pytest.approx(value)
+
+
+def test_object_index_duplicate_names(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=12, actors=10, sublevels=1))
+    with open_save_file(path) as (_, des):
+        locations = list(build_object_index(des))
+    first = locations[0]
+    other = next(location for location in locations if location.sublevel_name != first.sublevel_name)
+    # the same instance name in another level
+    duplicate = other._replace(header=other.header.model_copy(update={"instance_name": first.instance_name}))
+    index = ObjectIndex([*locations, duplicate])
+
+    assert index[first.key] is first
+    assert index[duplicate.key] is duplicate
+    assert first.instance_name in index
+    with pytest.raises(KeyError, match="several levels"):
+        index[first.instance_name]
+    assert index[locations[1].instance_name] is locations[1]
@@ -0,0 +1,24 @@
+from sat_sav_parse import IntProperty, Profiler, SFSaveDeserializer, SFSaveSerializer, get_active_profiler
+from sat_sav_parse.models import deserialize_properties, serialize_properties
+
+
+def test_profiler():
+    properties = [IntProperty(name=f"mValue{i}", payload_size=4, index=0, payload=i) for i in range(3)]
+    data = SFSaveSerializer.get_fn(serialize_properties, properties)
+
+    # the profiled get/get_fn are only installed while a profiler is active
+    plain_get = SFSaveDeserializer.get
+    profiler = Profiler()
+    with profiler.activate():
+        assert get_active_profiler() is profiler
+        assert SFSaveDeserializer.get is not plain_get
+        SFSaveDeserializer(data).get_fn(deserialize_properties)
+    assert get_active_profiler() is None
+    assert SFSaveDeserializer.get is plain_get
+
+    stats = {stat.name: stat for stat in profiler.stats()}
+    assert stats["PropertyList"].count == 1
+    assert stats["PropertyList"].bytes == len(data)
+    assert stats["IntProperty"].count == 3
+    assert stats["PropertyList"].total_time >= stats["IntProperty"].total_time
+    assert all(line.startswith("PropertyList") for line in profiler.collapsed_stacks())
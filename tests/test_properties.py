@@ -0,0 +1,126 @@
+from sat_sav_parse.models.properties import (
+    ArrayElementInt,
+    ArrayProperty,
+    BoolProperty,
+    DoubleProperty,
+    IntProperty,
+    KeyTypeName,
+    MapProperty,
+    PropertyLayoutCache,
+    PropertyType,
+    SetProperty,
+    SetType,
+    StrProperty,
+    StructProperty,
+    StructTypeName,
+    TextProperty,
+    TextValueNone,
+    ValueTypeName,
+    Vector,
+    deserialize_properties,
+    property_layout_cache,
+)
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+
+
+def serialize_properties(*properties: PropertyType) -> bytes:
+    ser = SFSaveSerializer()
+    for prop in properties:
+        ser.add(prop)
+    ser.add_string("None")
+    return ser.content
+
+
+def test_property_layout_cache():
+    property_layout_cache.clear()
+    first = (
+        IntProperty(name="mCount", payload_size=4, index=0, payload=3),
+        BoolProperty(name="mIsProducing", payload_size=0, index=0, payload=True),
+        StrProperty(name="mLabel", payload_size=8, index=0, payload="Iron 1"),
+    )
+    second = (
+        IntProperty(name="mCount", payload_size=4, index=0, payload=7),
+        BoolProperty(name="mIsProducing", payload_size=0, index=0, payload=False),
+        StrProperty(name="mLabel", payload_size=8, index=0, payload="Iron 2"),
+    )
+
+    content = serialize_properties(*first)
+    assert deserialize_properties(SFSaveDeserializer(content), layout_key="/Game/Build_A") == list(first)
+    assert property_layout_cache.misses == 1
+
+    des = SFSaveDeserializer(serialize_properties(*second))
+    assert deserialize_properties(des, layout_key="/Game/Build_A") == list(second)
+    assert des.offset == len(des.content)
+    assert property_layout_cache.hits == 1
+
+
+def test_property_layout_cache_fallback():
+    property_layout_cache.clear()
+    cached = (
+        IntProperty(name="mCount", payload_size=4, index=0, payload=3),
+        StrProperty(name="mLabel", payload_size=8, index=0, payload="Iron 1"),
+    )
+    deserialize_properties(SFSaveDeserializer(serialize_properties(*cached)), layout_key="/Game/Build_A")
+
+    diverged = (
+        IntProperty(name="mCount", payload_size=4, index=0, payload=3),
+        BoolProperty(name="mIsProducing", payload_size=0, index=0, payload=True),
+    )
+    des = SFSaveDeserializer(serialize_properties(*diverged))
+    assert deserialize_properties(des, layout_key="/Game/Build_A") == list(diverged)
+    assert des.offset == len(des.content)
+    assert property_layout_cache.hits == 0
+
+    shorter = (IntProperty(name="mCount", payload_size=4, index=0, payload=3),)
+    des = SFSaveDeserializer(serialize_properties(*shorter))
+    assert deserialize_properties(des, layout_key="/Game/Build_A") == list(shorter)
+    assert des.offset == len(des.content)
+
+
+def test_property_layout_cache_bounds():
+    cache = PropertyLayoutCache(max_layouts=1)
+    cache.put("a", ())
+    cache.put("b", ())
+    assert len(cache) == 1
+    assert cache.get("b") is None
+    assert cache.get(None) is None
+
+
+def test_properties_round_trip():
+    properties = [
+        DoubleProperty(name="mHealth", payload_size=8, index=0, payload=0.5),
+        ArrayProperty(
+            name="mIds",
+            payload_size=16,
+            index=0,
+            payload=ArrayElementInt(length=3, elements=[1, 2, 3]),
+        ),
+        StructProperty(
+            name="mOffset",
+            payload_size=24,
+            index=0,
+            type=StructTypeName.VECTOR,
+            payload=Vector(x=1, y=2, z=3),
+        ),
+        MapProperty(
+            name="mCounts",
+            payload_size=24,
+            index=0,
+            key_type=KeyTypeName.INT,
+            value_type=ValueTypeName.INT,
+            mode=0,
+            elements_count=2,
+            payload={1: 10, 2: 20},
+        ),
+        SetProperty(name="mSeen", payload_size=16, index=0, set_type=SetType.U_INT_32, payload=[4, 5]),
+        TextProperty(
+            name="mLabel",
+            payload_size=15,
+            index=0,
+            payload=TextValueNone(has_culture_invariant_string=True, value="Iron", flags=2),
+        ),
+    ]
+    content = serialize_properties(*properties)
+    des = SFSaveDeserializer(content)
+    assert deserialize_properties(des) == properties
+    assert des.offset == len(content)
@@ -0,0 +1,85 @@
+import pathlib
+
+import pytest
+
+from sat_sav_parse import (
+    ActorHeader,
+    BodyPatch,
+    ObjectLocation,
+    ParseError,
+    PropertyTag,
+    PropertyTypeName,
+    SaveGeneratorConfig,
+    SFSaveDeserializer,
+    build_object_index,
+    generate_save,
+    open_save_file,
+    parse_save_file,
+    patch_save_body,
+    select,
+)
+
+
+def test_select(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=9, actors=30, sublevels=2, components_per_actor=1))
+    _, body = parse_save_file(path)
+    objects = [obj for level in (*body.sublevels, body.persistent_level) for obj in level.objects]
+
+    assert [(result.instance_name, result.properties) for result in select(path)] == [
+        (obj.header.instance_name, obj.properties) for obj in objects
+    ]
+
+    type_path = objects[0].header.type_path
+    name = objects[0].properties[0].name
+    results = list(select(path, type_path=type_path, fields=[name]))
+    assert [result.instance_name for result in results] == [
+        obj.header.instance_name for obj in objects if obj.header.type_path == type_path
+    ]
+    assert all(prop.name == name for result in results for prop in result.properties)
+
+    results = select(
+        path,
+        header=lambda header: isinstance(header, ActorHeader),
+        fields=[name],
+        where=lambda props: name in props and props[name].payload == objects[0].properties[0].payload,
+    )
+    assert objects[0].header.instance_name in {result.instance_name for result in results}
+    assert all(not result.properties for result in select(path, fields=[]))
+
+
+def test_select_unsupported_property_type(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=9, actors=30, sublevels=2, components_per_actor=1))
+    with open_save_file(path) as (_, des):
+        data = bytes(des.content)
+        location, tag, type_offset = next(
+            (location, tag, type_offset)
+            for location in build_object_index(des)
+            for tag, type_offset in _tags_with_type_offsets(data, location)
+            if tag.type_name == PropertyTypeName.INT
+        )
+    # IntProperty becomes IntPropertx, which has the same tag layout but no property class
+    patch_save_body(path, [BodyPatch(type_offset + 4 + len("IntProperty") - 1, b"x")])
+
+    with pytest.raises(ParseError) as exc_info:
+        list(select(path, fields=[tag.name]))
+    assert exc_info.value.code == "unsupported_property_type"
+    with pytest.raises(ParseError) as exc_info:
+        list(select(path))
+    assert exc_info.value.code == "unsupported_property_type"
+
+    # a query that does not select the property skips it by its payload size
+    results = {result.instance_name: result for result in select(path, fields=["no such property"])}
+    assert location.instance_name in results
+
+
+def _tags_with_type_offsets(data: bytes, location: ObjectLocation) -> list[tuple[PropertyTag, int]]:
+    # a tag starts with its name string, then its type name string
+    tags = []
+    offset = location.properties_offset(data)
+    for tag in location.iter_property_tags(data):
+        type_offset, _ = SFSaveDeserializer.parse_string(offset, data)
+        tags.append((tag, type_offset))
+        offset = tag.end_offset
+    return tags
@@ -0,0 +1,37 @@
+import pathlib
+
+import pytest
+
+from sat_sav_parse import (
+    ParseError,
+    SaveFileHeader,
+    SFSaveSerializer,
+    read_save_header,
+    scan_save_headers,
+)
+
+
+def test_read_save_header_grows_prefix(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    header = save_header.model_copy(update={"mod_metadata": "x" * 5000})
+    path = tmp_path / "mods.sav"
+    path.write_bytes(SFSaveSerializer.get(header) + b"\x00" * 64)
+    assert read_save_header(path, prefix_size=64) == header
+
+    truncated = tmp_path / "truncated.sav"
+    truncated.write_bytes(SFSaveSerializer.get(header)[:-8])
+    with pytest.raises(ParseError) as exc_info:
+        read_save_header(truncated, prefix_size=64)
+    assert exc_info.value.code == "unexpected_end_of_data"
+
+
+def test_scan_save_headers(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    good = tmp_path / "good.sav"
+    good.write_bytes(SFSaveSerializer.get(save_header))
+    bad = tmp_path / "bad.sav"
+    bad.write_bytes(b"junk")
+
+    results = list(scan_save_headers([good, bad], max_workers=2))
+    assert [result.path for result in results] == [good, bad]
+    assert results[0].header == save_header
+    assert results[1].header is None
+    assert isinstance(results[1].error, ParseError)
@@ -0,0 +1,128 @@
+import io
+
+from sat_sav_parse import (
+    ActorHeader,
+    ActorObject,
+    ComponentHeader,
+    ComponentObject,
+    DoubleProperty,
+    GridName,
+    IntProperty,
+    Level,
+    LevelGroupingGrid,
+    ObjectReference,
+    Quaternion,
+    SaveFileBody,
+    SFSaveDeserializer,
+    SFSaveSerializer,
+    StreamedLevel,
+    StrProperty,
+    Vector3,
+    write_save_file_body,
+)
+
+
+def make_level(sublevel_name: str | None) -> Level:
+    actor = ActorHeader(
+        type_path="/Game/Build_Foundation.Build_Foundation_C",
+        root_object="Persistent_Level",
+        instance_name="Persistent_Level:PersistentLevel.Build_Foundation_C_0",
+        unknown=0,
+        rotation=Quaternion(x=0, y=0, z=0, w=1),
+        position=Vector3(x=1, y=2, z=0.5),
+        scale=Vector3(x=1, y=1, z=1),
+        need_transform=True,
+        was_placed_in_level=False,
+    )
+    component = ComponentHeader(
+        type_path="/Script/FactoryGame.FGPowerConnectionComponent",
+        root_object="Persistent_Level",
+        instance_name=f"{actor.instance_name}.PowerConnection",
+        unknown=0,
+        parent_actor_name=actor.instance_name,
+    )
+    return Level(
+        sublevel_name=sublevel_name,
+        object_header_and_collectables_size=0,
+        object_headers=[actor, component],
+        extra_level_names_count=None if sublevel_name else 0,
+        extra_level_names=None,
+        collectables=[ObjectReference(level_name="Persistent_Level", path_name="Col_0")],
+        objects_size=0,
+        objects=[
+            ActorObject(
+                header=actor,
+                save_version=52,
+                flag=0,
+                size=0,
+                parent_object_reference=ObjectReference(level_name="", path_name=""),
+                components=[ObjectReference(level_name="Persistent_Level", path_name=component.instance_name)],
+                properties=[
+                    IntProperty(name="mCount", payload_size=4, index=0, payload=3),
+                    DoubleProperty(name="mHealth", payload_size=8, index=0, payload=0.1),
+                    StrProperty(name="mLabel", payload_size=11, index=0, payload="Iron 1"),
+                ],
+                trailing=b"\x01\x02",
+            ),
+            ComponentObject(header=component, save_version=52, flag=0, size=0, properties=[], trailing=b""),
+        ],
+        save_version=52,
+        second_collectables=[],
+    )
+
+
+def test_save_file_body_round_trip():
+    body = SaveFileBody(
+        unknown_1=7,
+        unknown_2=9,
+        grids=[LevelGroupingGrid(grid_name=name, unknown_1=1, unknown_2=2, levels=[]) for name in list(GridName)[:5]],
+        sublevels=[make_level("Sub_0")],
+        persistent_level=make_level(None),
+        references=[ObjectReference(level_name="Persistent_Level", path_name="R")],
+    )
+    data = SFSaveSerializer.get(body)
+    parsed = SFSaveDeserializer(data).get(SaveFileBody)
+
+    # level and object sizes are computed on write, so only they differ from the models built above
+    levels = (*body.sublevels, body.persistent_level)
+    for level, parsed_level in zip(levels, (*parsed.sublevels, parsed.persistent_level), strict=True):
+        assert parsed_level.object_headers == level.object_headers
+        assert [obj.properties for obj in parsed_level.objects] == [obj.properties for obj in level.objects]
+        assert [obj.trailing for obj in parsed_level.objects] == [obj.trailing for obj in level.objects]
+    assert parsed.references == body.references
+    assert SFSaveSerializer.get(parsed) == data
+
+
+def test_write_save_file_body_streamed_levels():
+    body = SaveFileBody(
+        unknown_1=7,
+        unknown_2=9,
+        grids=[LevelGroupingGrid(grid_name=name, unknown_1=1, unknown_2=2, levels=[]) for name in list(GridName)[:5]],
+        sublevels=[make_level("Sub_0"), make_level("Sub_1")],
+        persistent_level=make_level(None),
+        references=[ObjectReference(level_name="Persistent_Level", path_name="R")],
+    )
+
+    def streamed(level: Level) -> StreamedLevel:
+        return StreamedLevel(
+            sublevel_name=level.sublevel_name,
+            objects=iter(level.objects),
+            collectables=level.collectables,
+            save_version=level.save_version,
+            second_collectables=level.second_collectables,
+            extra_level_names_count=level.extra_level_names_count,
+        )
+
+    fp = io.BytesIO()
+    write_save_file_body(
+        fp,
+        unknown_1=body.unknown_1,
+        unknown_2=body.unknown_2,
+        grids=body.grids,
+        sublevel_count=2,
+        # a streamed level and a model can be mixed
+        sublevels=[streamed(body.sublevels[0]), body.sublevels[1]],
+        persistent_level=streamed(body.persistent_level),
+        references=body.references,
+    )
+    assert fp.getvalue() == SFSaveSerializer.get(body)
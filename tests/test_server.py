@@ -0,0 +1,91 @@
+import pathlib
+import threading
+
+import pytest
+
+from sat_sav_parse import (
+    SaveCache,
+    SaveGeneratorConfig,
+    SaveServer,
+    SaveServerClient,
+    SaveServerError,
+    SFSaveSerializer,
+    generate_save,
+    parse_save_file,
+    write_save_file,
+)
+from sat_sav_parse.server import PARSED_SIZE_FACTOR
+
+
+def write_duplicate_names(path: pathlib.Path) -> str:
+    # renames the first persistent level object after the first sublevel object
+    generate_save(path, SaveGeneratorConfig(seed=3, actors=10, sublevels=1))
+    header, body = parse_save_file(path)
+    name = body.sublevels[0].objects[0].header.instance_name
+    old_name = body.persistent_level.objects[0].header.instance_name
+    for obj_header in (*body.persistent_level.object_headers, body.persistent_level.objects[0].header):
+        if obj_header.instance_name == old_name:
+            obj_header.instance_name = name
+    write_save_file(path, header, SFSaveSerializer.get(body))
+    return name
+
+
+def test_save_server(tmp_path: pathlib.Path):
+    header = generate_save(tmp_path / "a.sav", SaveGeneratorConfig(seed=1, actors=10, sublevels=1))
+    generate_save(tmp_path / "b.sav", SaveGeneratorConfig(seed=2, actors=10, sublevels=1))
+    (tmp_path / "broken.sav").write_bytes(b"\x00" * 64)
+
+    server = SaveServer(("127.0.0.1", 0), cache=SaveCache(max_bytes=1), root=tmp_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = SaveServerClient(server.url)
+        assert client.header("a.sav") == header
+        counts = client.type_counts("a.sav")
+        assert sum(counts.values()) == 20
+        export = client.export("a.sav")
+        name = export["persistent_level"]["objects"][0]["header"]["instance_name"]
+        assert client.object("a.sav", name)["header"]["instance_name"] == name
+        assert client.cache_stats()["misses"] == 1
+
+        # the budget only fits one save, so loading b evicts a
+        client.header("b.sav")
+        assert client.cache_stats()["entries"] == [str(tmp_path / "b.sav")]
+
+        name = write_duplicate_names(tmp_path / "dup.sav")
+        assert sum(client.type_counts("dup.sav").values()) == 20
+        assert (
+            client.object("dup.sav", name, "Sublevel_0")["properties"]
+            != client.object("dup.sav", name, "")["properties"]
+        )
+        with pytest.raises(SaveServerError) as exc_info:
+            client.object("dup.sav", name)
+        assert exc_info.value.status == 409
+
+        with pytest.raises(SaveServerError) as exc_info:
+            client.object("b.sav", "Missing")
+        assert exc_info.value.status == 404
+        with pytest.raises(SaveServerError) as exc_info:
+            client.header("../outside.sav")
+        assert exc_info.value.status == 403
+        with pytest.raises(SaveServerError) as exc_info:
+            client.header("broken.sav")
+        assert exc_info.value.status == 422
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_save_cache_weighs_parsed_size(tmp_path: pathlib.Path):
+    paths = [tmp_path / "a.sav", tmp_path / "b.sav"]
+    for seed, path in enumerate(paths):
+        generate_save(path, SaveGeneratorConfig(seed=seed, actors=10, sublevels=1))
+    first, second = (SaveCache().get(path) for path in paths)
+    assert first.memory == first.body_size * PARSED_SIZE_FACTOR
+
+    # both bodies fit in the budget, but not both parsed saves
+    cache = SaveCache(max_bytes=first.memory + 2 * second.body_size)
+    cache.get(paths[0])
+    assert cache.size == first.memory
+    cache.get(paths[1])
+    assert (len(cache), cache.size) == (1, second.memory)
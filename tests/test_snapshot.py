@@ -0,0 +1,148 @@
+import pathlib
+
+from sat_sav_parse import (
+    ActorHeader,
+    ActorObject,
+    ComponentHeader,
+    ComponentObject,
+    FloatProperty,
+    GridName,
+    IntProperty,
+    KeyTypeName,
+    Level,
+    LevelGroupingGrid,
+    MapProperty,
+    ObjectReference,
+    Quaternion,
+    SaveFileBody,
+    SaveFileHeader,
+    StrProperty,
+    ValueTypeName,
+    Vector3,
+    load_snapshot,
+    write_snapshot,
+)
+from sat_sav_parse.snapshot import SNAPSHOT_MAGIC
+
+
+def make_level(sublevel_name: str | None, count: int) -> Level:
+    headers = []
+    objects = []
+    for i in range(count):
+        actor = ActorHeader(
+            type_path="/Game/Build_Foundation.Build_Foundation_C",
+            root_object="Persistent_Level",
+            instance_name=f"Persistent_Level:PersistentLevel.Build_Foundation_C_{i}",
+            unknown=0,
+            rotation=Quaternion(x=0, y=0, z=0, w=1),
+            position=Vector3(x=i, y=2 * i, z=0.5),
+            scale=Vector3(x=1, y=1, z=1),
+            need_transform=True,
+            was_placed_in_level=False,
+        )
+        component = ComponentHeader(
+            type_path="/Script/FactoryGame.FGPowerConnectionComponent",
+            root_object="Persistent_Level",
+            instance_name=f"{actor.instance_name}.PowerConnection",
+            unknown=0,
+            parent_actor_name=actor.instance_name,
+        )
+        headers += [actor, component]
+        objects.append(
+            ActorObject(
+                header=actor,
+                save_version=52,
+                flag=0,
+                size=0,
+                parent_object_reference=ObjectReference(level_name="", path_name=""),
+                components=[ObjectReference(level_name="Persistent_Level", path_name=component.instance_name)],
+                properties=[
+                    IntProperty(name="mCount", payload_size=4, index=0, payload=i),
+                    StrProperty(name="mLabel", payload_size=8, index=0, payload=f"Iron {i}"),
+                    FloatProperty(name="mRate", payload_size=4, index=0, payload=float("inf")),
+                    MapProperty(
+                        name="mCells",
+                        payload_size=0,
+                        index=0,
+                        key_type=KeyTypeName.STRUCT,
+                        value_type=ValueTypeName.INT,
+                        mode=0,
+                        elements_count=2,
+                        payload={(i, 0, -1): 1, (0, i, 2): 2},
+                    ),
+                    MapProperty(
+                        name="mCounts",
+                        payload_size=0,
+                        index=0,
+                        key_type=KeyTypeName.INT,
+                        value_type=ValueTypeName.STR,
+                        mode=0,
+                        elements_count=1,
+                        payload={i: "x"},
+                    ),
+                ],
+                trailing=b"\x01\x02",
+            ),
+        )
+        objects.append(ComponentObject(header=component, save_version=52, flag=0, size=0, properties=[], trailing=b""))
+    return Level(
+        sublevel_name=sublevel_name,
+        object_header_and_collectables_size=0,
+        object_headers=headers,
+        extra_level_names_count=None if sublevel_name else 0,
+        extra_level_names=None,
+        collectables=[],
+        objects_size=0,
+        objects=objects,
+        save_version=52,
+        second_collectables=[ObjectReference(level_name="Persistent_Level", path_name="Col_1")],
+    )
+
+
+def test_snapshot_round_trip(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    body = SaveFileBody(
+        unknown_1=7,
+        unknown_2=9,
+        grids=[LevelGroupingGrid(grid_name=name, unknown_1=1, unknown_2=2, levels=[]) for name in list(GridName)[:5]],
+        sublevels=[make_level("Sub_0", 2)],
+        persistent_level=make_level(None, 3),
+        references=[ObjectReference(level_name="Persistent_Level", path_name="R")],
+    )
+
+    path = tmp_path / "save.sav.snap"
+    write_snapshot(path, 1234, save_header, body)
+    snapshot = load_snapshot(path)
+    assert snapshot is not None
+    assert snapshot.matches(1234, save_header.checksum)
+    assert not snapshot.matches(1235, save_header.checksum)
+    assert snapshot.header == save_header
+
+    level = snapshot.persistent_level
+    assert len(level) == 6
+    assert level.object(4) == body.persistent_level.objects[4]
+    assert snapshot.body == body
+    assert snapshot.body.model_dump_json() == body.model_dump_json()
+
+
+def test_snapshot_unreadable(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    assert load_snapshot(tmp_path / "missing.snap") is None
+    path = tmp_path / "broken.snap"
+    path.write_bytes(b"not a snapshot")
+    assert load_snapshot(path) is None
+
+    body = SaveFileBody(
+        unknown_1=0,
+        unknown_2=0,
+        grids=[LevelGroupingGrid(grid_name=name, unknown_1=1, unknown_2=2, levels=[]) for name in list(GridName)[:5]],
+        sublevels=[],
+        persistent_level=make_level(None, 1),
+        references=[],
+    )
+    path = tmp_path / "stale.snap"
+    write_snapshot(path, 1, save_header, body)
+    assert load_snapshot(path) is not None
+    # written for other model schemas
+    data = bytearray(path.read_bytes())
+    data[len(SNAPSHOT_MAGIC)] ^= 0xFF
+    path.write_bytes(data)
+    assert load_snapshot(path) is None
@@ -0,0 +1,58 @@
+import pathlib
+import sqlite3
+
+from sat_sav_parse import (
+    ActorObject,
+    ArrayElementInterface,
+    ArrayElementObject,
+    ArrayProperty,
+    ObjectProperty,
+    SaveGeneratorConfig,
+    SoftObjectProperty,
+    generate_save,
+    parse_save_file,
+)
+from sat_sav_parse.export import export_sqlite
+from sat_sav_parse.export.sqlite import SCALAR_PROPERTIES
+
+
+def test_export_sqlite(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=8, actors=40, sublevels=2, components_per_actor=2))
+    _, body = parse_save_file(path)
+    levels = (*body.sublevels, body.persistent_level)
+    objects = [obj for level in levels for obj in level.objects]
+    properties = [prop for obj in objects for prop in obj.properties]
+    refs = sum(
+        len(obj.components) + bool(obj.parent_object_reference.path_name)
+        for obj in objects
+        if isinstance(obj, ActorObject)
+    )
+    for prop in properties:
+        match prop:
+            case ObjectProperty() | SoftObjectProperty():
+                refs += 1
+            case ArrayProperty(payload=ArrayElementObject() | ArrayElementInterface() as elements):
+                refs += len(elements.elements)
+    expected = {
+        "saves": 1,
+        "levels": len(levels),
+        "objects": len(objects),
+        "properties": sum(isinstance(prop, SCALAR_PROPERTIES) for prop in properties),
+        "refs": refs,
+    }
+
+    db_path = tmp_path / "save.sqlite"
+    # the second export appends a second copy of every row, with new object ids
+    for copies in (1, 2):
+        assert export_sqlite(path, db_path, batch_size=7) == len(objects)
+        with sqlite3.connect(db_path) as conn:
+            counts = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in expected}  # noqa: S608
+            assert counts == {table: count * copies for table, count in expected.items()}
+            for save_id in range(1, copies + 1):
+                (save_objects,) = conn.execute(
+                    "SELECT COUNT(*) FROM objects JOIN levels ON levels.id = objects.level_id WHERE save_id = ?",
+                    (save_id,),
+                ).fetchone()
+                assert save_objects == len(objects)
+        conn.close()
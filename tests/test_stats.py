@@ -0,0 +1,31 @@
+import collections
+import pathlib
+
+from sat_sav_parse import ActorObject, SaveGeneratorConfig, generate_save, parse_save_file, read_save_stats
+
+
+def test_read_save_stats(tmp_path: pathlib.Path):
+    path = tmp_path / "save.sav"
+    generate_save(path, SaveGeneratorConfig(seed=3, actors=40, sublevels=2, components_per_actor=2))
+    stats = read_save_stats(path)
+
+    _, body = parse_save_file(path)
+    levels = [*body.sublevels, body.persistent_level]
+    objects = [obj for level in levels for obj in level.objects]
+    assert stats.objects == len(objects) == 120
+    assert stats.bytes == sum(obj.size for obj in objects)
+    assert [level.sublevel_name for level in stats.levels] == [level.sublevel_name for level in levels]
+    assert [level.objects for level in stats.levels] == [len(level.objects) for level in levels]
+    assert [level.collectables for level in stats.levels] == [
+        len(level.collectables) + len(level.second_collectables) for level in levels
+    ]
+    assert sum(level.references for level in stats.levels) == sum(
+        len(obj.components) + (obj.parent_object_reference.path_name != "")
+        for obj in objects
+        if isinstance(obj, ActorObject)
+    )
+    assert stats.references == len(body.references)
+
+    counts = collections.Counter(obj.header.type_path for obj in objects)
+    assert {type_stats.type_path: type_stats.objects for type_stats in stats.types} == counts
+    assert [type_stats.objects for type_stats in stats.types] == sorted(counts.values(), reverse=True)
@@ -1,8 +1,10 @@
+import pydantic
 import pytest
 
 from sat_sav_parse.exceptions import ParseError
-from sat_sav_parse.structs import SFSaveDeserializer
-from sat_sav_parse.utils import expect_size
+from sat_sav_parse.models.properties import PropertyTypeName
+from sat_sav_parse.structs import SFSaveDeserializer, SFSaveSerializer
+from sat_sav_parse.utils import RawBytes, expect_size, parse_str_enum
 
 
 def test_expect_size():
@@ -18,3 +20,27 @@ def test_expect_size():
 
     with pytest.raises(ParseError), expect_size(des, size - 1, "test"):
         des.get_u32()
+
+
+def test_parse_str_enum():
+    content = SFSaveSerializer().add_string("IntProperty").add_string("MapProperty").content
+    offset, value = parse_str_enum(0, content, PropertyTypeName)
+    assert value is PropertyTypeName.INT
+    assert parse_str_enum(offset, content, PropertyTypeName) == (len(content), PropertyTypeName.MAP)
+
+    utf16 = b"\xf4\xff\xff\xff" + "IntProperty".encode("utf-16-le") + b"\x00\x00"
+    assert parse_str_enum(0, utf16, PropertyTypeName) == (len(utf16), PropertyTypeName.INT)
+
+    unknown = SFSaveSerializer().add_string("VeryNewProperty").content
+    with pytest.raises(ValueError, match="VeryNewProperty"):
+        parse_str_enum(0, unknown, PropertyTypeName)
+
+
+def test_raw_bytes_json_round_trip():
+    class Blob(pydantic.BaseModel):
+        data: RawBytes
+
+    blob = Blob(data=b"\x00\x01raw")
+    assert blob.data == b"\x00\x01raw"
+    assert blob.model_dump_json() == '{"data":"AAFyYXc="}'
+    assert Blob.model_validate_json(blob.model_dump_json()) == blob
@@ -0,0 +1,80 @@
+import pathlib
+import zlib
+
+import pytest
+
+from sat_sav_parse import (
+    CSaveFileBody,
+    SaveFileHeader,
+    SFSaveSerializer,
+    open_save_file,
+    read_save_header,
+    update_save_header,
+    write_save_file,
+)
+from sat_sav_parse.const import MAX_CHUNK_SIZE
+
+
+def test_update_save_header(tmp_path: pathlib.Path, save_header: SaveFileHeader):
+    body = bytes(range(256)) * 64
+    path = tmp_path / "save.sav"
+    path.write_bytes(SFSaveSerializer.get(save_header) + body)
+
+    header = update_save_header(path, session_name="a much longer session name", is_cheat=True)
+    assert read_save_header(path) == header
+    assert header.session_name == "a much longer session name"
+    assert header.is_cheat
+    assert header.save_ticks == save_header.save_ticks
+    assert path.read_bytes() == SFSaveSerializer.get(header) + body
+    assert list(tmp_path.iterdir()) == [path]
+
+    original = path.read_bytes()
+    with pytest.raises(TypeError, match="sesion_name"):
+        update_save_header(path, sesion_name="typo")
+    assert path.read_bytes() == original
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_save_file_reuses_chunks(
+    tmp_path: pathlib.Path,
+    save_header: SaveFileHeader,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    body = bytes(range(256)) * (MAX_CHUNK_SIZE * 3 // 256)
+    path = tmp_path / "save.sav"
+    write_save_file(path, save_header, body)
+    with open_save_file(path) as (header, des):
+        assert header == save_header
+        assert des.content[:] == body
+
+    compress_calls = []
+    compress = zlib.compress
+    monkeypatch.setattr(zlib, "compress", lambda data: compress_calls.append(data) or compress(data))
+    edited = bytearray(body)
+    edited[MAX_CHUNK_SIZE + 5] = 0
+    write_save_file(path, save_header, edited, original_path=path)
+    assert len(compress_calls) == 1
+    with open_save_file(path) as (_, des):
+        assert des.content[:] == edited
+
+
+def test_reuse_chunks_repeatable(
+    tmp_path: pathlib.Path,
+    save_header: SaveFileHeader,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    body = bytes(range(256)) * (MAX_CHUNK_SIZE * 2 // 256)
+    path = tmp_path / "save.sav"
+    write_save_file(path, save_header, body)
+    header_size = len(SFSaveSerializer.get(save_header))
+
+    compress_calls = []
+    compress = zlib.compress
+    monkeypatch.setattr(zlib, "compress", lambda data: compress_calls.append(data) or compress(data))
+    with path.open("rb") as fp:
+        edited = CSaveFileBody(body).reuse_chunks(CSaveFileBody.iter_chunk_records(fp, header_size))
+    # the lazy iterator was read once, so both serializations reuse every chunk
+    first = SFSaveSerializer.get(edited)
+    assert SFSaveSerializer.get(edited) == first
+    assert compress_calls == []
+    assert first == path.read_bytes()[header_size:]